@@ -22,13 +22,21 @@ Usage:
         print(cred.said, cred.issuer)
 """
 
+import operator
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from dataclasses import dataclass, field
-from typing import Any, Iterator, Optional, TYPE_CHECKING
+from typing import Any, Callable, Iterable, Iterator, Optional, TYPE_CHECKING
 
 from hio.help import Deck
 
 from kgql.parser import KGQLParser, KGQLQuery
-from kgql.translator import QueryPlanner, ExecutionPlan, MethodType
+from kgql.parser.ast import EdgeOperator
+from kgql.translator import QueryPlanner, ExecutionPlan, MethodType, Catalog, ResultShape
+from kgql.translator.planner import PlanStep
 from kgql.wrappers import RegerWrapper, VerifierWrapper
 from kgql.governance.resolver import FrameworkResolver
 from kgql.governance.checker import ConstraintChecker
@@ -39,7 +47,231 @@ if TYPE_CHECKING:
     from keri.vdr.verifying import Verifier, Regery
 
 
-@dataclass
+# Query strings used by the convenience methods that still go through the
+# query pipeline. Kept as constants so that repeated calls hit the compiled
+# plan cache with an identical key.
+_Q_VERIFY = "VERIFY $said"
+
+# WHERE comparator -> comparison function, resolved once per compiled filter
+_COMPARATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "LIKE": lambda actual, expected: expected in str(actual),
+    "CONTAINS": lambda actual, expected: (
+        expected in actual if hasattr(actual, '__contains__') else False
+    ),
+    "IN": lambda actual, expected: (
+        actual in expected if hasattr(expected, '__contains__') else False
+    ),
+}
+
+
+# Credential field -> Reger index keyed by that field's value
+_FIELD_INDEXES = {"issuer": "issus", "subject": "subjs", "schema": "schms"}
+
+# Largest index key whose SAIDs are collected into a set to filter seeks
+_INDEX_FILTER_MAX_ROWS = 10_000
+
+# Governance frameworks whose ConstraintChecker is kept between queries
+_CHECKER_CACHE_SIZE = 64
+
+
+def _result_rows(step_results: dict, plan: ExecutionPlan) -> Iterator[tuple]:
+    """
+    Yield (said, data, proof) rows from every step output, lazily.
+
+    Each output is read according to its step's declared ResultShape, so
+    no per-item type probing is needed.
+    """
+    shapes = {step.result_key: step.result_shape for step in plan.steps if step.result_key}
+    include_proof = plan.include_proof
+    for key, value in step_results.items():
+        if value is None:
+            continue
+        shape = shapes.get(key)
+        if shape is ResultShape.SAIDS:
+            for said in value:
+                yield said, None, None
+        elif shape is ResultShape.PAIRS:
+            # Proofs are only carried when the plan asked for them; otherwise
+            # the step emitted bare creders (see _execute_sources).
+            if include_proof:
+                for creder, proof in value:
+                    yield (
+                        creder.said if hasattr(creder, 'said') else str(creder),
+                        {"creder": creder},
+                        proof,
+                    )
+            else:
+                for creder in value:
+                    yield (
+                        creder.said if hasattr(creder, 'said') else str(creder),
+                        {"creder": creder},
+                        None,
+                    )
+        elif shape is ResultShape.CRED:
+            yield value.said, ({"raw": value.raw} if hasattr(value, 'raw') else None), None
+
+
+def _run_step(
+    handler: Optional[Callable],
+    step: PlanStep,
+    ctx: "_ExecutionContext",
+    materialize: bool = True,
+) -> Any:
+    """
+    Run one plan step; its args were bound by ExecutionPlan.bind.
+
+    On worker threads (materialize=True) lazy SAID iterators are drained
+    so the store reads happen on the worker, not in _build_result.
+    """
+    if handler is None:
+        return None
+    result = handler(step, step.args, ctx)
+    if materialize and step.result_shape is ResultShape.SAIDS and result is not None:
+        return list(result)
+    return result
+
+
+# ACDC edge paths: edges live in "e"; the target SAID of an edge is its "d"
+_DELEGATOR_EDGE = ("e", "delegator")
+_SESSION_EDGE_SAID = ("e", "session", "d")
+
+
+def _dig(data: Any, path: tuple) -> Any:
+    """Follow a key path through nested dicts; None if a hop is missing or not a dict."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _is_variable(value: Any) -> bool:
+    """True for a "$name" variable reference in plan args."""
+    return type(value) is str and bool(value) and value[0] == "$"
+
+
+def _never(actual: Any, expected: Any) -> bool:
+    """Comparator used for unknown operators."""
+    return False
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a filter spec into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _field_accessor(cred: Any, field_name: str) -> Callable[[Any], Any]:
+    """
+    Choose how to read a filter field from credentials shaped like ``cred``.
+
+    Real attributes (issuer, schema, ...) are read directly; anything
+    else is looked up in the credential's attribute data.
+    """
+    if hasattr(cred, field_name):
+        return operator.attrgetter(field_name)
+    return lambda c: c.data.get(field_name)
+
+
+def _credential_data_reader(cred: Any) -> Callable[[Any], Any]:
+    """
+    Choose how to read the raw credential dict from values shaped like ``cred``.
+
+    Creders expose it as ``raw`` (or ``crd`` on older serders); plain dicts
+    are the data itself. Anything else reads as None.
+    """
+    if hasattr(cred, "raw"):
+        return operator.attrgetter("raw")
+    if hasattr(cred, "crd"):
+        return operator.attrgetter("crd")
+    if isinstance(cred, dict):
+        return lambda c: c
+    return lambda c: None
+
+
+def _compile_filter(filter_dict: dict) -> Callable[[Any], bool]:
+    """
+    Compile a filter dict into a single predicate over credentials.
+
+    Comparator lookup happens here, once, instead of for every
+    credential examined by a scan. Field accessors are chosen on the
+    first credential of each type and reused for the rest.
+
+    Args:
+        filter_dict: Mapping of field -> {"op", "value", "negated"}
+
+    Returns:
+        Callable returning True when a credential matches every condition
+    """
+    compiled = [
+        (
+            field_name,
+            _COMPARATORS.get(condition.get("op", "="), _never),
+            condition.get("value"),
+            bool(condition.get("negated", False)),
+        )
+        for field_name, condition in filter_dict.items()
+    ]
+    if len(compiled) == 1:
+        return _compile_condition(*compiled[0])
+
+    by_type: dict[type, list[tuple]] = {}
+
+    def predicate(cred: Any) -> bool:
+        checks = by_type.get(type(cred))
+        if checks is None:
+            checks = by_type[type(cred)] = [
+                (_field_accessor(cred, field_name), compare, expected, negated)
+                for field_name, compare, expected, negated in compiled
+            ]
+        for read, compare, expected, negated in checks:
+            if bool(compare(read(cred), expected)) is negated:
+                return False
+        return True
+
+    return predicate
+
+
+def _compile_condition(
+    field_name: str,
+    compare: Callable[[Any, Any], bool],
+    expected: Any,
+    negated: bool,
+) -> Callable[[Any], bool]:
+    """
+    Specialized predicate for a filter with a single condition.
+
+    Skips the per-credential loop over conditions, and the negation test
+    for the common non-negated case.
+    """
+    by_type: dict[type, Callable[[Any], Any]] = {}
+
+    def accessor(cred: Any) -> Callable[[Any], Any]:
+        read = by_type[type(cred)] = _field_accessor(cred, field_name)
+        return read
+
+    if negated:
+        def predicate(cred: Any) -> bool:
+            read = by_type.get(type(cred)) or accessor(cred)
+            return not compare(read(cred), expected)
+    else:
+        def predicate(cred: Any) -> bool:
+            read = by_type.get(type(cred)) or accessor(cred)
+            return bool(compare(read(cred), expected))
+
+    return predicate
+
+
+@dataclass(slots=True)
 class QueryResultItem:
     """A single item in a query result."""
     said: str
@@ -48,35 +280,140 @@ class QueryResultItem:
     keystate: Optional[Any] = None
 
 
-@dataclass
+def _column(values: list) -> Optional[list]:
+    """Return a result column, or None when every entry is a default."""
+    return values if any(v is not None for v in values) else None
+
+
 class QueryResult:
     """
     Result of a KGQL query execution.
 
     Provides a unified result format for all query types.
+
+    Results built by the executor are stored column-wise (parallel lists of
+    SAIDs, data, proofs and keystates) and QueryResultItem objects are only
+    synthesized when iterated, so callers that just need SAIDs (len,
+    collect_saids) never allocate an item per row. Accessing ``items``
+    materializes the list once; from then on it is the source of truth and
+    may be mutated as before. Equality and repr follow the former
+    dataclass, over the items whichever way they are stored.
     """
-    items: list[QueryResultItem] = field(default_factory=list)
-    count: int = 0
-    has_more: bool = False
-    metadata: dict = field(default_factory=dict)
+    __slots__ = (
+        "_saids", "_data", "_proofs", "_keystates", "_items",
+        "count", "has_more", "metadata",
+    )
+
+    def __init__(
+        self,
+        items: Optional[list[QueryResultItem]] = None,
+        count: int = 0,
+        has_more: bool = False,
+        metadata: Optional[dict] = None,
+    ):
+        self._saids: Optional[list[str]] = None
+        self._data: Optional[list[Optional[dict]]] = None
+        self._proofs: Optional[list[Any]] = None
+        self._keystates: Optional[list[Any]] = None
+        self._items: Optional[list[QueryResultItem]] = items if items is not None else []
+        self.count = count
+        self.has_more = has_more
+        self.metadata = metadata if metadata is not None else {}
+
+    @classmethod
+    def from_columns(
+        cls,
+        saids: list[str],
+        data: Optional[list[Optional[dict]]] = None,
+        proofs: Optional[list[Any]] = None,
+        keystates: Optional[list[Any]] = None,
+        has_more: bool = False,
+    ) -> "QueryResult":
+        """
+        Build a result from parallel columns without creating items.
+
+        Args:
+            saids: Result SAIDs
+            data: Optional per-row data dicts (None entries mean {})
+            proofs: Optional per-row proofs
+            keystates: Optional per-row key states
+            has_more: Whether rows were cut off by LIMIT
+
+        Returns:
+            QueryResult with count set to the number of SAIDs
+        """
+        result = cls(count=len(saids), has_more=has_more)
+        result._items = None
+        result._saids = saids
+        result._data = _column(data) if data else None
+        result._proofs = _column(proofs) if proofs else None
+        result._keystates = _column(keystates) if keystates else None
+        return result
+
+    def _item_at(self, i: int) -> QueryResultItem:
+        """Synthesize the item for row i of a column-wise result."""
+        data = self._data[i] if self._data else None
+        return QueryResultItem(
+            said=self._saids[i],
+            data=data if data is not None else {},
+            proof=self._proofs[i] if self._proofs else None,
+            keystate=self._keystates[i] if self._keystates else None,
+        )
+
+    @property
+    def items(self) -> list[QueryResultItem]:
+        """Result items, materialized on first access."""
+        if self._items is None:
+            self._items = [self._item_at(i) for i in range(len(self._saids))]
+            self._saids = self._data = self._proofs = self._keystates = None
+        return self._items
+
+    @items.setter
+    def items(self, items: list[QueryResultItem]) -> None:
+        self._items = items
+        self._saids = self._data = self._proofs = self._keystates = None
 
     def __iter__(self) -> Iterator[QueryResultItem]:
-        return iter(self.items)
+        if self._items is not None:
+            return iter(self._items)
+        return (self._item_at(i) for i in range(len(self._saids)))
 
     def __len__(self) -> int:
-        return len(self.items)
+        return len(self._items if self._items is not None else self._saids)
 
     def __bool__(self) -> bool:
-        return len(self.items) > 0
+        return len(self) > 0
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.count == other.count
+            and self.has_more == other.has_more
+            and self.metadata == other.metadata
+            and list(self) == list(other)
+        )
+
+    __hash__ = None  # Mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        return (
+            f"QueryResult(items={list(self)!r}, count={self.count!r}, "
+            f"has_more={self.has_more!r}, metadata={self.metadata!r})"
+        )
 
     @property
     def first(self) -> Optional[QueryResultItem]:
         """Get the first result item, or None if empty."""
-        return self.items[0] if self.items else None
+        if self._items is not None:
+            return self._items[0] if self._items else None
+        return self._item_at(0) if self._saids else None
 
     def collect_saids(self) -> list[str]:
         """Collect all SAIDs from the result items."""
-        return [item.said for item in self.items]
+        if self._items is None:
+            return list(self._saids)
+        return [item.said for item in self._items]
 
     def to_json(self, indent: int = 2) -> str:
         """
@@ -99,7 +436,7 @@ class QueryResult:
                     "said": item.said,
                     **{k: v for k, v in item.data.items() if v is not None}
                 }
-                for item in self.items
+                for item in self
             ],
             "count": self.count,
             "has_more": self.has_more,
@@ -107,6 +444,16 @@ class QueryResult:
         }
 
 
+@dataclass
+class _ExecutionContext:
+    """Mutable state shared by the steps of one plan execution."""
+    plan: ExecutionPlan
+    enforce_governance: bool = False
+    step_results: dict = field(default_factory=dict)
+    checker: Optional[ConstraintChecker] = None  # Set by a FRAMEWORK_LOAD step
+    violations: list = field(default_factory=list)  # Collected when not enforcing
+
+
 class KGQL:
     """
     KGQL query interface using existing keripy infrastructure.
@@ -133,6 +480,10 @@ class KGQL:
         rgy: "Regery",
         verifier: Optional["Verifier"] = None,
         framework_resolver: Optional[FrameworkResolver] = None,
+        plan_cache_size: int = 256,
+        resolve_cache_size: int = 4096,
+        max_workers: int = 4,
+        specialize_after: int = 100,
     ):
         """
         Initialize KGQL with keripy instances.
@@ -143,13 +494,22 @@ class KGQL:
             verifier: Optional Verifier instance for chain verification
             framework_resolver: Optional resolver for governance frameworks.
                 If not provided, one is created using the Reger wrapper.
+            plan_cache_size: Maximum number of distinct query strings whose
+                parsed AST and execution plan are kept for reuse (0 disables).
+            resolve_cache_size: Maximum number of credentials kept by the
+                Reger wrapper's SAID resolve cache (0 disables).
+            max_workers: Threads used to run independent plan steps
+                concurrently (0 runs every plan serially).
+            specialize_after: Executions of a query string after which a
+                specialized fast path is built for it, when its shape
+                allows (0 disables). Requires the plan cache.
         """
         self._hby = hby
         self._rgy = rgy
         self._reger = rgy.reger
 
         # Create wrappers for consistent interface
-        self._reger_wrapper = RegerWrapper(self._reger)
+        self._reger_wrapper = RegerWrapper(self._reger, cache_size=resolve_cache_size)
         self._verifier_wrapper = VerifierWrapper(verifier, hby) if verifier else None
 
         # Governance framework resolver
@@ -161,10 +521,74 @@ class KGQL:
         self._parser = KGQLParser()
         self._planner = QueryPlanner()
 
+        # Index cardinality estimates for choosing between access paths
+        self._catalog = Catalog(self._reger_wrapper.count)
+
+        # Independent steps of unlimited plans run on this pool; LMDB reads
+        # release the GIL, so index seeks overlap. The pool is created by
+        # the first parallel-safe plan and shut down by close().
+        self._max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+        # Guards ExecutionPlan.compiled_filters: cached plans are shared by
+        # concurrent queries and by steps running on the pool
+        self._compile_lock = threading.Lock()
+
+        # Step handlers by method type; all take (step, args, ctx)
+        self._dispatch: dict[MethodType, Callable[[PlanStep, dict, _ExecutionContext], Any]] = {
+            MethodType.FRAMEWORK_LOAD: self._execute_framework_load,
+            MethodType.REGER_INDEX: self._execute_index_query,
+            MethodType.REGER_CLONE: self._execute_clone,
+            MethodType.REGER_SOURCES: self._execute_sources,
+            MethodType.VERIFIER_CHAIN: self._execute_verify,
+        }
+
+        # Compiled (ast, plan) pairs keyed by query string, in LRU order
+        self._plan_cache: OrderedDict[str, tuple[KGQLQuery, ExecutionPlan]] = OrderedDict()
+        self._plan_cache_size = plan_cache_size
+
+        # Per-query-string (executions, total ns), and fast paths for hot
+        # query strings; both are dropped when the string leaves the plan cache
+        self._stats: dict[str, tuple[int, int]] = {}
+        self._specialized: dict[str, Callable[[dict], QueryResult]] = {}
+        self._specialize_after = specialize_after
+
+        # ConstraintCheckers by framework SAID, in LRU order. A SAID names
+        # immutable content, so a checker stays valid while the resolver
+        # keeps returning the same framework object for it.
+        self._checkers: OrderedDict[str, ConstraintChecker] = OrderedDict()
+
         # Deck for async query integration with existing Doist
         self.queries = Deck()  # Input: (query_id, query_string, variables)
         self.results = Deck()  # Output: (query_id, QueryResult)
 
+    def _executor(self) -> Optional[ThreadPoolExecutor]:
+        """Return the step pool, creating it on first use (None if disabled)."""
+        if self._pool is None and self._max_workers > 0:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self._max_workers)
+        return self._pool
+
+    def close(self) -> None:
+        """
+        Shut down the step thread pool, if one was started.
+
+        The instance stays usable; a later parallel-safe plan starts a
+        new pool.
+        """
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def __enter__(self) -> "KGQL":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     @property
     def reger(self):
         """Direct access to Reger for advanced queries."""
@@ -212,14 +636,142 @@ class KGQL:
                 enforce_governance=True
             )
         """
-        # Parse the query
-        ast = self._parser.parse(kgql_string, variables)
+        start = time.perf_counter_ns()
+
+        fast_path = self._specialized.get(kgql_string)
+        if fast_path is not None:
+            self._plan_cache.move_to_end(kgql_string)
+            result = fast_path(variables or {})
+        else:
+            # Parse and plan (cached per query string), then bind variables
+            _, plan = self._compile(kgql_string)
+            result = self._execute(
+                plan.bind(variables or {}), enforce_governance=enforce_governance
+            )
+
+        self._record_execution(kgql_string, time.perf_counter_ns() - start)
+        return result
+
+    def _record_execution(self, kgql_string: str, elapsed_ns: int) -> None:
+        """Count an execution and specialize the query once it turns hot."""
+        if kgql_string not in self._plan_cache:
+            return  # Only cached query strings are tracked, keeping stats bounded
+
+        count, total_ns = self._stats.get(kgql_string, (0, 0))
+        count += 1
+        self._stats[kgql_string] = (count, total_ns + elapsed_ns)
+
+        if count == self._specialize_after:
+            _, plan = self._plan_cache[kgql_string]
+            fast_path = self._specialize(plan)
+            if fast_path is not None:
+                self._specialized[kgql_string] = fast_path
+
+    def get_hot_queries(self, limit: int = 10) -> list[tuple[str, int, float]]:
+        """
+        Report the most frequently executed query strings.
+
+        Args:
+            limit: Maximum number of queries to return
+
+        Returns:
+            List of (query string, executions, mean latency in ms), most
+            executed first
+        """
+        ranked = sorted(self._stats.items(), key=lambda kv: kv[1][0], reverse=True)
+        return [
+            (kgql_string, count, total_ns / count / 1e6)
+            for kgql_string, (count, total_ns) in ranked[:limit]
+        ]
+
+    def _specialize(self, plan: ExecutionPlan) -> Optional[Callable[[dict], QueryResult]]:
+        """
+        Build a direct fast path for a single-step index seek or RESOLVE.
+
+        The returned function binds its one variable and calls the Reger
+        wrapper directly, skipping bind/_execute/_build_result. Plans of any
+        other shape (filters, several access paths, governance, multiple
+        steps) return None and keep using the generic executor.
 
-        # Create execution plan
+        Args:
+            plan: Cached, unbound execution plan
+
+        Returns:
+            Function of the variables dict returning a QueryResult, or None
+        """
+        if len(plan.steps) != 1:
+            return None
+        step = plan.steps[0]
+        args = step.args
+
+        if (
+            step.method_type is MethodType.REGER_INDEX
+            and args.get("index") in _FIELD_INDEXES.values()
+            and not args.get("filter")
+            and not args.get("access_paths")
+        ):
+            by_index = self._reger_wrapper.by_index
+            index_name, keys, limit = args["index"], args.get("keys"), plan.limit
+
+            def index_fast_path(variables: dict) -> QueryResult:
+                key = variables.get(keys[1:], keys) if _is_variable(keys) else keys
+                if not key:
+                    return QueryResult.from_columns([])
+                saids = by_index(index_name, key)
+                if not limit:
+                    return QueryResult.from_columns(list(saids))
+                saids = list(islice(saids, limit + 1))
+                has_more = len(saids) > limit
+                return QueryResult.from_columns(saids[:limit], has_more=has_more)
+
+            return index_fast_path
+
+        if step.method_type is MethodType.REGER_CLONE:
+            resolve = self._reger_wrapper.resolve
+            said_arg = args.get("said")
+
+            def resolve_fast_path(variables: dict) -> QueryResult:
+                said = variables.get(said_arg[1:], said_arg) if _is_variable(said_arg) else said_arg
+                cred = resolve(said) if said else None
+                if cred is None:
+                    return QueryResult.from_columns([])
+                data = {"raw": cred.raw} if hasattr(cred, 'raw') else None
+                return QueryResult.from_columns([cred.said], data=[data])
+
+            return resolve_fast_path
+
+        return None
+
+    def _compile(self, kgql_string: str) -> tuple[KGQLQuery, ExecutionPlan]:
+        """
+        Parse and plan a query string, reusing a cached result when possible.
+
+        Plans never embed variable values (those are bound per call with
+        ExecutionPlan.bind), so the same (ast, plan) pair is valid for every set of
+        variable bindings and can be keyed on the raw query string.
+
+        Args:
+            kgql_string: The KGQL query string
+
+        Returns:
+            Tuple of (parsed AST, execution plan)
+        """
+        cached = self._plan_cache.get(kgql_string)
+        if cached is not None:
+            self._plan_cache.move_to_end(kgql_string)
+            return cached
+
+        ast = self._parser.parse(kgql_string)
         plan = self._planner.plan(ast)
 
-        # Execute the plan
-        return self._execute(plan, variables or {}, enforce_governance=enforce_governance)
+        if self._plan_cache_size > 0:
+            self._plan_cache[kgql_string] = (ast, plan)
+            if len(self._plan_cache) > self._plan_cache_size:
+                evicted, _ = self._plan_cache.popitem(last=False)
+                self._stats.pop(evicted, None)
+                self._specialized.pop(evicted, None)
+
+        return ast, plan
 
     def parse(self, kgql_string: str) -> KGQLQuery:
         """
@@ -252,7 +804,6 @@ class KGQL:
     def _execute(
         self,
         plan: ExecutionPlan,
-        variables: dict,
         enforce_governance: bool = False,
     ) -> QueryResult:
         """
@@ -263,40 +814,31 @@ class KGQL:
         attached to the execution context for governance evaluation.
 
         Args:
-            plan: Execution plan from query planner
-            variables: Resolved variable bindings
+            plan: Execution plan with variables already bound
             enforce_governance: If True, raise GovernanceViolation on constraint violations
         """
-        result = QueryResult()
-        step_results = {}
-        checker = None  # Governance constraint checker (if WITHIN FRAMEWORK)
-        governance_violations = []  # Collect violations for metadata if not enforcing
-
-        for idx, step in enumerate(plan.steps):
-            # Resolve variables in step args
-            resolved_args = self._resolve_variables(step.args, variables)
-
-            # Execute step based on method type
-            if step.method_type == MethodType.FRAMEWORK_LOAD:
-                step_result = self._execute_framework_load(resolved_args)
-                if isinstance(step_result, ConstraintChecker):
-                    checker = step_result
-            elif step.method_type == MethodType.REGER_INDEX:
-                step_result = self._execute_index_query(step, resolved_args)
-            elif step.method_type == MethodType.REGER_CLONE:
-                step_result = self._execute_clone(step, resolved_args)
-            elif step.method_type == MethodType.REGER_SOURCES:
-                step_result = self._execute_sources(
-                    step, resolved_args, step_results,
-                    checker=checker,
-                    enforce_governance=enforce_governance,
-                    violations=governance_violations,
-                )
-            elif step.method_type == MethodType.VERIFIER_CHAIN:
-                step_result = self._execute_verify(step, resolved_args)
-            else:
-                step_result = None
+        ctx = _ExecutionContext(plan=plan, enforce_governance=enforce_governance)
+        step_results = ctx.step_results
+        dispatch = self._dispatch
+
+        pool = self._executor() if plan.parallel_safe and not plan.limit else None
+        if pool is not None:
+            # Without a LIMIT every row is read anyway, so independent steps
+            # are fully materialized concurrently rather than streamed
+            futures = [
+                pool.submit(_run_step, dispatch.get(step.method_type), step, ctx)
+                for step in plan.steps
+            ]
+            outputs = zip(plan.steps, (future.result() for future in futures))
+        else:
+            # Serial and lazy: each step runs only after the previous one's
+            # result is stored, so later steps can read it
+            outputs = (
+                (step, _run_step(dispatch.get(step.method_type), step, ctx, materialize=False))
+                for step in plan.steps
+            )
 
+        for step, step_result in outputs:
             # Store result for dependent steps
             if step.result_key:
                 step_results[step.result_key] = step_result
@@ -305,50 +847,113 @@ class KGQL:
         result = self._build_result(step_results, plan)
 
         # Attach governance metadata if framework was loaded
+        checker = ctx.checker
         if checker:
             result.metadata["governance"] = {
                 "framework_said": checker.framework_said,
                 "framework_name": checker.framework.name,
                 "enforced": enforce_governance,
-                "violations": [v.to_dict() for v in governance_violations] if governance_violations else [],
+                "violations": [v.to_dict() for v in ctx.violations] if ctx.violations else [],
             }
 
         return result
 
-    def _resolve_variables(self, args: dict, variables: dict) -> dict:
-        """Resolve $variable references in arguments."""
-        resolved = {}
-        for key, value in args.items():
-            if isinstance(value, str) and value.startswith("$"):
-                var_name = value[1:]
-                resolved[key] = variables.get(var_name, value)
-            else:
-                resolved[key] = value
-        return resolved
+    def _execute_index_query(
+        self,
+        step: PlanStep,
+        args: dict,
+        ctx: _ExecutionContext,
+    ) -> Iterator[str]:
+        """
+        Execute a Reger index query.
+
+        When the planner offered several access paths, the one with the
+        lowest cardinality estimate from the Catalog is used.
+
+        Index seeks first narrow their SAIDs by set membership against the
+        other indexes named in the residual filter, then apply whatever
+        conditions remain to the resolved credentials.
+
+        Returns a lazy iterator of SAIDs: nothing is read from the store
+        until _build_result pulls rows, and it stops pulling one row past
+        ``plan.limit``.
+        """
+        plan = ctx.plan
+        if args.get("access_paths"):
+            # Paths keyed by an empty value or an unbound $variable cannot
+            # be seeked, so they are never estimated or chosen
+            paths = [
+                path for path in args["access_paths"]
+                if path["keys"] and not _is_variable(path["keys"])
+            ]
+            if paths:
+                args = self._catalog.pick_best(paths)
 
-    def _execute_index_query(self, step, args: dict) -> list:
-        """Execute a Reger index query."""
         index_name = args.get("index", "creds")
         keys = args.get("keys")
-
-        if index_name == "issus" and keys:
-            return list(self._reger_wrapper.by_issuer(keys))
-        elif index_name == "subjs" and keys:
-            return list(self._reger_wrapper.by_subject(keys))
-        elif index_name == "schms" and keys:
-            return list(self._reger_wrapper.by_schema(keys))
+        filter_dict = args.get("filter")
+
+        if index_name in _FIELD_INDEXES.values() and keys:
+            saids = self._reger_wrapper.by_index(index_name, keys)
+            if filter_dict:
+                saids, filter_dict = self._apply_index_filters(saids, filter_dict)
+            matches = self._filter_predicate(filter_dict, plan)
+            if matches is None:
+                return iter(saids)
+            resolve = self._reger_wrapper.resolve
+            return (
+                said for said in saids
+                if (cred := resolve(said)) is not None and matches(cred)
+            )
         elif index_name == "creds":
             # Full scan - expensive but sometimes necessary
-            results = []
-            filter_dict = args.get("filter", {})
-            for said, _ in self._reger.creds.getItemIter():
-                if self._matches_filter(said, filter_dict):
-                    results.append(said)
-            return results
+            matches = self._filter_predicate(filter_dict, plan)
+            return (
+                cred.said for cred in self._reger_wrapper.iter_creds()
+                if matches is None or matches(cred)
+            )
+
+        return iter(())
+
+    def _apply_index_filters(self, saids: Iterable[str], filter_dict: dict) -> tuple:
+        """
+        Evaluate indexed equality conditions as SAID set membership.
+
+        A condition like ``schema = X`` on the results of an issuer seek
+        can be answered from the schms index alone, without loading any
+        credential: collect the SAIDs under X once and keep only candidates
+        in that set. Indexes with more than _INDEX_FILTER_MAX_ROWS entries
+        under the key are left to the per-credential filter instead.
+
+        Args:
+            saids: Candidate SAIDs from the index seek
+            filter_dict: Residual filter from the plan
 
-        return []
+        Returns:
+            Tuple of (narrowed SAIDs iterable, remaining filter dict)
+        """
+        residual = {}
+        for field_name, condition in filter_dict.items():
+            index_name = _FIELD_INDEXES.get(field_name)
+            value = condition.get("value")
+            if (
+                index_name
+                and condition.get("op", "=") == "="
+                and not condition.get("negated", False)
+                and isinstance(value, str)
+                and value
+                and not _is_variable(value)
+                and self._catalog.estimate(
+                    index_name, value, _INDEX_FILTER_MAX_ROWS + 1
+                ) <= _INDEX_FILTER_MAX_ROWS
+            ):
+                allowed = set(self._reger_wrapper.by_index(index_name, value))
+                saids = filter(allowed.__contains__, saids)
+            else:
+                residual[field_name] = condition
+        return saids, residual
 
-    def _execute_clone(self, step, args: dict) -> Optional[Any]:
+    def _execute_clone(self, step: PlanStep, args: dict, ctx: _ExecutionContext) -> Optional[Any]:
         """Execute a credential clone/resolve."""
         said = args.get("said")
         if not said:
@@ -358,50 +963,68 @@ class KGQL:
 
     def _execute_sources(
         self,
-        step,
+        step: PlanStep,
         args: dict,
-        prior_results: dict,
-        checker: Optional[ConstraintChecker] = None,
-        enforce_governance: bool = False,
-        violations: Optional[list] = None,
+        ctx: _ExecutionContext,
     ) -> list:
         """
         Execute a sources traversal with optional governance checking.
 
-        When a ConstraintChecker is provided and enforce_governance=True,
-        each edge traversal is checked against framework rules. If a rule
-        is violated, GovernanceViolation is raised.
+        When a framework's ConstraintChecker is on the context and
+        enforce_governance=True, each edge traversal is checked against
+        framework rules. If a rule is violated, GovernanceViolation is
+        raised; otherwise violations are collected on the context.
+
+        Only emits (creder, proof) pairs when the plan requested proofs
+        (WITH PROOF); otherwise bare creders, so proofs are never carried.
 
         Args:
             step: Execution step
             args: Resolved arguments
-            prior_results: Results from prior steps
-            checker: Optional ConstraintChecker for governance enforcement
-            enforce_governance: Whether to raise on violations
-            violations: List to collect violations when not enforcing
+            ctx: Execution context (prior step results, checker, violations)
         """
-        from keri_governance.primitives import EdgeOperator
+        checker = ctx.checker
+        include_proof = ctx.plan.include_proof
 
         # Get starting credential from prior step
-        start_cred = prior_results.get("start_cred")
+        start_cred = ctx.step_results.get("start_cred")
         if not start_cred:
             return []
 
         results = []
         edge_type = args.get("edge_type", "edge")
 
+        # Edges the framework has no rules for always pass; skip operator
+        # extraction and checking for the whole traversal
+        if checker and not checker.framework.get_rules_for(edge_type):
+            checker = None
+
+        # For a loaded framework the verdict depends only on (edge_type,
+        # operator), and edge_type is fixed for this traversal, so each
+        # distinct operator is checked once rather than once per edge
+        verdicts: dict = {}
+        # Credential data readers, chosen on the first creder of each type
+        readers: dict[type, Callable[[Any], Any]] = {}
+
         for creder, proof in self._reger_wrapper.traverse_sources(
             self._hby.db, start_cred.said
         ):
             # Check governance constraints if checker is active
             if checker:
                 # Extract edge operator from credential (default to ANY if not specified)
-                actual_operator = self._extract_edge_operator(creder, edge_type)
+                read = readers.get(type(creder))
+                if read is None:
+                    read = readers[type(creder)] = _credential_data_reader(creder)
+                actual_operator = self._extract_edge_operator(creder, edge_type, read)
 
-                check_result = checker.check_edge(edge_type, actual_operator)
+                check_result = verdicts.get(actual_operator)
+                if check_result is None:
+                    check_result = verdicts[actual_operator] = checker.check_edge(
+                        edge_type, actual_operator
+                    )
 
                 if not check_result.allowed:
-                    if enforce_governance:
+                    if ctx.enforce_governance:
                         # Raise immediately on violation
                         raise GovernanceViolation.from_check_result(
                             check_result,
@@ -409,51 +1032,45 @@ class KGQL:
                             target_said=creder.said if hasattr(creder, 'said') else str(creder),
                             query_context=f"TRAVERSE edge '{edge_type}'",
                         )
-                    elif violations is not None:
+                    else:
                         # Collect for metadata when not enforcing
-                        violations.extend(check_result.violations)
+                        ctx.violations.extend(check_result.violations)
 
-            results.append((creder, proof))
+            results.append((creder, proof) if include_proof else creder)
 
         return results
 
-    def _extract_edge_operator(self, creder, edge_type: str) -> "EdgeOperator":
+    def _extract_edge_operator(
+        self,
+        creder,
+        edge_type: str,
+        read_data: Optional[Callable[[Any], Any]] = None,
+    ) -> EdgeOperator:
         """
         Extract edge operator from a credential's edge section.
 
         Args:
             creder: Credential object
             edge_type: The edge type to look up
+            read_data: Reader for the credential dict, from
+                _credential_data_reader(); chosen from ``creder`` if omitted
 
         Returns:
             EdgeOperator found, or ANY if not specified
         """
-        from keri_governance.primitives import EdgeOperator
-
-        # Get credential data
-        if hasattr(creder, 'raw'):
-            cred_data = creder.raw
-        elif hasattr(creder, 'crd'):
-            cred_data = creder.crd
-        elif isinstance(creder, dict):
-            cred_data = creder
-        else:
-            return EdgeOperator.ANY
+        if read_data is None:
+            read_data = _credential_data_reader(creder)
 
         # Look in edges section
-        edges = cred_data.get("e", {})
-        if isinstance(edges, dict):
-            edge_info = edges.get(edge_type, {})
-            if isinstance(edge_info, dict):
-                op_str = edge_info.get("o", "ANY")
-                try:
-                    return EdgeOperator(op_str)
-                except (ValueError, KeyError):
-                    return EdgeOperator.ANY
-
-        return EdgeOperator.ANY
+        op_str = _dig(read_data(creder), ("e", edge_type, "o"))
+        if op_str is None:
+            return EdgeOperator.ANY
+        try:
+            return EdgeOperator(op_str)
+        except (ValueError, KeyError):
+            return EdgeOperator.ANY
 
-    def _execute_verify(self, step, args: dict) -> Optional[Any]:
+    def _execute_verify(self, step: PlanStep, args: dict, ctx: _ExecutionContext) -> Optional[Any]:
         """Execute chain verification."""
         if not self._verifier_wrapper:
             return None
@@ -468,12 +1085,22 @@ class KGQL:
             operator=args.get("operator")
         )
 
-    def _execute_framework_load(self, args: dict) -> Optional[ConstraintChecker]:
+    def _execute_framework_load(
+        self,
+        step: PlanStep,
+        args: dict,
+        ctx: _ExecutionContext,
+    ) -> Optional[ConstraintChecker]:
         """
         Load a governance framework and return a ConstraintChecker.
 
+        The checker is also attached to the context so later steps
+        evaluate edges against the framework.
+
         Args:
+            step: Execution step
             args: Must contain 'framework_said'
+            ctx: Execution context
 
         Returns:
             ConstraintChecker if framework resolves, None otherwise
@@ -486,85 +1113,69 @@ class KGQL:
         if not framework:
             return None
 
-        return ConstraintChecker(framework)
+        checker = self._checkers.get(framework_said)
+        if checker is None or checker.framework is not framework:
+            checker = ConstraintChecker(framework)
+            self._checkers[framework_said] = checker
+            if len(self._checkers) > _CHECKER_CACHE_SIZE:
+                self._checkers.popitem(last=False)
+        else:
+            self._checkers.move_to_end(framework_said)
 
-    def _matches_filter(self, said: str, filter_dict: dict) -> bool:
-        """Check if a credential matches filter conditions."""
-        if not filter_dict:
-            return True
+        ctx.checker = checker
+        return checker
 
-        cred = self._reger_wrapper.resolve(said)
-        if not cred:
-            return False
-
-        for field, condition in filter_dict.items():
-            actual_value = getattr(cred, field, cred.data.get(field))
-            expected_value = condition.get("value")
-            op = condition.get("op", "=")
-            negated = condition.get("negated", False)
-
-            matches = self._compare(actual_value, op, expected_value)
-            if negated:
-                matches = not matches
-            if not matches:
-                return False
+    def _filter_predicate(
+        self,
+        filter_dict: Optional[dict],
+        plan: Optional[ExecutionPlan] = None,
+    ) -> Optional[Callable[[Any], bool]]:
+        """
+        Get the compiled predicate for a filter dict.
 
-        return True
+        Predicates are cached on the plan, so a cached plan compiles each
+        of its filters only once, even when steps run on worker threads.
 
-    def _compare(self, actual: Any, op: str, expected: Any) -> bool:
-        """Compare values based on operator."""
-        if op == "=":
-            return actual == expected
-        elif op == "!=":
-            return actual != expected
-        elif op == "<":
-            return actual < expected
-        elif op == ">":
-            return actual > expected
-        elif op == "<=":
-            return actual <= expected
-        elif op == ">=":
-            return actual >= expected
-        elif op == "LIKE":
-            return expected in str(actual)
-        elif op == "CONTAINS":
-            return expected in actual if hasattr(actual, '__contains__') else False
-        elif op == "IN":
-            return actual in expected if hasattr(expected, '__contains__') else False
-        return False
+        Returns:
+            Predicate callable, or None when there is nothing to filter
+        """
+        if not filter_dict:
+            return None
+
+        if plan is None:
+            return _compile_filter(filter_dict)
+
+        key = _freeze(filter_dict)
+        with self._compile_lock:
+            predicate = plan.compiled_filters.get(key)
+            if predicate is None:
+                predicate = plan.compiled_filters[key] = _compile_filter(filter_dict)
+        return predicate
 
     def _build_result(self, step_results: dict, plan: ExecutionPlan) -> QueryResult:
         """Build the final QueryResult from step results."""
-        result = QueryResult()
-
-        # Collect all SAIDs from index queries
-        for key, value in step_results.items():
-            if isinstance(value, list):
-                for item in value:
-                    if isinstance(item, str):  # SAID
-                        result.items.append(QueryResultItem(said=item))
-                    elif isinstance(item, tuple):  # (creder, proof)
-                        creder, proof = item
-                        result.items.append(QueryResultItem(
-                            said=creder.said if hasattr(creder, 'said') else str(creder),
-                            data={"creder": creder},
-                            proof=proof if plan.include_proof else None
-                        ))
-            elif hasattr(value, 'said'):  # CredentialResult or similar
-                result.items.append(QueryResultItem(
-                    said=value.said,
-                    data={"raw": value.raw} if hasattr(value, 'raw') else {}
-                ))
+        # Step outputs may be lazy iterators; pull at most one row past
+        # LIMIT to detect has_more.
+        rows = _result_rows(step_results, plan)
+        if plan.limit:
+            rows = islice(rows, plan.limit + 1)
+        rows = list(rows)
 
         # Apply limit
-        if plan.limit and len(result.items) > plan.limit:
-            result.has_more = True
-            result.items = result.items[:plan.limit]
+        has_more = False
+        if plan.limit and len(rows) > plan.limit:
+            has_more = True
+            del rows[plan.limit:]
 
-        result.count = len(result.items)
-        return result
+        if not rows:
+            return QueryResult.from_columns([])
+        saids, data, proofs = (list(column) for column in zip(*rows))
+        return QueryResult.from_columns(saids, data=data, proofs=proofs, has_more=has_more)
 
-    # Convenience methods that map to common KGQL patterns
+    # Convenience methods that map to common KGQL patterns.
+    # The index lookups and RESOLVE are the hottest query shapes (the chain
+    # walkers resolve on every hop), so they call the Reger wrapper directly
+    # instead of going through parse -> plan -> execute -> build.
 
     def by_issuer(self, aid: str) -> QueryResult:
         """
@@ -572,10 +1183,9 @@ class KGQL:
 
         Equivalent to: MATCH (c:Credential) WHERE c.issuer = $aid
         """
-        return self.query(
-            "MATCH (c:Credential) WHERE c.issuer = $aid",
-            variables={"aid": aid}
-        )
+        if not aid:
+            return QueryResult()
+        return self._saids_result(self._reger_wrapper.by_issuer(aid))
 
     def by_subject(self, aid: str) -> QueryResult:
         """
@@ -583,10 +1193,19 @@ class KGQL:
 
         Equivalent to: MATCH (c:Credential) WHERE c.subject = $aid
         """
-        return self.query(
-            "MATCH (c:Credential) WHERE c.subject = $aid",
-            variables={"aid": aid}
-        )
+        if not aid:
+            return QueryResult()
+        return self._saids_result(self._reger_wrapper.by_subject(aid))
+
+    def by_schema(self, schema_said: str) -> QueryResult:
+        """
+        Get credentials by schema SAID.
+
+        Equivalent to: MATCH (c:Credential) WHERE c.schema = $schema
+        """
+        if not schema_said:
+            return QueryResult()
+        return self._saids_result(self._reger_wrapper.by_schema(schema_said))
 
     def resolve(self, said: str) -> Optional[QueryResultItem]:
         """
@@ -594,8 +1213,17 @@ class KGQL:
 
         Equivalent to: RESOLVE $said
         """
-        result = self.query("RESOLVE $said", variables={"said": said})
-        return result.first
+        if not said:
+            return None
+        cred = self._reger_wrapper.resolve(said)
+        if cred is None:
+            return None
+        return QueryResultItem(said=cred.said, data={"raw": cred.raw})
+
+    @staticmethod
+    def _saids_result(saids) -> QueryResult:
+        """Build an unlimited QueryResult from an iterable of SAIDs."""
+        return QueryResult.from_columns(list(saids))
 
     def verify(self, said: str) -> QueryResult:
         """
@@ -603,7 +1231,7 @@ class KGQL:
 
         Equivalent to: VERIFY $said
         """
-        return self.query("VERIFY $said", variables={"said": said})
+        return self.query(_Q_VERIFY, variables={"said": said})
 
     def traverse(self, from_said: str, edge_type: str = "edge") -> QueryResult:
         """
@@ -633,19 +1261,33 @@ class KGQL:
         Returns:
             QueryResult with delegation chain information
         """
-        result = QueryResult()
-
         # Resolve session credential
         session_item = self.resolve(session_cred_said)
         if not session_item:
+            result = QueryResult()
             result.metadata = {"error": "Session credential not found"}
             return result
 
+        return self._traverse_delegator_edge(session_item)
+
+    def _traverse_delegator_edge(self, session_item: QueryResultItem) -> QueryResult:
+        """
+        Follow an already-resolved session credential's delegator edge.
+
+        Shared by traverse_delegator and verify_end_to_end_chain so the
+        session credential is only resolved once per chain walk.
+
+        Args:
+            session_item: The resolved session credential
+
+        Returns:
+            QueryResult with delegation chain information
+        """
+        result = QueryResult()
+
         # Get delegator edge using EdgeResolver pattern
         # ACDC edges are in "e" field with nested messages; target SAID is in "d" field
-        cred_data = session_item.data
-        edges = cred_data.get("e", {}) if isinstance(cred_data, dict) else {}
-        delegator = edges.get("delegator", {})
+        delegator = _dig(session_item.data, _DELEGATOR_EDGE) or {}
 
         # In ACDC edge structure:
         # - "d" contains the SAID of the target (e.g., delegation event SAID)
@@ -677,17 +1319,14 @@ class KGQL:
             # If we have a KEL event SAID, try to find it in master's events
             found_event = None
             if kel_event_said:
-                # Search master's KEL for the anchoring event
-                # In keripy, we iterate through interaction events
+                # Events are keyed by (prefix, digest) and the event SAID is
+                # its digest, so look the anchoring event up directly
                 try:
-                    for pre, dig in self._hby.db.getKelIter(master_pre):
-                        # Load event
-                        evt = self._hby.db.getEvt(pre, dig)
-                        if evt and hasattr(evt, 'said') and evt.said == kel_event_said:
-                            found_event = evt
-                            break
+                    evt = self._hby.db.getEvt(master_pre, kel_event_said)
+                    if evt and getattr(evt, 'said', kel_event_said) == kel_event_said:
+                        found_event = evt
                 except Exception as e:
-                    # KEL iteration may not be supported in all keripy versions
+                    # Direct event lookup may not be supported in all keripy versions
                     pass
 
             # Build result
@@ -739,15 +1378,12 @@ class KGQL:
         chain.append({
             "type": "turn",
             "said": turn_said,
-            "issuer": turn_item.data.get("issuer") if isinstance(turn_item.data, dict) else None,
+            "issuer": _dig(turn_item.data, ("issuer",)),
         })
 
         # Step 2: Traverse to session
         # ACDC edges are in "e" field; target SAID is in "d" field of nested message
-        turn_data = turn_item.data if isinstance(turn_item.data, dict) else {}
-        turn_edges = turn_data.get("e", {})
-        session_edge = turn_edges.get("session", {})
-        session_said = session_edge.get("d")  # Target SAID in "d" field
+        session_said = _dig(turn_item.data, _SESSION_EDGE_SAID)
 
         if not session_said:
             result.metadata = {
@@ -772,7 +1408,7 @@ class KGQL:
         })
 
         # Step 3: Traverse delegator edge to master KEL
-        delegator_result = self.traverse_delegator(session_said)
+        delegator_result = self._traverse_delegator_edge(session_item)
 
         if not delegator_result.first:
             result.metadata = {
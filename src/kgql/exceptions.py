@@ -5,7 +5,10 @@ KGQL Exceptions.
 Custom exceptions for KGQL query execution and governance enforcement.
 """
 
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -28,7 +31,7 @@ class QueryExecutionError(KGQLError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class GovernanceViolationDetail:
     """
     Details of a single governance rule violation.
@@ -47,16 +50,13 @@ class GovernanceViolationDetail:
 
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
-        return {
-            "rule_name": self.rule_name,
-            "message": self.message,
-            "edge_type": self.edge_type,
-            "operator_found": self.operator_found,
-            "operator_required": self.operator_required,
-            "source_said": self.source_said,
-            "target_said": self.target_said,
-            "framework_said": self.framework_said,
-        }
+        return dict(zip(_DETAIL_FIELDS, _DETAIL_GETTER(self)))
+
+
+# Field names and a single C-level getter for all of them, so to_dict()
+# fetches every field in one call; kept in sync with the dataclass.
+_DETAIL_FIELDS = tuple(f.name for f in fields(GovernanceViolationDetail))
+_DETAIL_GETTER = attrgetter(*_DETAIL_FIELDS)
 
 
 class GovernanceViolation(KGQLError):
@@ -125,17 +125,20 @@ class GovernanceViolation(KGQLError):
         Returns:
             GovernanceViolation exception ready to raise
         """
+        framework_said = check_result.framework_said
         violations = []
         for cv in check_result.violations:
+            actual = cv.actual_operator
+            required = cv.required_operator
             violations.append(GovernanceViolationDetail(
                 rule_name=cv.rule_name,
                 message=cv.message,
                 edge_type=cv.edge_type,
-                operator_found=cv.actual_operator.value if cv.actual_operator else "",
-                operator_required=cv.required_operator.value if cv.required_operator else "",
+                operator_found=actual.value if actual is not None else "",
+                operator_required=required.value if required is not None else "",
                 source_said=source_said,
                 target_said=target_said,
-                framework_said=check_result.framework_said,
+                framework_said=framework_said,
             ))
 
         # Build summary message
@@ -147,7 +150,7 @@ class GovernanceViolation(KGQLError):
         return cls(
             message=summary,
             violations=violations,
-            framework_said=check_result.framework_said,
+            framework_said=framework_said,
             query_context=query_context,
         )
 
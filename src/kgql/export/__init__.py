@@ -37,9 +37,15 @@ from kgql.export.property_graph import (
     export_property_graph_json,
     load_property_graph_json,
 )
-from kgql.export.rdf import export_rdf, export_rdf_ntriples
+from kgql.export.rdf import (
+    export_rdf,
+    export_rdf_ntriples,
+    export_rdf_to,
+    export_rdf_ntriples_to,
+)
 from kgql.export.visualization import (
     export_mermaid,
+    export_mermaid_to,
     export_mermaid_subgraph,
     export_mermaid_sequence,
 )
@@ -65,7 +71,10 @@ __all__ = [
     "load_property_graph_json",
     "export_rdf",
     "export_rdf_ntriples",
+    "export_rdf_to",
+    "export_rdf_ntriples_to",
     "export_mermaid",
+    "export_mermaid_to",
     "export_mermaid_subgraph",
     "export_mermaid_sequence",
     # Format constants
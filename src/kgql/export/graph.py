@@ -16,9 +16,20 @@ Key principle: "Resolution IS Verification" — extracted edges from ACDC
 credentials are already verified by virtue of the credentials existing.
 """
 
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from enum import Enum
-from typing import Any, Optional, TYPE_CHECKING
+from typing import IO, Any, Iterable, Iterator, Optional, TYPE_CHECKING
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
 
 if TYPE_CHECKING:
     from kgql.api.kgql import QueryResult, QueryResultItem
@@ -51,20 +62,59 @@ class EdgeKind(str, Enum):
     WATCHER = "watcher"         # Watcher attestation
 
 
-@dataclass(frozen=True)
+# Plain-string values of each NodeType, looked up once instead of going
+# through the Enum .value property on every serialized node.
+_NODE_TYPE_VALUES: dict["NodeType", str] = {t: t.value for t in NodeType}
+
+# Edge types come from a small vocabulary; interning makes every edge of a
+# type share one string object instead of one copy per credential.
+_intern = sys.intern
+
+# Optional fields serialized by to_dict(): included when truthy, or when
+# not None for the numeric KEL metadata where 0 is meaningful.
+_NODE_OPTIONAL_FIELDS = ("issuer", "schema", "label", "issued_at", "revoked_at", "registry")
+_NODE_OPTIONAL_NONE = ("key_state_seq", "delegation_depth")
+
+
+def _key_order(sample: dict, short: str, long: str) -> tuple[str, str]:
+    """Order a field's compact and long-form keys by which one sample uses."""
+    if short not in sample and long in sample:
+        return long, short
+    return short, long
+
+
+def _write_lines(fp: IO[str], lines: Iterable[str]) -> None:
+    """
+    Write lines to a text stream separated by newlines.
+
+    Produces exactly "\n".join(lines) without building the joined string,
+    so exporters can stream large documents in constant memory.
+    """
+    write = fp.write
+    sep = ""
+    for line in lines:
+        write(sep)
+        write(line)
+        sep = "\n"
+
+
+@dataclass(frozen=True, slots=True)
 class GraphNode:
     """
     A node in the property graph.
 
     Represents a credential, AID, schema, or governance framework.
-    Frozen for hashability and immutable graph semantics.
+    Frozen for hashability and immutable graph semantics; attributes are
+    held as a plain dict and excluded from the hash, so the credential's
+    'a' map is stored once rather than converted on every export.
 
     Attributes:
         said: Self-Addressing Identifier (primary key)
         node_type: Type classification (credential, identifier, etc.)
         issuer: AID of issuer (for credentials)
         schema: Schema SAID (for credentials)
-        attributes: Credential attributes from 'a' field
+        attributes: Credential attributes from 'a' field (key/value pairs
+            are accepted and converted to a dict)
         label: Human-readable label for visualization
         key_state_seq: KEL sequence number (KEL metadata)
         delegation_depth: Delegation chain depth (KEL metadata)
@@ -76,7 +126,7 @@ class GraphNode:
     node_type: NodeType
     issuer: str = ""
     schema: str = ""
-    attributes: tuple = field(default_factory=tuple)  # Frozen-compatible
+    attributes: dict = field(default_factory=dict, hash=False)
     label: str = ""
     # KEL metadata
     key_state_seq: Optional[int] = None
@@ -86,34 +136,28 @@ class GraphNode:
     revoked_at: Optional[str] = None
     registry: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        """Accept attributes as key/value pairs for backward compatibility."""
+        if type(self.attributes) is not dict:
+            object.__setattr__(self, "attributes", dict(self.attributes))
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
-        result = {
-            "said": self.said,
-            "type": self.node_type.value,
-        }
-        if self.issuer:
-            result["issuer"] = self.issuer
-        if self.schema:
-            result["schema"] = self.schema
+        result = {"said": self.said, "type": _NODE_TYPE_VALUES[self.node_type]}
+        for name in _NODE_OPTIONAL_FIELDS:
+            value = getattr(self, name)
+            if value:
+                result[name] = value
+        for name in _NODE_OPTIONAL_NONE:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = value
         if self.attributes:
-            result["attributes"] = dict(self.attributes)
-        if self.label:
-            result["label"] = self.label
-        if self.key_state_seq is not None:
-            result["key_state_seq"] = self.key_state_seq
-        if self.delegation_depth is not None:
-            result["delegation_depth"] = self.delegation_depth
-        if self.issued_at:
-            result["issued_at"] = self.issued_at
-        if self.revoked_at:
-            result["revoked_at"] = self.revoked_at
-        if self.registry:
-            result["registry"] = self.registry
+            result["attributes"] = self.attributes
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GraphEdge:
     """
     An edge in the property graph.
@@ -126,14 +170,20 @@ class GraphEdge:
         edge_type: Edge key from ACDC 'e' field (e.g., "acdc", "delegator")
         operator: Constraint operator (I2I, DI2I, NI2I, ANY)
         weight: Optional numeric weight for analytics
-        metadata: Additional edge properties as frozen tuple of pairs
+        metadata: Additional edge properties (dict, excluded from the hash;
+            key/value pairs are accepted and converted)
     """
     source_said: str
     target_said: str
     edge_type: str
     operator: str = "ANY"  # I2I, DI2I, NI2I, ANY
     weight: Optional[float] = None
-    metadata: tuple = field(default_factory=tuple)  # Frozen-compatible
+    metadata: dict = field(default_factory=dict, hash=False)
+
+    def __post_init__(self) -> None:
+        """Accept metadata as key/value pairs for backward compatibility."""
+        if type(self.metadata) is not dict:
+            object.__setattr__(self, "metadata", dict(self.metadata))
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -143,14 +193,21 @@ class GraphEdge:
             "type": self.edge_type,
             "operator": self.operator,
         }
+        if self.weight is None and not self.metadata:
+            return result
         if self.weight is not None:
             result["weight"] = self.weight
         if self.metadata:
-            result["metadata"] = dict(self.metadata)
+            result["metadata"] = self.metadata
         return result
 
 
-@dataclass
+# GraphNode fields in declaration order, and a getter returning them as a row
+NODE_COLUMNS = tuple(f.name for f in fields(GraphNode))
+_node_row = attrgetter(*NODE_COLUMNS)
+
+
+@dataclass(slots=True)
 class PropertyGraph:
     """
     Common intermediate representation for graph export.
@@ -163,10 +220,30 @@ class PropertyGraph:
         nodes: Dict mapping SAID → GraphNode
         edges: List of GraphEdge relationships
         metadata: Framework info, query metadata, etc.
+
+    Edges are also indexed by source and target SAID so adjacency lookups
+    do not scan the edge list; add edges through add_edge() to keep the
+    indexes current.
     """
     nodes: dict[str, GraphNode] = field(default_factory=dict)
     edges: list[GraphEdge] = field(default_factory=list)
     metadata: dict = field(default_factory=dict)
+    _out_index: dict[str, list[GraphEdge]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _in_index: dict[str, list[GraphEdge]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index edges supplied at construction."""
+        for edge in self.edges:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: GraphEdge) -> None:
+        """Record an edge in the source and target adjacency indexes."""
+        self._out_index.setdefault(edge.source_said, []).append(edge)
+        self._in_index.setdefault(edge.target_said, []).append(edge)
 
     def add_node(self, node: GraphNode) -> None:
         """
@@ -189,6 +266,52 @@ class PropertyGraph:
             edge: GraphEdge to add
         """
         self.edges.append(edge)
+        self._index_edge(edge)
+
+    def add_nodes(self, nodes: Iterable[GraphNode]) -> None:
+        """
+        Add many nodes at once.
+
+        Equivalent to calling add_node() for each, without the per-node
+        method call.
+
+        Args:
+            nodes: GraphNodes to add; later SAIDs replace earlier ones
+        """
+        self.nodes.update((node.said, node) for node in nodes)
+
+    def node_columns(self) -> dict[str, list]:
+        """
+        Column-wise view of the nodes for exporters.
+
+        One list per GraphNode field (NODE_COLUMNS), all in node order, so
+        exporters can zip the fields they need instead of reading every
+        attribute off every node. Built from the current nodes on each call,
+        since ``nodes`` may be edited directly.
+
+        Returns:
+            Dict mapping field name to its column
+        """
+        rows = zip(*map(_node_row, self.nodes.values()))
+        columns = {name: list(col) for name, col in zip(NODE_COLUMNS, rows)}
+        if not columns:
+            columns = {name: [] for name in NODE_COLUMNS}
+        return columns
+
+    def add_edges(self, edges: Iterable[GraphEdge]) -> None:
+        """
+        Add many edges at once, keeping the adjacency indexes current.
+
+        Args:
+            edges: GraphEdges to add (duplicates allowed)
+        """
+        edges = list(edges)
+        self.edges.extend(edges)
+        out_index = self._out_index
+        in_index = self._in_index
+        for edge in edges:
+            out_index.setdefault(edge.source_said, []).append(edge)
+            in_index.setdefault(edge.target_said, []).append(edge)
 
     def node_count(self) -> int:
         """Return number of nodes in the graph."""
@@ -208,11 +331,11 @@ class PropertyGraph:
 
     def get_edges_from(self, source_said: str) -> list[GraphEdge]:
         """Get all edges originating from a node."""
-        return [e for e in self.edges if e.source_said == source_said]
+        return list(self._out_index.get(source_said, ()))
 
     def get_edges_to(self, target_said: str) -> list[GraphEdge]:
         """Get all edges pointing to a node."""
-        return [e for e in self.edges if e.target_said == target_said]
+        return list(self._in_index.get(target_said, ()))
 
     @classmethod
     def from_query_result(
@@ -234,53 +357,76 @@ class PropertyGraph:
         Returns:
             PropertyGraph with nodes and edges
         """
-        graph = cls()
+        # Accumulate locally and assign once; avoids a method call per item
+        nodes: dict[str, GraphNode] = {}
+        edges: list[GraphEdge] = []
+        metadata: dict = {}
+
+        # Referenced SAIDs in first-seen order (dicts as ordered sets);
+        # implicit nodes are only built for those no result item supplies.
+        targets: dict[str, str] = {}  # target SAID -> first referencing edge type
+        issuers: dict[str, None] = {}
+        schemas: dict[str, None] = {}
 
         # Copy query metadata
         if result.metadata:
-            graph.metadata["query"] = result.metadata
-
-        # Process each result item
-        for item in result.items:
-            # Create node from result item
-            node = cls._item_to_node(item)
-            graph.add_node(node)
+            metadata["query"] = result.metadata
+
+        # Issuer/schema keys: compact ACDC ("i"/"s") or long-form names.
+        # The first credential decides which to try first; the other is
+        # only consulted when that lookup comes back empty.
+        issuer_keys = schema_keys = None
+
+        # Pass 1: real nodes from result items, plus everything they reference
+        for item in result:
+            # A SAID is a digest of the credential, so a repeated SAID (same
+            # credential in several bindings) carries nothing new
+            if item.said in nodes:
+                continue
+            nodes[item.said] = cls._item_to_node(item)
 
-            # Extract edges from credential data
             cred_data = item.data
             if isinstance(cred_data, dict):
-                edges = cls._extract_edges(item.said, cred_data, edge_resolver)
-                for edge in edges:
-                    graph.add_edge(edge)
-
-                    # Create implicit target node if not already in graph
-                    if not graph.has_node(edge.target_said):
-                        implicit_node = GraphNode(
-                            said=edge.target_said,
-                            node_type=NodeType.CREDENTIAL,  # Default, may be wrong
-                            label=f"Referenced by {edge.edge_type}",
-                        )
-                        graph.add_node(implicit_node)
-
-                # Create implicit issuer node
-                issuer = cred_data.get("i") or cred_data.get("issuer")
-                if issuer and not graph.has_node(issuer):
-                    graph.add_node(GraphNode(
-                        said=issuer,
-                        node_type=NodeType.IDENTIFIER,
-                        label="Issuer AID",
-                    ))
-
-                # Create implicit schema node
-                schema = cred_data.get("s") or cred_data.get("schema")
-                if schema and not graph.has_node(schema):
-                    graph.add_node(GraphNode(
-                        said=schema,
-                        node_type=NodeType.SCHEMA,
-                        label="Schema",
-                    ))
-
-        return graph
+                for edge in cls._extract_edges(item.said, cred_data, edge_resolver):
+                    edges.append(edge)
+                    targets.setdefault(edge.target_said, edge.edge_type)
+
+                if issuer_keys is None:
+                    issuer_keys = _key_order(cred_data, "i", "issuer")
+                    schema_keys = _key_order(cred_data, "s", "schema")
+
+                issuer = cred_data.get(issuer_keys[0]) or cred_data.get(issuer_keys[1])
+                if issuer:
+                    issuers[issuer] = None
+
+                schema = cred_data.get(schema_keys[0]) or cred_data.get(schema_keys[1])
+                if schema:
+                    schemas[schema] = None
+
+        # Pass 2: implicit nodes for referenced SAIDs not in the result set
+        for said, edge_type in targets.items():
+            if said not in nodes:
+                nodes[said] = GraphNode(
+                    said=said,
+                    node_type=NodeType.CREDENTIAL,  # Default, may be wrong
+                    label=f"Referenced by {edge_type}",
+                )
+        for said in issuers:
+            if said not in nodes:
+                nodes[said] = GraphNode(
+                    said=said,
+                    node_type=NodeType.IDENTIFIER,
+                    label="Issuer AID",
+                )
+        for said in schemas:
+            if said not in nodes:
+                nodes[said] = GraphNode(
+                    said=said,
+                    node_type=NodeType.SCHEMA,
+                    label="Schema",
+                )
+
+        return cls(nodes=nodes, edges=edges, metadata=metadata)
 
     @classmethod
     def from_verified_path(cls, path: "VerifiedPath") -> "PropertyGraph":
@@ -295,42 +441,34 @@ class PropertyGraph:
         Returns:
             PropertyGraph representing the trust path
         """
-        graph = cls()
-        graph.metadata["path"] = {
-            "root": path.root_said,
-            "target": path.target_said,
-            "depth": path.depth,
+        metadata = {
+            "path": {
+                "root": path.root_said,
+                "target": path.target_said,
+                "depth": path.depth,
+            },
         }
-
-        # Track SAIDs we've seen for node creation
-        seen_saids: set[str] = set()
+        nodes: dict[str, GraphNode] = {}
+        edges: list[GraphEdge] = []
+        # Operator -> serialized string; paths use only a few distinct operators
+        op_strings: dict[Any, str] = {}
 
         for step in path.steps:
-            # Add source node if not seen
-            if step.source_said not in seen_saids:
-                graph.add_node(GraphNode(
-                    said=step.source_said,
-                    node_type=NodeType.CREDENTIAL,
-                ))
-                seen_saids.add(step.source_said)
-
-            # Add target node if not seen
-            if step.target_said not in seen_saids:
-                graph.add_node(GraphNode(
-                    said=step.target_said,
-                    node_type=NodeType.CREDENTIAL,
-                ))
-                seen_saids.add(step.target_said)
-
-            # Add edge
-            graph.add_edge(GraphEdge(
-                source_said=step.source_said,
-                target_said=step.target_said,
-                edge_type=step.edge_type,
-                operator=step.operator.value if hasattr(step.operator, 'value') else str(step.operator),
-            ))
-
-        return graph
+            source, target, op = step.source_said, step.target_said, step.operator
+
+            # Add source and target nodes if not seen
+            if source not in nodes:
+                nodes[source] = GraphNode(said=source, node_type=NodeType.CREDENTIAL)
+            if target not in nodes:
+                nodes[target] = GraphNode(said=target, node_type=NodeType.CREDENTIAL)
+
+            op_str = op_strings.get(op)
+            if op_str is None:
+                op_str = op_strings[op] = op.value if hasattr(op, 'value') else str(op)
+
+            edges.append(GraphEdge(source, target, _intern(step.edge_type), op_str))
+
+        return cls(nodes=nodes, edges=edges, metadata=metadata)
 
     @classmethod
     def from_credentials(
@@ -350,7 +488,8 @@ class PropertyGraph:
         Returns:
             PropertyGraph with nodes and edges
         """
-        graph = cls()
+        nodes: dict[str, GraphNode] = {}
+        edges: list[GraphEdge] = []
 
         for cred in credentials:
             said = cred.get("d")
@@ -358,28 +497,26 @@ class PropertyGraph:
                 continue
 
             # Create node
-            node = GraphNode(
+            nodes[said] = GraphNode(
                 said=said,
                 node_type=NodeType.CREDENTIAL,
                 issuer=cred.get("i", ""),
                 schema=cred.get("s", ""),
-                attributes=tuple((cred.get("a") or {}).items()),
+                attributes=cred.get("a") or {},
             )
-            graph.add_node(node)
 
             # Extract edges
-            edges = cls._extract_edges(said, cred, edge_resolver)
-            for edge in edges:
-                graph.add_edge(edge)
+            for edge in cls._extract_edges(said, cred, edge_resolver):
+                edges.append(edge)
 
                 # Create implicit target node
-                if not graph.has_node(edge.target_said):
-                    graph.add_node(GraphNode(
+                if edge.target_said not in nodes:
+                    nodes[edge.target_said] = GraphNode(
                         said=edge.target_said,
                         node_type=NodeType.CREDENTIAL,
-                    ))
+                    )
 
-        return graph
+        return cls(nodes=nodes, edges=edges)
 
     @staticmethod
     def _item_to_node(item: "QueryResultItem") -> GraphNode:
@@ -405,7 +542,7 @@ class PropertyGraph:
             node_type=node_type,
             issuer=data.get("i", ""),
             schema=data.get("s", ""),
-            attributes=tuple(attrs.items()),
+            attributes=attrs,
             # KEL metadata from keystate if available
             key_state_seq=getattr(item.keystate, 'sn', None) if item.keystate else None,
         )
@@ -421,55 +558,107 @@ class PropertyGraph:
 
         Uses ACDCEdgeResolver if provided, otherwise parses 'e' field directly.
         """
-        edges: list[GraphEdge] = []
         edge_field = cred_data.get("e", {})
 
         if not isinstance(edge_field, dict):
-            return edges
+            return []
 
         if edge_resolver:
             # Use resolver for proper edge extraction
-            edge_keys = edge_resolver.list_edges(cred_data)
-            for key in edge_keys:
-                edge_ref = edge_resolver.get_edge(cred_data, key)
-                if edge_ref and edge_ref.target_said:
-                    metadata = edge_ref.metadata or {}
-                    edges.append(GraphEdge(
-                        source_said=source_said,
-                        target_said=edge_ref.target_said,
-                        edge_type=edge_ref.edge_type,
-                        operator=metadata.get("operator", "ANY"),
-                        metadata=tuple(metadata.items()),
-                    ))
-        else:
-            # Direct extraction from 'e' field
-            for key, nested in edge_field.items():
-                if not isinstance(nested, dict):
-                    continue
-                target_said = nested.get("d")
-                if not target_said:
-                    continue
-
-                # Extract operator if present (from 'o' field)
-                operator = nested.get("o", "ANY")
-
-                edges.append(GraphEdge(
-                    source_said=source_said,
-                    target_said=target_said,
-                    edge_type=key,
-                    operator=operator,
-                ))
-
-        return edges
+            return [
+                GraphEdge(
+                    source_said,
+                    ref.target_said,
+                    ref.edge_type,
+                    (ref.metadata or {}).get("operator", "ANY"),
+                    ref.metadata or {},
+                )
+                for key in edge_resolver.list_edges(cred_data)
+                if (ref := edge_resolver.get_edge(cred_data, key)) and ref.target_said
+            ]
+
+        # Direct extraction from 'e' field; edge blocks are plain dicts
+        # from JSON, so an exact type check suffices. Operator comes from
+        # the 'o' field when present.
+        return [
+            GraphEdge(source_said, nested["d"], _intern(key), nested.get("o", "ANY"))
+            for key, nested in edge_field.items()
+            if type(nested) is dict and nested.get("d")
+        ]
+
+    def iter_node_dicts(self) -> Iterator[dict]:
+        """Yield each node's serialized dict, one at a time."""
+        for node in self.nodes.values():
+            yield node.to_dict()
+
+    def iter_edge_dicts(self) -> Iterator[dict]:
+        """Yield each edge's serialized dict, one at a time."""
+        for edge in self.edges:
+            yield edge.to_dict()
 
     def to_dict(self) -> dict:
         """Convert graph to dictionary for JSON serialization."""
         return {
-            "nodes": [node.to_dict() for node in self.nodes.values()],
-            "edges": [edge.to_dict() for edge in self.edges],
+            "nodes": list(self.iter_node_dicts()),
+            "edges": list(self.iter_edge_dicts()),
             "metadata": self.metadata,
             "stats": {
                 "node_count": self.node_count(),
                 "edge_count": self.edge_count(),
             },
         }
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encode the graph as compact UTF-8 JSON.
+
+        Uses msgspec's C encoder when installed (the "fast" extra), which is
+        much quicker than the stdlib for large exports. Values msgspec
+        refuses (integers wider than 64 bits on older releases, types it
+        does not know) fall back to json.dumps with the same compact
+        separators, as does every call when msgspec is absent.
+
+        The output is equivalent JSON, not byte-identical, across the two
+        encoders: float spelling can differ (1e+16 vs 1e16), and NaN or
+        Infinity encode as null under msgspec but as the non-standard NaN
+        and Infinity tokens under json.dumps. Use to_dict() with json for
+        a stable byte stream.
+
+        Returns:
+            JSON document equivalent to to_dict()
+        """
+        data = self.to_dict()
+        if HAS_MSGSPEC:
+            try:
+                return msgspec.json.encode(data)
+            except (OverflowError, TypeError, msgspec.EncodeError):
+                pass
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def iter_json(self) -> Iterator[str]:
+        """
+        Serialize the graph as JSON incrementally.
+
+        Yields the same document as json.dumps(self.to_dict()), one node or
+        edge at a time, so large graphs can be written to a file or socket
+        without first building the full node and edge lists.
+
+        Yields:
+            Consecutive chunks of the JSON document
+        """
+        dumps = json.dumps
+        yield '{"nodes": ['
+        sep = ""
+        for node_dict in self.iter_node_dicts():
+            yield sep + dumps(node_dict)
+            sep = ", "
+        yield '], "edges": ['
+        sep = ""
+        for edge_dict in self.iter_edge_dicts():
+            yield sep + dumps(edge_dict)
+            sep = ", "
+        yield '], "metadata": ' + dumps(self.metadata)
+        yield ', "stats": ' + dumps({
+            "node_count": self.node_count(),
+            "edge_count": self.edge_count(),
+        }) + "}"
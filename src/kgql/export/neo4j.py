@@ -178,7 +178,7 @@ def _node_to_cypher(
 
     # Include attributes as nested properties
     if node.attributes:
-        for key, value in node.attributes:
+        for key, value in node.attributes.items():
             props[f"attr_{key}"] = value
 
     props_cypher = _props_to_cypher(props)
@@ -207,7 +207,7 @@ def _edge_to_cypher(
     if edge.weight is not None:
         props["weight"] = edge.weight
     if edge.metadata:
-        for key, value in edge.metadata:
+        for key, value in edge.metadata.items():
             props[key] = value
 
     props_cypher = _props_to_cypher(props)
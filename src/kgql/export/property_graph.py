@@ -28,7 +28,10 @@ This format is compatible with:
 import json
 from typing import Optional
 
-from kgql.export.graph import PropertyGraph, GraphNode, GraphEdge
+from kgql.export.graph import PropertyGraph, GraphNode, GraphEdge, NodeType, _NODE_TYPE_VALUES
+
+# Shared read-only stand-in for a missing "properties" object on load
+_NO_PROPERTIES: dict = {}
 
 
 def export_property_graph(graph: PropertyGraph) -> dict:
@@ -49,8 +52,24 @@ def export_property_graph(graph: PropertyGraph) -> dict:
             "metadata": {...}
         }
     """
+    # Nodes are emitted straight from the graph's columns rather than by
+    # reading every attribute off every GraphNode
+    cols = graph.node_columns()
+    type_values = _NODE_TYPE_VALUES
+    nodes = [
+        {"id": said, "type": type_values[node_type], "properties": _node_properties(*props)}
+        for said, node_type, props in zip(
+            cols["said"], cols["node_type"],
+            zip(
+                cols["issuer"], cols["schema"], cols["attributes"], cols["label"],
+                cols["key_state_seq"], cols["delegation_depth"],
+                cols["issued_at"], cols["revoked_at"], cols["registry"],
+            ),
+        )
+    ]
+
     return {
-        "nodes": [_node_to_property_graph(node) for node in graph.nodes.values()],
+        "nodes": nodes,
         "edges": [_edge_to_property_graph(edge) for edge in graph.edges],
         "metadata": graph.metadata,
     }
@@ -75,51 +94,43 @@ def export_property_graph_json(
     Returns:
         JSON string representation
     """
-    data = export_property_graph(graph)
-    return json.dumps(data, indent=indent, sort_keys=sort_keys)
-
-
-def _node_to_property_graph(node: GraphNode) -> dict:
-    """
-    Convert GraphNode to property graph node dict.
-
-    Format:
-        {
-            "id": "<said>",
-            "type": "<node_type>",
-            "properties": {
-                "issuer": "...",
-                "schema": "...",
-                ...
-            }
-        }
-    """
+    return json.dumps(export_property_graph(graph), indent=indent, sort_keys=sort_keys)
+
+
+def _node_properties(
+    issuer: str,
+    schema: str,
+    attributes: dict,
+    label: str,
+    key_state_seq: Optional[int],
+    delegation_depth: Optional[int],
+    issued_at: Optional[str],
+    revoked_at: Optional[str],
+    registry: Optional[str],
+) -> dict:
+    """Build a node's properties dict, omitting empty fields."""
     properties = {}
 
-    if node.issuer:
-        properties["issuer"] = node.issuer
-    if node.schema:
-        properties["schema"] = node.schema
-    if node.attributes:
-        properties["attributes"] = dict(node.attributes)
-    if node.label:
-        properties["label"] = node.label
-    if node.key_state_seq is not None:
-        properties["key_state_seq"] = node.key_state_seq
-    if node.delegation_depth is not None:
-        properties["delegation_depth"] = node.delegation_depth
-    if node.issued_at:
-        properties["issued_at"] = node.issued_at
-    if node.revoked_at:
-        properties["revoked_at"] = node.revoked_at
-    if node.registry:
-        properties["registry"] = node.registry
-
-    return {
-        "id": node.said,
-        "type": node.node_type.value,
-        "properties": properties,
-    }
+    if issuer:
+        properties["issuer"] = issuer
+    if schema:
+        properties["schema"] = schema
+    if attributes:
+        properties["attributes"] = attributes
+    if label:
+        properties["label"] = label
+    if key_state_seq is not None:
+        properties["key_state_seq"] = key_state_seq
+    if delegation_depth is not None:
+        properties["delegation_depth"] = delegation_depth
+    if issued_at:
+        properties["issued_at"] = issued_at
+    if revoked_at:
+        properties["revoked_at"] = revoked_at
+    if registry:
+        properties["registry"] = registry
+
+    return properties
 
 
 def _edge_to_property_graph(edge: GraphEdge) -> dict:
@@ -144,7 +155,7 @@ def _edge_to_property_graph(edge: GraphEdge) -> dict:
     if edge.weight is not None:
         properties["weight"] = edge.weight
     if edge.metadata:
-        properties["metadata"] = dict(edge.metadata)
+        properties["metadata"] = edge.metadata
 
     return {
         "source": edge.source_said,
@@ -167,8 +178,6 @@ def load_property_graph_json(json_str: str) -> PropertyGraph:
     Returns:
         PropertyGraph instance
     """
-    from kgql.export.graph import NodeType
-
     data = json.loads(json_str)
     graph = PropertyGraph()
 
@@ -177,44 +186,46 @@ def load_property_graph_json(json_str: str) -> PropertyGraph:
         graph.metadata = data["metadata"]
 
     # Load nodes
-    for node_dict in data.get("nodes", []):
-        props = node_dict.get("properties", {})
+    nodes = []
+    for node_dict in data.get("nodes", ()):
+        props = node_dict.get("properties") or _NO_PROPERTIES
 
-        # Convert attributes back to tuple
-        attrs = props.get("attributes", {})
-        attrs_tuple = tuple(attrs.items()) if isinstance(attrs, dict) else ()
+        attrs = props.get("attributes")
+        if not isinstance(attrs, dict):
+            attrs = {}
 
-        node = GraphNode(
+        nodes.append(GraphNode(
             said=node_dict["id"],
             node_type=NodeType(node_dict["type"]),
             issuer=props.get("issuer", ""),
             schema=props.get("schema", ""),
-            attributes=attrs_tuple,
+            attributes=attrs,
             label=props.get("label", ""),
             key_state_seq=props.get("key_state_seq"),
             delegation_depth=props.get("delegation_depth"),
             issued_at=props.get("issued_at"),
             revoked_at=props.get("revoked_at"),
             registry=props.get("registry"),
-        )
-        graph.add_node(node)
+        ))
+    graph.add_nodes(nodes)
 
     # Load edges
-    for edge_dict in data.get("edges", []):
-        props = edge_dict.get("properties", {})
+    edges = []
+    for edge_dict in data.get("edges", ()):
+        props = edge_dict.get("properties") or _NO_PROPERTIES
 
-        # Convert metadata back to tuple
-        meta = props.get("metadata", {})
-        meta_tuple = tuple(meta.items()) if isinstance(meta, dict) else ()
+        meta = props.get("metadata")
+        if not isinstance(meta, dict):
+            meta = {}
 
-        edge = GraphEdge(
+        edges.append(GraphEdge(
             source_said=edge_dict["source"],
             target_said=edge_dict["target"],
             edge_type=edge_dict["type"],
             operator=props.get("operator", "ANY"),
             weight=props.get("weight"),
-            metadata=meta_tuple,
-        )
-        graph.add_edge(edge)
+            metadata=meta,
+        ))
+    graph.add_edges(edges)
 
     return graph
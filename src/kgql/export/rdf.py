@@ -32,9 +32,11 @@ Usage:
     print(turtle)  # Valid RDF/Turtle
 """
 
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import IO, Iterator, Optional
 
-from kgql.export.graph import PropertyGraph, GraphNode, GraphEdge, NodeType
+from kgql.export.graph import PropertyGraph, GraphNode, GraphEdge, NodeType, _write_lines
 
 
 # Ontology namespaces
@@ -48,6 +50,42 @@ RDFS_NS = "http://www.w3.org/2000/01/rdf-schema#"
 SAID_URN = "urn:said:"
 AID_URN = "urn:aid:"
 
+# Characters dropped from predicate local names (anything but Unicode
+# letters, digits and underscore, after "-" and ":" become "_")
+_PREDICATE_INVALID_RE = re.compile(r"\W")
+
+# RDF classes per node type, prefixed (Turtle) and full (N-Triples)
+_RDF_CLASSES = {
+    NodeType.CREDENTIAL: "keri:Credential",
+    NodeType.IDENTIFIER: "keri:Identifier",
+    NodeType.SCHEMA: "keri:Schema",
+    NodeType.FRAMEWORK: "keri:GovernanceFramework",
+}
+_RDF_CLASSES_FULL = {
+    node_type: f"<{KERI_NS}{name.removeprefix('keri:')}>"
+    for node_type, name in _RDF_CLASSES.items()
+}
+_RDF_CLASS_FULL_DEFAULT = f"<{KERI_NS}Node>"
+
+# Single-pass escape tables for string literals
+_TURTLE_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+_NTRIPLES_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+# Fixed N-Triples predicates, space-padded for direct concatenation
+_NT_TYPE = f" <{RDF_NS}type> "
+_NT_ISSUER = f" <{KERI_NS}issuer> "
+_NT_SCHEMA = f" <{KERI_NS}schema> "
+_NT_LABEL = f" <{RDFS_NS}label> "
+
+# @prefix declarations for Turtle format
+_TURTLE_PREFIX_LINES: tuple[str, ...] = (
+    f"@prefix keri: <{KERI_NS}> .",
+    f"@prefix acdc: <{ACDC_NS}> .",
+    f"@prefix xsd: <{XSD_NS}> .",
+    f"@prefix rdf: <{RDF_NS}> .",
+    f"@prefix rdfs: <{RDFS_NS}> .",
+)
+
 
 def export_rdf(
     graph: PropertyGraph,
@@ -70,26 +108,7 @@ def export_rdf(
     if format != "turtle":
         raise ValueError(f"Unsupported RDF format: {format}. Only 'turtle' is supported.")
 
-    lines = []
-
-    if include_prefixes:
-        lines.extend(_turtle_prefix_block())
-        lines.append("")
-
-    # Generate triples for nodes
-    for node in graph.nodes.values():
-        node_triples = _node_to_turtle(node)
-        lines.extend(node_triples)
-        lines.append("")  # Blank line between subjects
-
-    # Generate triples for edges
-    if graph.edges:
-        lines.append("# Edge relationships")
-        for edge in graph.edges:
-            edge_triples = _edge_to_turtle(edge)
-            lines.extend(edge_triples)
-
-    return "\n".join(lines)
+    return "\n".join(_turtle_lines(graph, include_prefixes))
 
 
 def export_rdf_ntriples(graph: PropertyGraph) -> str:
@@ -104,89 +123,120 @@ def export_rdf_ntriples(graph: PropertyGraph) -> str:
     Returns:
         String of N-Triples
     """
-    lines = []
+    return "\n".join(_ntriples_lines(graph))
 
-    # Generate triples for nodes
-    for node in graph.nodes.values():
-        lines.extend(_node_to_ntriples(node))
 
-    # Generate triples for edges
-    for edge in graph.edges:
-        lines.extend(_edge_to_ntriples(edge))
+def export_rdf_to(
+    graph: PropertyGraph,
+    fp: IO[str],
+    format: str = "turtle",
+    include_prefixes: bool = True,
+) -> None:
+    """
+    Write RDF/Turtle for a PropertyGraph to a text stream.
 
-    return "\n".join(lines)
+    Streaming counterpart of export_rdf(): writes the same document line by
+    line instead of building it in memory first.
 
+    Args:
+        graph: PropertyGraph to export
+        fp: Writable text stream (open file, StringIO, ...)
+        format: Output format ("turtle" only for now)
+        include_prefixes: Include @prefix declarations (default True)
+    """
+    if format != "turtle":
+        raise ValueError(f"Unsupported RDF format: {format}. Only 'turtle' is supported.")
+
+    _write_lines(fp, _turtle_lines(graph, include_prefixes))
 
-def _turtle_prefix_block() -> list[str]:
+
+def export_rdf_ntriples_to(graph: PropertyGraph, fp: IO[str]) -> None:
     """
-    Generate @prefix declarations for Turtle format.
+    Write N-Triples for a PropertyGraph to a text stream.
+
+    Streaming counterpart of export_rdf_ntriples().
+
+    Args:
+        graph: PropertyGraph to export
+        fp: Writable text stream
     """
-    return [
-        f"@prefix keri: <{KERI_NS}> .",
-        f"@prefix acdc: <{ACDC_NS}> .",
-        f"@prefix xsd: <{XSD_NS}> .",
-        f"@prefix rdf: <{RDF_NS}> .",
-        f"@prefix rdfs: <{RDFS_NS}> .",
-    ]
+    _write_lines(fp, _ntriples_lines(graph))
+
+
+def _turtle_lines(graph: PropertyGraph, include_prefixes: bool) -> Iterator[str]:
+    """Yield every line of the Turtle document, fully terminated."""
+    if include_prefixes:
+        yield from _TURTLE_PREFIX_LINES
+        yield ""
+
+    # Triples for nodes, blank line between subjects
+    for node in graph.nodes.values():
+        yield from _node_to_turtle(node)
+        yield ""
+
+    # Triples for edges
+    if graph.edges:
+        yield "# Edge relationships"
+        for edge in graph.edges:
+            yield from _edge_to_turtle(edge)
 
 
-def _node_to_turtle(node: GraphNode) -> list[str]:
+def _ntriples_lines(graph: PropertyGraph) -> Iterator[str]:
+    """Yield every N-Triples line: node triples, then edge triples."""
+    for node in graph.nodes.values():
+        yield from _node_to_ntriples(node)
+    for edge in graph.edges:
+        yield from _edge_to_ntriples(edge)
+
+
+def _node_to_turtle(node: GraphNode) -> Iterator[str]:
     """
     Convert GraphNode to Turtle triples.
 
+    Each line is yielded once the next one is known, so it can be
+    terminated with ";" (more follow) or "." (last) directly.
+
     Example:
         <urn:said:ESAID...> a keri:Credential ;
             keri:issuer <urn:aid:EAID...> ;
             keri:schema <urn:said:ESCHEMA...> .
     """
-    lines = []
-    subject = _said_to_uri(node.said)
-
     # RDF type based on node type
-    rdf_type = _node_type_to_rdf_class(node.node_type)
-    lines.append(f"{subject} a {rdf_type} ;")
+    line = f"{_said_to_uri(node.said)} a {_RDF_CLASSES.get(node.node_type, 'keri:Node')}"
+    for prop in _node_turtle_properties(node):
+        yield line + " ;"
+        line = prop
+    yield line + " ."
 
-    # Properties
-    props = []
 
-    if node.issuer:
-        props.append(f'    keri:issuer {_aid_to_uri(node.issuer)}')
-    if node.schema:
-        props.append(f'    keri:schema {_said_to_uri(node.schema)}')
-    if node.label:
-        props.append(f'    rdfs:label {_turtle_literal(node.label)}')
-    if node.key_state_seq is not None:
-        props.append(f'    keri:keyStateSeq {node.key_state_seq}')
-    if node.delegation_depth is not None:
-        props.append(f'    keri:delegationDepth {node.delegation_depth}')
-    if node.issued_at:
-        props.append(f'    keri:issuedAt {_turtle_datetime(node.issued_at)}')
-    if node.revoked_at:
-        props.append(f'    keri:revokedAt {_turtle_datetime(node.revoked_at)}')
-    if node.registry:
-        props.append(f'    keri:registry {_said_to_uri(node.registry)}')
+def _node_turtle_properties(node: GraphNode) -> Iterator[str]:
+    """Yield the unterminated property lines of a node's Turtle block."""
+    for attr, keep_zero, prefix, fmt in _NODE_TURTLE_PROPS:
+        value = getattr(node, attr)
+        if (value is not None) if keep_zero else value:
+            yield prefix + fmt(value)
 
     # Attributes as custom properties
-    if node.attributes:
-        for key, value in node.attributes:
-            safe_key = _sanitize_predicate(key)
-            props.append(f'    acdc:{safe_key} {_turtle_value(value)}')
-
-    # Join properties with semicolons, end with period
-    if props:
-        for i, prop in enumerate(props):
-            if i < len(props) - 1:
-                lines.append(f"{prop} ;")
-            else:
-                lines.append(f"{prop} .")
-    else:
-        # No properties, just close the type statement
-        lines[-1] = lines[-1].replace(" ;", " .")
-
-    return lines
-
-
-def _edge_to_turtle(edge: GraphEdge) -> list[str]:
+    for key, value in node.attributes.items():
+        yield _attribute_turtle_prefix(key) + _turtle_value(value)
+
+
+# Node properties in Turtle output order as (attribute, keep_zero, line
+# prefix, value formatter). keep_zero properties are emitted whenever not
+# None; the rest when truthy. Formatters are resolved lazily (defined below).
+_NODE_TURTLE_PROPS = (
+    ("issuer", False, "    keri:issuer ", lambda v: _aid_to_uri(v)),
+    ("schema", False, "    keri:schema ", lambda v: _said_to_uri(v)),
+    ("label", False, "    rdfs:label ", lambda v: _turtle_literal(v)),
+    ("key_state_seq", True, "    keri:keyStateSeq ", str),
+    ("delegation_depth", True, "    keri:delegationDepth ", str),
+    ("issued_at", False, "    keri:issuedAt ", lambda v: _turtle_datetime(v)),
+    ("revoked_at", False, "    keri:revokedAt ", lambda v: _turtle_datetime(v)),
+    ("registry", False, "    keri:registry ", lambda v: _said_to_uri(v)),
+)
+
+
+def _edge_to_turtle(edge: GraphEdge) -> Iterator[str]:
     """
     Convert GraphEdge to Turtle triples.
 
@@ -194,114 +244,105 @@ def _edge_to_turtle(edge: GraphEdge) -> list[str]:
         <urn:said:ESAID1> keri:acdc <urn:said:ESAID2> .
         <urn:said:ESAID1> keri:edgeOperator "I2I" .
     """
-    lines = []
     subject = _said_to_uri(edge.source_said)
-    obj = _said_to_uri(edge.target_said)
+    predicate, operator_predicate, weight_predicate = _edge_turtle_predicates(edge.edge_type)
 
     # Edge type as predicate
-    predicate = f"keri:{_sanitize_predicate(edge.edge_type)}"
-    lines.append(f"{subject} {predicate} {obj} .")
+    yield subject + predicate + _said_to_uri(edge.target_said) + " ."
 
     # Operator as reified property (if not ANY)
     if edge.operator != "ANY":
-        lines.append(
-            f"{subject} keri:{_sanitize_predicate(edge.edge_type)}Operator "
-            f'{_turtle_literal(edge.operator)} .'
-        )
+        yield subject + operator_predicate + _turtle_literal(edge.operator) + " ."
 
     # Weight if present
     if edge.weight is not None:
-        lines.append(
-            f"{subject} keri:{_sanitize_predicate(edge.edge_type)}Weight "
-            f"{edge.weight} ."
-        )
-
-    return lines
+        yield f"{subject}{weight_predicate}{edge.weight} ."
 
 
-def _node_to_ntriples(node: GraphNode) -> list[str]:
+def _node_to_ntriples(node: GraphNode) -> Iterator[str]:
     """
     Convert GraphNode to N-Triples format.
     """
-    lines = []
     subject = _said_to_uri_full(node.said)
-    rdf_type = _node_type_to_rdf_class_full(node.node_type)
+    rdf_type = _RDF_CLASSES_FULL.get(node.node_type, _RDF_CLASS_FULL_DEFAULT)
 
-    lines.append(f'{subject} <{RDF_NS}type> {rdf_type} .')
+    yield subject + _NT_TYPE + rdf_type + " ."
 
     if node.issuer:
-        lines.append(f'{subject} <{KERI_NS}issuer> {_aid_to_uri_full(node.issuer)} .')
+        yield subject + _NT_ISSUER + _aid_to_uri_full(node.issuer) + " ."
     if node.schema:
-        lines.append(f'{subject} <{KERI_NS}schema> {_said_to_uri_full(node.schema)} .')
+        yield subject + _NT_SCHEMA + _said_to_uri_full(node.schema) + " ."
     if node.label:
-        lines.append(f'{subject} <{RDFS_NS}label> {_ntriples_literal(node.label)} .')
+        yield subject + _NT_LABEL + _ntriples_literal(node.label) + " ."
 
-    return lines
 
-
-def _edge_to_ntriples(edge: GraphEdge) -> list[str]:
+def _edge_to_ntriples(edge: GraphEdge) -> Iterator[str]:
     """
     Convert GraphEdge to N-Triples format.
     """
     subject = _said_to_uri_full(edge.source_said)
     obj = _said_to_uri_full(edge.target_said)
-    predicate = f"<{KERI_NS}{_sanitize_predicate(edge.edge_type)}>"
+    yield subject + _edge_ntriples_predicate(edge.edge_type) + obj + " ."
 
-    return [f"{subject} {predicate} {obj} ."]
 
+@lru_cache(maxsize=1024)
+def _edge_turtle_predicates(edge_type: str) -> tuple[str, str, str]:
+    """
+    Space-padded Turtle predicates for an edge type: the edge itself and
+    its Operator and Weight properties, built once per edge type.
+    """
+    predicate = "keri:" + _sanitize_predicate(edge_type)
+    return f" {predicate} ", f" {predicate}Operator ", f" {predicate}Weight "
 
-def _said_to_uri(said: str) -> str:
-    """Convert SAID to Turtle-prefixed URI."""
-    return f"<{SAID_URN}{said}>"
 
+@lru_cache(maxsize=1024)
+def _edge_ntriples_predicate(edge_type: str) -> str:
+    """Space-padded full-URI N-Triples predicate for an edge type."""
+    return f" <{KERI_NS}{_sanitize_predicate(edge_type)}> "
 
-def _said_to_uri_full(said: str) -> str:
-    """Convert SAID to full URI for N-Triples."""
-    return f"<{SAID_URN}{said}>"
 
+@lru_cache(maxsize=4096)
+def _attribute_turtle_prefix(key: str) -> str:
+    """Indented "acdc:<key> " line prefix for a node attribute."""
+    return f"    acdc:{_sanitize_predicate(key)} "
 
-def _aid_to_uri(aid: str) -> str:
-    """Convert AID to Turtle-prefixed URI."""
-    return f"<{AID_URN}{aid}>"
 
+@lru_cache(maxsize=8192)
+def _said_to_uri(said: str) -> str:
+    """Convert SAID to Turtle-prefixed URI.
 
-def _aid_to_uri_full(aid: str) -> str:
-    """Convert AID to full URI for N-Triples."""
-    return f"<{AID_URN}{aid}>"
+    Cached: the same SAIDs recur as node subjects and edge endpoints.
+    """
+    return f"<{SAID_URN}{said}>"
 
 
-def _node_type_to_rdf_class(node_type: NodeType) -> str:
-    """Map NodeType to RDF class (prefixed form)."""
-    class_map = {
-        NodeType.CREDENTIAL: "keri:Credential",
-        NodeType.IDENTIFIER: "keri:Identifier",
-        NodeType.SCHEMA: "keri:Schema",
-        NodeType.FRAMEWORK: "keri:GovernanceFramework",
-    }
-    return class_map.get(node_type, "keri:Node")
+@lru_cache(maxsize=8192)
+def _aid_to_uri(aid: str) -> str:
+    """Convert AID to Turtle-prefixed URI.
+
+    Cached: one issuer AID is typically shared by many nodes.
+    """
+    return f"<{AID_URN}{aid}>"
 
 
-def _node_type_to_rdf_class_full(node_type: NodeType) -> str:
-    """Map NodeType to full RDF class URI."""
-    class_map = {
-        NodeType.CREDENTIAL: f"<{KERI_NS}Credential>",
-        NodeType.IDENTIFIER: f"<{KERI_NS}Identifier>",
-        NodeType.SCHEMA: f"<{KERI_NS}Schema>",
-        NodeType.FRAMEWORK: f"<{KERI_NS}GovernanceFramework>",
-    }
-    return class_map.get(node_type, f"<{KERI_NS}Node>")
+# URN URIs are already absolute, so the N-Triples forms are the same
+# strings; aliasing lets both formats share one cache.
+_said_to_uri_full = _said_to_uri
+_aid_to_uri_full = _aid_to_uri
 
 
 def _turtle_literal(value: str) -> str:
     """Format string as Turtle literal."""
-    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
-    return f'"{escaped}"'
+    if "\\" in value or '"' in value:
+        value = value.translate(_TURTLE_ESCAPES)
+    return f'"{value}"'
 
 
 def _ntriples_literal(value: str) -> str:
     """Format string as N-Triples literal."""
-    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
-    return f'"{escaped}"'
+    if "\\" in value or '"' in value or "\n" in value:
+        value = value.translate(_NTRIPLES_ESCAPES)
+    return f'"{value}"'
 
 
 def _turtle_datetime(value: str) -> str:
@@ -321,20 +362,16 @@ def _turtle_value(value) -> str:
         return _turtle_literal(str(value))
 
 
+@lru_cache(maxsize=4096)
 def _sanitize_predicate(name: str) -> str:
     """
     Sanitize string for use as RDF predicate local name.
 
-    Removes/replaces characters invalid in Turtle local names.
+    Removes/replaces characters invalid in Turtle local names. Cached,
+    since edge types and attribute keys repeat across the whole graph.
     """
-    # Replace common problematic characters
-    result = ""
-    for c in name:
-        if c.isalnum() or c == "_":
-            result += c
-        elif c in "-:":
-            result += "_"
-        # Skip other characters
+    # Replace common problematic characters, skip the rest
+    result = _PREDICATE_INVALID_RE.sub("", name.replace("-", "_").replace(":", "_"))
 
     # Ensure doesn't start with digit
     if result and result[0].isdigit():
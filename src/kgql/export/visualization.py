@@ -25,9 +25,11 @@ Usage:
     print(diagram)  # Ready for mermaid.live
 """
 
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import IO, Iterator, Optional
 
-from kgql.export.graph import PropertyGraph, GraphNode, GraphEdge, NodeType
+from kgql.export.graph import PropertyGraph, GraphEdge, NodeType, _write_lines
 
 
 # Color scheme for node types (Material Design colors)
@@ -46,6 +48,16 @@ NODE_SHAPES = {
     NodeType.FRAMEWORK: ("[[", "]]"),    # Subroutine box
 }
 
+# Per-type label openers/closers (shape bracket plus quote) and type names,
+# computed once rather than per rendered node
+_NODE_LABEL_WRAP = {nt: (left + '"', '"' + right) for nt, (left, right) in NODE_SHAPES.items()}
+_NODE_LABEL_WRAP_DEFAULT = ('["', '"]')
+_NODE_TYPE_NAMES = {nt: nt.value.capitalize() for nt in NodeType}
+
+# Label escaping: <br/> line breaks pass through, other specials become entities
+_MERMAID_ESCAPE_RE = re.compile(r'<br/>|[<>"]')
+_MERMAID_ESCAPES = {"<br/>": "<br/>", '"': "&quot;", "<": "&lt;", ">": "&gt;"}
+
 
 def export_mermaid(
     graph: PropertyGraph,
@@ -74,42 +86,81 @@ def export_mermaid(
     Returns:
         Mermaid flowchart diagram as string
     """
-    lines = [f"flowchart {direction}"]
+    return "\n".join(_mermaid_lines(
+        graph, direction, show_operators, show_saids, show_labels,
+        colorize, max_label_length,
+    ))
+
+
+def export_mermaid_to(
+    graph: PropertyGraph,
+    fp: IO[str],
+    direction: str = "LR",
+    show_operators: bool = True,
+    show_saids: bool = False,
+    show_labels: bool = True,
+    colorize: bool = True,
+    max_label_length: int = 20,
+) -> None:
+    """
+    Write a Mermaid flowchart for a PropertyGraph to a text stream.
+
+    Streaming counterpart of export_mermaid(); takes the same options.
 
-    # Build SAID → variable mapping
+    Args:
+        graph: PropertyGraph to visualize
+        fp: Writable text stream (open file, StringIO, ...)
+    """
+    _write_lines(fp, _mermaid_lines(
+        graph, direction, show_operators, show_saids, show_labels,
+        colorize, max_label_length,
+    ))
+
+
+def _mermaid_lines(
+    graph: PropertyGraph,
+    direction: str,
+    show_operators: bool,
+    show_saids: bool,
+    show_labels: bool,
+    colorize: bool,
+    max_label_length: int,
+) -> Iterator[str]:
+    """Yield every line of the flowchart: nodes, edges, then styles."""
+    yield f"flowchart {direction}"
+    style_lines = [""]  # Emitted after the edges when colorize is enabled
+
+    # One pass over the node columns: SAID → variable mapping, node
+    # definitions and styling
+    cols = graph.node_columns()
     said_to_var: dict[str, str] = {}
-    for idx, said in enumerate(graph.nodes.keys()):
-        said_to_var[said] = f"n{idx}"
-
-    # Generate node definitions
-    for said, node in graph.nodes.items():
-        var = said_to_var[said]
-        node_def = _node_to_mermaid(
-            node, var, show_saids, show_labels, max_label_length
+    for idx, (said, node_type, label) in enumerate(
+        zip(cols["said"], cols["node_type"], cols["label"])
+    ):
+        var = f"n{idx}"
+        said_to_var[said] = var
+        yield "    " + _node_to_mermaid(
+            said, node_type, label, var, show_saids, show_labels, max_label_length
         )
-        lines.append(f"    {node_def}")
+        if colorize:
+            color = NODE_COLORS.get(node_type, "#ffffff")
+            style_lines.append(f"    style {var} fill:{color}")
 
     # Add blank line
-    lines.append("")
+    yield ""
 
-    # Generate edge definitions
+    # Generate edge definitions (lookup bound to a local for the hot loop)
+    var_of = said_to_var.get
     for edge in graph.edges:
-        source_var = said_to_var.get(edge.source_said)
-        target_var = said_to_var.get(edge.target_said)
+        source_var = var_of(edge.source_said)
+        target_var = var_of(edge.target_said)
 
         if source_var and target_var:
-            edge_def = _edge_to_mermaid(edge, source_var, target_var, show_operators)
-            lines.append(f"    {edge_def}")
+            yield "    " + _edge_to_mermaid(edge, source_var, target_var, show_operators)
 
     # Add styling if colorize is enabled
     if colorize:
-        lines.append("")
-        for said, node in graph.nodes.items():
-            var = said_to_var[said]
-            color = NODE_COLORS.get(node.node_type, "#ffffff")
-            lines.append(f"    style {var} fill:{color}")
-
-    return "\n".join(lines)
+        yield from style_lines
 
 
 def export_mermaid_subgraph(
@@ -161,46 +212,38 @@ def export_mermaid_subgraph(
 
 
 def _node_to_mermaid(
-    node: GraphNode,
+    said: str,
+    node_type: NodeType,
+    label: str,
     var: str,
     show_said: bool,
     show_label: bool,
     max_label_length: int,
 ) -> str:
     """
-    Convert GraphNode to Mermaid node definition.
+    Convert a node's SAID, type and label to a Mermaid node definition.
 
     Example:
         n0["Credential<br/>EF1x2Kvx..."]
     """
-    # Get shape brackets for node type
-    left, right = NODE_SHAPES.get(node.node_type, ("[", "]"))
-
-    # Build label parts
-    parts = []
-
-    # Type name
-    type_name = node.node_type.value.capitalize()
-    parts.append(type_name)
-
-    # Custom label if available
-    if show_label and node.label:
-        label = node.label
-        if len(label) > max_label_length:
-            label = label[:max_label_length - 3] + "..."
-        parts.append(label)
+    # Get shape brackets (with label quotes) for node type
+    left, right = _NODE_LABEL_WRAP.get(node_type, _NODE_LABEL_WRAP_DEFAULT)
+
+    # Custom label if available, else the SAID
+    if show_label and label:
+        text = label
+        if len(text) > max_label_length:
+            text = text[:max_label_length - 3] + "..."
     elif show_said:
-        parts.append(node.said)
+        text = said
     else:
-        parts.append(_said_short(node.said))
-
-    # Join with line break (Mermaid uses <br/>)
-    label = "<br/>".join(parts)
+        text = _said_short(said)
 
-    # Escape special characters in label
-    label = _mermaid_escape_label(label)
+    # Type name and text joined with a line break (Mermaid uses <br/>),
+    # special characters escaped
+    text = _mermaid_escape_label(_NODE_TYPE_NAMES[node_type] + "<br/>" + text)
 
-    return f'{var}{left}"{label}"{right}'
+    return var + left + text + right
 
 
 def _edge_to_mermaid(
@@ -216,28 +259,28 @@ def _edge_to_mermaid(
         n0 -->|"acdc @I2I"| n1
     """
     # Build edge label
-    label_parts = [edge.edge_type]
+    label = edge.edge_type
     if show_operator and edge.operator != "ANY":
-        label_parts.append(f"@{edge.operator}")
+        label = f"{label} @{edge.operator}"
 
-    label = " ".join(label_parts)
-    label = _mermaid_escape_label(label)
-
-    return f'{source_var} -->|"{label}"| {target_var}'
+    return f'{source_var} -->|"{_mermaid_escape_label(label)}"| {target_var}'
 
 
+@lru_cache(maxsize=8192)
 def _said_short(said: str, length: int = 12) -> str:
     """
     Truncate SAID for display.
 
     Keeps the first `length` characters and adds ellipsis.
     SAIDs start with 'E' so the first char is always visible.
+    Cached, as the same issuer AIDs recur across a diagram.
     """
     if len(said) <= length:
         return said
     return said[:length] + "..."
 
 
+@lru_cache(maxsize=2048)
 def _mermaid_escape_label(label: str) -> str:
     """
     Escape special characters for Mermaid labels.
@@ -245,23 +288,20 @@ def _mermaid_escape_label(label: str) -> str:
     Mermaid uses double quotes for labels, so we need to escape:
     - Double quotes: " → &quot;
     - Angle brackets (but NOT <br/> which Mermaid uses for line breaks)
+
+    Done in one regex pass; cached because edge labels repeat heavily.
     """
-    # Temporarily protect <br/> tags
-    label = label.replace("<br/>", "\x00BR\x00")
-    # Escape special characters
-    label = label.replace('"', "&quot;")
-    label = label.replace("<", "&lt;")
-    label = label.replace(">", "&gt;")
-    # Restore <br/> tags
-    label = label.replace("\x00BR\x00", "<br/>")
-    return label
+    return _MERMAID_ESCAPE_RE.sub(lambda m: _MERMAID_ESCAPES[m.group(0)], label)
 
 
+@lru_cache(maxsize=8192)
 def _mermaid_escape_id(text: str) -> str:
     """
     Convert text to valid Mermaid ID.
 
     Removes special characters and replaces spaces with underscores.
+    Cached, as each participant ID recurs on every message it sends or
+    receives.
     """
     return "".join(c if c.isalnum() else "_" for c in text)
 
@@ -285,12 +325,12 @@ def export_mermaid_sequence(
     lines = ["sequenceDiagram"]
 
     # Get participants (issuers/identifiers)
-    participants = set()
-    for node in graph.nodes.values():
-        if node.issuer:
-            participants.add(node.issuer)
-        if node.node_type == NodeType.IDENTIFIER:
-            participants.add(node.said)
+    cols = graph.node_columns()
+    participants = {issuer for issuer in cols["issuer"] if issuer}
+    participants.update(
+        said for said, node_type in zip(cols["said"], cols["node_type"])
+        if node_type == NodeType.IDENTIFIER
+    )
 
     # Declare participants
     for p in sorted(participants):
@@ -299,10 +339,13 @@ def export_mermaid_sequence(
 
     lines.append("")
 
-    # Generate messages for edges
+    # Generate messages for edges (lookups bound to locals for the hot loop)
+    node_of = graph.nodes.get
+    escape_id = _mermaid_escape_id
+    append = lines.append
     for edge in graph.edges:
-        source_node = graph.get_node(edge.source_said)
-        target_node = graph.get_node(edge.target_said)
+        source_node = node_of(edge.source_said)
+        target_node = node_of(edge.target_said)
 
         if source_node and target_node:
             # Determine participants
@@ -317,9 +360,6 @@ def export_mermaid_sequence(
             if edge.operator != "ANY":
                 msg += f" @{edge.operator}"
 
-            lines.append(
-                f"    {_mermaid_escape_id(source_p)}{arrow}"
-                f"{_mermaid_escape_id(target_p)}: {msg}"
-            )
+            append(f"    {escape_id(source_p)}{arrow}{escape_id(target_p)}: {msg}")
 
     return "\n".join(lines)
@@ -3,65 +3,66 @@ KGQL Governance - Re-exports from keri-governance.
 
 All governance logic now lives in the standalone keri-governance package.
 This module provides backwards-compatible imports for existing KGQL code.
+
+Names are resolved lazily (PEP 562) on first access, so importing
+``kgql`` or ``kgql.export`` does not pull in the governance stack.
 """
 
-from keri_governance.schema import (  # noqa: F401
-    GovernanceFramework,
-    ConstraintRule,
-    RuleEnforcement,
-    CredentialMatrixEntry,
-    FrameworkVersion,
-)
-from keri_governance.resolver import FrameworkResolver, VersionChain  # noqa: F401
-from keri_governance.checker import ConstraintChecker, operator_satisfies  # noqa: F401
-from keri_governance.compiler import (  # noqa: F401
-    ConstraintCompiler,
-    CompiledFramework,
-    CompiledFieldConstraint,
-    compile_field_expression,
-)
-from keri_governance.patterns import (  # noqa: F401
-    jurisdiction_match,
-    delegation_depth,
-    operator_floor,
-    role_action_matrix,
-    temporal_validity,
-    chain_integrity,
-    vlei_standard_framework,
-)
-from keri_governance.evolution import GovernanceEvolution, EvolutionResult  # noqa: F401
-from keri_governance.systems import (  # noqa: F401
-    SYSTEM_CATALOG,
-    build_framework,
-    build_all_frameworks,
-    register_all_frameworks,
-)
+from importlib import import_module
+
+# keri_governance submodule -> public names re-exported from it
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "keri_governance.schema": (
+        "GovernanceFramework",
+        "ConstraintRule",
+        "RuleEnforcement",
+        "CredentialMatrixEntry",
+        "FrameworkVersion",
+    ),
+    "keri_governance.resolver": ("FrameworkResolver", "VersionChain"),
+    "keri_governance.checker": ("ConstraintChecker", "operator_satisfies"),
+    "keri_governance.compiler": (
+        "ConstraintCompiler",
+        "CompiledFramework",
+        "CompiledFieldConstraint",
+        "compile_field_expression",
+    ),
+    "keri_governance.evolution": ("GovernanceEvolution", "EvolutionResult"),
+    "keri_governance.systems": (
+        "SYSTEM_CATALOG",
+        "build_framework",
+        "build_all_frameworks",
+        "register_all_frameworks",
+    ),
+    "keri_governance.patterns": (
+        "jurisdiction_match",
+        "delegation_depth",
+        "operator_floor",
+        "role_action_matrix",
+        "temporal_validity",
+        "chain_integrity",
+        "vlei_standard_framework",
+    ),
+}
+
+# Public name -> (keri_governance submodule, attribute)
+_LAZY: dict[str, tuple[str, str]] = {
+    name: (module, name) for module, names in _EXPORTS.items() for name in names
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    """Resolve a re-exported name on first access and cache it."""
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), attr)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    "GovernanceFramework",
-    "ConstraintRule",
-    "RuleEnforcement",
-    "CredentialMatrixEntry",
-    "FrameworkVersion",
-    "FrameworkResolver",
-    "VersionChain",
-    "ConstraintChecker",
-    "operator_satisfies",
-    "ConstraintCompiler",
-    "CompiledFramework",
-    "CompiledFieldConstraint",
-    "compile_field_expression",
-    "GovernanceEvolution",
-    "EvolutionResult",
-    "SYSTEM_CATALOG",
-    "build_framework",
-    "build_all_frameworks",
-    "register_all_frameworks",
-    "jurisdiction_match",
-    "delegation_depth",
-    "operator_floor",
-    "role_action_matrix",
-    "temporal_validity",
-    "chain_integrity",
-    "vlei_standard_framework",
-]
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
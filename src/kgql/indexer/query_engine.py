@@ -10,11 +10,12 @@ Combines SchemaIndexer and QueryOperators to execute queries:
 Based on Phil Feairheller's KERIA Seeker pattern.
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import Any, Callable, Iterator, Optional
 
 from kgql.indexer.schema_indexer import SchemaIndexer, IndexDefinition, FieldType
-from kgql.indexer.query_operators import QueryOperator, parse_query_value
+from kgql.indexer.query_operators import Eq, QueryOperator, parse_query_value
 
 # Semantic slug generation
 try:
@@ -23,33 +24,70 @@ try:
 except ImportError:
     HAS_SLUG_GENERATOR = False
 
+    _WORD_RE = re.compile(r'\b[a-zA-Z][a-zA-Z0-9]{2,}\b')
+    _STOPWORDS = frozenset({'the', 'and', 'for', 'this', 'that', 'with', 'from', 'are', 'was'})
+
     def generate_semantic_slug(text: str, max_words: int = 3) -> str:
         """Fallback slug generation."""
-        import re
-        words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9]{2,}\b', text.lower())
-        stopwords = {'the', 'and', 'for', 'this', 'that', 'with', 'from', 'are', 'was'}
-        keywords = [w for w in words if w not in stopwords][:max_words]
+        words = _WORD_RE.findall(text.lower())
+        keywords = [w for w in words if w not in _STOPWORDS][:max_words]
         return "-".join(keywords) if keywords else ""
 
 
-@dataclass
+# Credential attributes the semantic slug is generated from, in order
+_SLUG_SOURCE_FIELDS = ("title", "summary", "name", "type")
+
+
+def _slug_source(attrs: dict) -> str:
+    """
+    Text the semantic slug of a credential is generated from.
+
+    Missing and empty fields are skipped; only non-str values are
+    converted, so credentials without any of the fields cost no
+    string building.
+    """
+    parts = []
+    for key in _SLUG_SOURCE_FIELDS:
+        value = attrs.get(key)
+        if value is None or value == "":
+            continue
+        parts.append(value if type(value) is str else str(value))
+    return " ".join(parts) if parts else ""
+
+
+@dataclass(frozen=True, slots=True)
 class QueryResult:
-    """Result from a credential query."""
+    """
+    Result from a credential query.
+
+    The semantic slug is display-only and excluded from equality. query()
+    leaves it as None so it is generated from the credential attributes
+    on the first display_slug() call rather than for every match.
+    """
     credential: dict                    # Matched credential
     schema_said: str                    # Schema of credential
     issuer: str                         # Issuer AID
     said: str                           # Credential SAID
     matched_fields: dict = field(default_factory=dict)  # Fields that matched
-    slug: str = ""                      # Semantic colloquial name
+    slug: Optional[str] = field(default="", compare=False)  # Semantic colloquial name (None = generate)
+
+    def display_slug(self) -> str:
+        """Return the slug, generating and caching it when it is None."""
+        if self.slug is None:
+            source = _slug_source(self.credential.get("a", {}))
+            slug = generate_semantic_slug(source, max_words=3) if source.strip() else ""
+            object.__setattr__(self, "slug", slug)  # Cache on the frozen instance
+        return self.slug
 
     def display_id(self) -> str:
         """Return SAID with slug for human-readable display."""
-        if self.slug:
-            return f"{self.said[:12]}... ({self.slug})"
+        slug = self.display_slug()
+        if slug:
+            return f"{self.said[:12]}... ({slug})"
         return f"{self.said[:12]}..."
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Query:
     """
     Parsed query ready for execution.
@@ -62,6 +100,9 @@ class Query:
     schema: Optional[str] = None
     issuer: Optional[str] = None
     field_conditions: dict[str, QueryOperator] = field(default_factory=dict)
+    _matcher: Optional[Callable[[dict], bool]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, query_dict: dict) -> "Query":
@@ -78,22 +119,106 @@ class Query:
                 }
 
         Returns:
-            Parsed Query instance
+            Parsed Query instance. query_dict is left unchanged.
         """
-        schema = query_dict.pop("-s", None)
-        issuer = query_dict.pop("-i", None)
-
-        field_conditions = {}
-        for field_name, field_value in query_dict.items():
-            if not field_name.startswith("-"):  # Skip meta fields
-                field_conditions[field_name] = parse_query_value(field_value)
-
         return cls(
-            schema=schema,
-            issuer=issuer,
-            field_conditions=field_conditions,
+            schema=query_dict.get("-s"),
+            issuer=query_dict.get("-i"),
+            field_conditions={
+                field_name: parse_query_value(field_value)
+                for field_name, field_value in query_dict.items()
+                if not field_name.startswith("-")  # Skip meta fields
+            },
         )
 
+    def compile(self) -> Callable[[dict], bool]:
+        """
+        Compile the query into a single predicate over credential dicts.
+
+        Each condition's matches() is bound once, so evaluating a
+        credential is one call with no per-field dispatch. The predicate
+        is built on first use and reused; the field_conditions dict
+        should not be changed afterwards.
+
+        Returns:
+            Callable returning True when a credential matches the query
+        """
+        if self._matcher is None:
+            # Cache on the frozen instance
+            object.__setattr__(self, "_matcher", _compile_matcher(
+                self.schema, self.issuer, self.field_conditions
+            ))
+        return self._matcher
+
+
+def _compile_matcher(
+    schema: Optional[str],
+    issuer: Optional[str],
+    field_conditions: dict[str, QueryOperator],
+) -> Callable[[dict], bool]:
+    """
+    Build the credential predicate for Query.compile().
+
+    Dotted field names are split into paths here, once, rather than for
+    every credential; plain fields keep a direct lookup.
+    """
+    checks = tuple(
+        (field_name, _field_path(field_name), operator.matches)
+        for field_name, operator in field_conditions.items()
+    )
+
+    def matches(credential: dict) -> bool:
+        # Schema and issuer filters
+        if schema and credential.get("s") != schema:
+            return False
+        if issuer and credential.get("i") != issuer:
+            return False
+
+        # Field conditions
+        attrs = credential.get("a", {})
+        for field_name, path, match in checks:
+            value = attrs.get(field_name) if path is None else _path_value(attrs, path)
+            if value is None or not match(value):
+                return False
+        return True
+
+    return matches
+
+
+def _field_value(attrs: dict, field_name: str) -> Any:
+    """
+    Get field value from attributes, supporting nested paths.
+
+    Args:
+        attrs: Credential attributes dict
+        field_name: Field name, possibly with dots (e.g., "address.city")
+
+    Returns:
+        Field value or None
+    """
+    path = _field_path(field_name)
+    if path is None:
+        return attrs.get(field_name)
+    return _path_value(attrs, path)
+
+
+def _field_path(field_name: str) -> Optional[tuple[str, ...]]:
+    """Split a dotted field name into its path, or None for a plain field."""
+    if "." not in field_name:
+        return None
+    return tuple(field_name.split("."))
+
+
+def _path_value(attrs: dict, path: tuple[str, ...]) -> Any:
+    """Navigate a pre-split nested path; None if any step is missing."""
+    current = attrs
+    for part in path:
+        if isinstance(current, dict):
+            current = current.get(part)
+        else:
+            return None
+    return current
+
 
 class QueryEngine:
     """
@@ -115,6 +240,12 @@ class QueryEngine:
         self._schemas: dict[str, dict] = {}  # schema_said -> schema
         self._indexer = SchemaIndexer()
         self._indices: dict[str, list[IndexDefinition]] = {}  # schema_said -> indices
+        # Equality posting lists over an indexed credential list:
+        # field -> value -> positions in self._indexed. The snapshot holds
+        # the indexed dicts alive so their ids cannot be reused.
+        self._indexed: Optional[list[dict]] = None
+        self._indexed_ids: list[int] = []
+        self._postings: dict[str, dict[Any, list[int]]] = {}
 
     def register_schema(self, schema_said: str, schema: dict):
         """
@@ -133,6 +264,88 @@ class QueryEngine:
         """Get index definitions for a schema."""
         return self._indices.get(schema_said, [])
 
+    def index_credentials(self, credentials: list[dict]):
+        """
+        Build equality posting lists for a credential list.
+
+        Every attribute field declared indexable by a registered schema is
+        indexed across all credentials, so a later query() on this same
+        list answers $eq conditions with hash lookups instead of a full
+        scan. A list that no longer holds the same credential objects in
+        the same positions is scanned in full instead. Credentials edited
+        in place are not detected: re-run after mutating a credential dict.
+
+        Args:
+            credentials: List of credential dicts to index
+        """
+        fields = {
+            idx_def.field
+            for indices in self._indices.values()
+            for idx_def in indices
+            if idx_def.field_path[:1] == ["a"]
+        }
+        postings: dict[str, dict[Any, list[int]]] = {f: {} for f in fields}
+        paths = [
+            (field_name, _field_path(field_name), posting)
+            for field_name, posting in postings.items()
+        ]
+
+        for pos, cred in enumerate(credentials):
+            attrs = cred.get("a", {})
+            for field_name, path, posting in paths:
+                value = attrs.get(field_name) if path is None else _path_value(attrs, path)
+                if value is None:
+                    continue
+                try:
+                    posting.setdefault(value, []).append(pos)
+                except TypeError:
+                    continue  # Unhashable values are left to the scan
+
+        self._indexed = list(credentials)
+        self._indexed_ids = list(map(id, credentials))
+        self._postings = postings
+
+    def _candidates(
+        self,
+        credentials: list[dict],
+        query: Query,
+    ) -> Optional[list[int]]:
+        """
+        Positions that can match query, from the $eq posting lists.
+
+        Returns:
+            Sorted candidate positions, or None when no index applies
+            (including when credentials no longer holds the indexed
+            credential objects in the same positions)
+        """
+        if (
+            self._indexed is None
+            or len(credentials) != len(self._indexed_ids)
+            or list(map(id, credentials)) != self._indexed_ids
+        ):
+            return None
+
+        postings = []
+        for field_name, operator in query.field_conditions.items():
+            index = self._postings.get(field_name)
+            if index is None or not isinstance(operator, Eq):
+                continue
+            try:
+                postings.append(index.get(operator.value, ()))
+            except TypeError:
+                continue
+        if not postings:
+            return None
+
+        # Intersect starting from the most selective posting list
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        return sorted(candidates)
+
     def query(
         self,
         credentials: list[dict],
@@ -141,6 +354,10 @@ class QueryEngine:
         """
         Execute query against credentials.
 
+        When credentials holds the same credential objects, in the same
+        order, as the list last passed to index_credentials(), $eq conditions on indexed fields narrow the scan to the
+        intersection of their posting lists.
+
         Args:
             credentials: List of credential dicts
             query_dict: Query dict with field conditions
@@ -148,20 +365,15 @@ class QueryEngine:
         Yields:
             QueryResult for each matching credential
         """
-        query = Query.from_dict(query_dict.copy())
+        query = Query.from_dict(query_dict)
+        matches = query.compile()
 
-        for cred in credentials:
-            if self._matches_credential(cred, query):
-                # Generate semantic slug from credential attributes
-                attrs = cred.get("a", {})
-                slug_source = " ".join([
-                    str(attrs.get("title", "")),
-                    str(attrs.get("summary", "")),
-                    str(attrs.get("name", "")),
-                    str(attrs.get("type", "")),
-                ])
-                slug = generate_semantic_slug(slug_source, max_words=3) if slug_source.strip() else ""
+        positions = self._candidates(credentials, query)
+        if positions is not None:
+            credentials = [credentials[pos] for pos in positions]
 
+        for cred in credentials:
+            if matches(cred):
                 yield QueryResult(
                     credential=cred,
                     schema_said=cred.get("s", ""),
@@ -171,28 +383,12 @@ class QueryEngine:
                         f: op.operator_name
                         for f, op in query.field_conditions.items()
                     },
-                    slug=slug,
+                    slug=None,  # Generated on first display
                 )
 
     def _matches_credential(self, credential: dict, query: Query) -> bool:
         """Check if credential matches query conditions."""
-        # Schema filter
-        if query.schema and credential.get("s") != query.schema:
-            return False
-
-        # Issuer filter
-        if query.issuer and credential.get("i") != query.issuer:
-            return False
-
-        # Field conditions
-        attrs = credential.get("a", {})
-
-        for field_name, operator in query.field_conditions.items():
-            value = self._get_field_value(attrs, field_name)
-            if value is None or not operator.matches(value):
-                return False
-
-        return True
+        return query.compile()(credential)
 
     def _get_field_value(self, attrs: dict, field_name: str) -> Any:
         """
@@ -205,18 +401,7 @@ class QueryEngine:
         Returns:
             Field value or None
         """
-        if "." not in field_name:
-            return attrs.get(field_name)
-
-        # Navigate nested path
-        parts = field_name.split(".")
-        current = attrs
-        for part in parts:
-            if isinstance(current, dict):
-                current = current.get(part)
-            else:
-                return None
-        return current
+        return _field_value(attrs, field_name)
 
     def explain(self, query_dict: dict) -> dict:
         """
@@ -228,7 +413,7 @@ class QueryEngine:
         Returns:
             Explanation dict with index usage info
         """
-        query = Query.from_dict(query_dict.copy())
+        query = Query.from_dict(query_dict)
 
         plan = {
             "schema_filter": query.schema,
@@ -256,6 +441,14 @@ class QueryEngine:
                         })
                         break
 
+            # Posting-list size when the credential index can answer it
+            index = self._postings.get(field_name)
+            if index is not None and isinstance(operator, Eq):
+                try:
+                    condition["posting_size"] = len(index.get(operator.value, ()))
+                except TypeError:
+                    pass
+
         return plan
 
 
@@ -18,7 +18,8 @@ Example query structure:
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
 
 class QueryOperator(ABC):
@@ -28,8 +29,13 @@ class QueryOperator(ABC):
     Each operator knows:
     - How to match a value in-memory
     - How to generate an index key for range scans
+
+    Operators are immutable, so parse_query_value() can share one
+    instance between queries.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def matches(self, value: Any) -> bool:
         """Check if a value matches this operator's condition."""
@@ -52,7 +58,7 @@ class QueryOperator(ABC):
         ...
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Eq(QueryOperator):
     """
     Equality operator.
@@ -74,7 +80,7 @@ class Eq(QueryOperator):
         return "$eq"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Begins(QueryOperator):
     """
     Prefix match operator.
@@ -109,7 +115,7 @@ class Begins(QueryOperator):
         return "$begins"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Lt(QueryOperator):
     """
     Less than operator.
@@ -134,7 +140,7 @@ class Lt(QueryOperator):
         return "$lt"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Gt(QueryOperator):
     """
     Greater than operator.
@@ -159,7 +165,7 @@ class Gt(QueryOperator):
         return "$gt"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Lte(QueryOperator):
     """
     Less than or equal operator.
@@ -184,7 +190,7 @@ class Lte(QueryOperator):
         return "$lte"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Gte(QueryOperator):
     """
     Greater than or equal operator.
@@ -209,7 +215,7 @@ class Gte(QueryOperator):
         return "$gte"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Contains(QueryOperator):
     """
     Substring match operator.
@@ -256,22 +262,50 @@ def parse_query_value(field_value: Any) -> QueryOperator:
     """
     # Direct value = equality
     if not isinstance(field_value, dict):
-        return Eq(value=field_value)
+        return _operator_for("$eq", field_value)
 
-    # Explicit operator
-    operators = {
-        "$eq": lambda v: Eq(value=v),
-        "$begins": lambda v: Begins(prefix=v),
-        "$lt": lambda v: Lt(value=v),
-        "$gt": lambda v: Gt(value=v),
-        "$lte": lambda v: Lte(value=v),
-        "$gte": lambda v: Gte(value=v),
-        "$contains": lambda v: Contains(substring=v),
-    }
+    # Explicit operator: the common single-key form is one table lookup
+    if len(field_value) == 1:
+        ((op_name, value),) = field_value.items()
+        if op_name in _QUERY_OPERATORS:
+            return _operator_for(op_name, value)
+        return Eq(value=field_value)
 
-    for op_name, constructor in operators.items():
+    for op_name, constructor in _QUERY_OPERATORS.items():
         if op_name in field_value:
             return constructor(field_value[op_name])
 
     # Default to equality if unknown structure
     return Eq(value=field_value)
+
+
+def _operator_for(op_name: str, value: Any) -> QueryOperator:
+    """Build the operator for op_name, sharing instances for hashable values."""
+    try:
+        return _cached_operator(op_name, value)
+    except TypeError:  # Unhashable value (list, dict, ...)
+        return _QUERY_OPERATORS[op_name](value)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _cached_operator(op_name: str, value: Any) -> QueryOperator:
+    """
+    Operator for op_name and a hashable value, built once per distinct pair.
+
+    typed=True keeps equal values of different types apart, so 1, 1.0
+    and True each get their own operator.
+    """
+    return _QUERY_OPERATORS[op_name](value)
+
+
+# Query operator names -> constructors, in precedence order for dicts that
+# name more than one operator
+_QUERY_OPERATORS: dict[str, Callable[[Any], QueryOperator]] = {
+    "$eq": lambda v: Eq(value=v),
+    "$begins": lambda v: Begins(prefix=v),
+    "$lt": lambda v: Lt(value=v),
+    "$gt": lambda v: Gt(value=v),
+    "$lte": lambda v: Lte(value=v),
+    "$gte": lambda v: Gte(value=v),
+    "$contains": lambda v: Contains(substring=v),
+}
@@ -5,6 +5,7 @@ Parses KGQL query strings into AST nodes that can be translated
 to keripy method calls.
 """
 
+import sys
 from typing import Optional
 
 from lark import Lark, Transformer, v_args, Token
@@ -166,6 +167,11 @@ class KGQLTransformer(Transformer):
         for item in items:
             if isinstance(item, tuple) and len(item) == 3:
                 variable, edge_type, op = item
+        if edge_type:
+            # Edge types come from a small vocabulary and key governance
+            # rule lookups on every traversed edge; interned strings let
+            # those dict lookups hit the identity fast path
+            edge_type = sys.intern(edge_type)
         return EdgePattern(
             variable=variable,
             edge_type=edge_type,
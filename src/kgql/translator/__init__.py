@@ -1,10 +1,19 @@
 """KGQL Translator module - Maps AST to keripy method calls."""
 
-from kgql.translator.planner import ExecutionPlan, QueryPlanner, plan_query, MethodType
+from kgql.translator.planner import (
+    ExecutionPlan,
+    QueryPlanner,
+    plan_query,
+    MethodType,
+    ResultShape,
+)
+from kgql.translator.catalog import Catalog
 
 __all__ = [
     "ExecutionPlan",
     "QueryPlanner",
     "plan_query",
     "MethodType",
+    "ResultShape",
+    "Catalog",
 ]
@@ -0,0 +1,117 @@
+"""
+KGQL Catalog - Cardinality estimates for Reger index keys.
+
+The planner cannot know how many credentials an index key selects: plans
+are cached per query string and keys are usually $variables. The executor
+asks the Catalog instead, once values are bound, to pick the cheapest of
+the access paths the planner offered.
+
+Counts are sampled from the index itself (no credential is loaded) and
+cached for a short TTL, so repeated queries do not re-count hot keys.
+Callers that only need to know whether a key is below some size pass a
+limit, so a huge posting list is never walked in full.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class Catalog:
+    """
+    Bounded TTL cache of per-key index cardinalities.
+
+    Usage:
+        catalog = Catalog(reger_wrapper.count)
+        rows = catalog.estimate("issus", "EAID...")
+    """
+
+    def __init__(
+        self,
+        counter: Callable[[str, str, Optional[int]], int],
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        max_entries: int = 4096,
+    ):
+        """
+        Initialize the catalog.
+
+        Args:
+            counter: Function (index_name, key, limit) -> number of index
+                entries, counting no further than limit when it is not None
+            ttl: Seconds a sampled count stays valid (0 disables caching)
+            clock: Monotonic time source (overridable for tests)
+            max_entries: Maximum number of sampled counts kept; the least
+                recently used are dropped first
+        """
+        self._counter = counter
+        self._ttl = ttl
+        self._clock = clock
+        self._max_entries = max_entries
+        # (index_name, key) -> (sampled at, count, exact), in LRU order; an
+        # inexact count stopped at its limit and is only a lower bound
+        self._counts: OrderedDict[tuple[str, str], tuple[float, int, bool]] = OrderedDict()
+        self._lock = threading.Lock()  # KGQL may estimate from worker threads
+
+    def estimate(self, index_name: str, key: str, limit: Optional[int] = None) -> int:
+        """
+        Estimate the number of rows an index seek will produce.
+
+        Args:
+            index_name: Reger index name (issus, subjs, schms)
+            key: Index key to look up
+            limit: Stop counting after this many entries (None counts all)
+
+        Returns:
+            Number of entries under the key; at least limit (but possibly
+            no more) when the key has limit entries or more
+        """
+        now = self._clock()
+        cache_key = (index_name, key)
+        with self._lock:
+            cached = self._counts.get(cache_key)
+            if cached is not None and now - cached[0] < self._ttl:
+                _, rows, exact = cached
+                if exact or (limit is not None and rows >= limit):
+                    self._counts.move_to_end(cache_key)
+                    return rows
+
+        # Sampled outside the lock; concurrent misses may both count
+        rows = self._counter(index_name, key, limit)
+        exact = limit is None or rows < limit
+        if self._ttl > 0 and self._max_entries > 0:
+            with self._lock:
+                self._counts[cache_key] = (now, rows, exact)
+                self._counts.move_to_end(cache_key)
+                if len(self._counts) > self._max_entries:
+                    self._counts.popitem(last=False)
+        return rows
+
+    def pick_best(self, paths: list[dict]) -> Optional[dict]:
+        """
+        Choose the access path with the smallest estimated output.
+
+        Args:
+            paths: Candidate index-step args, each with "index" and "keys"
+
+        Each later candidate is counted only up to the best estimate so
+        far, since a path with at least that many rows cannot win.
+
+        Returns:
+            The cheapest path (the first on ties), or None if paths is empty
+        """
+        best = None
+        best_rows = None
+        for path in paths:
+            rows = self.estimate(path["index"], path["keys"], best_rows)
+            if best_rows is None or rows < best_rows:
+                best, best_rows = path, rows
+                if rows == 0:
+                    break
+        return best
+
+    def invalidate(self) -> None:
+        """Drop all sampled counts."""
+        with self._lock:
+            self._counts.clear()
@@ -11,7 +11,7 @@ Translation Map:
     VERIFY → Verifier.verifyChain
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Any, Callable, Optional, Union
 
@@ -37,18 +37,53 @@ class MethodType(Enum):
     FRAMEWORK_LOAD = "framework_load"  # load governance framework by SAID
 
 
+class ResultShape(Enum):
+    """What a step's output looks like to the result builder."""
+    SAIDS = "saids"  # iterable of credential SAIDs
+    PAIRS = "pairs"  # iterable of (creder, proof) tuples
+    CRED = "cred"    # a single object with a .said (or None)
+    NONE = "none"    # contributes no result rows
+
+
+# Output shape produced by the executor for each method type
+_RESULT_SHAPES = {
+    MethodType.REGER_INDEX: ResultShape.SAIDS,
+    MethodType.REGER_CLONE: ResultShape.CRED,
+    MethodType.REGER_SOURCES: ResultShape.PAIRS,
+    MethodType.VERIFIER_CHAIN: ResultShape.CRED,
+    MethodType.KEVER_STATE: ResultShape.NONE,
+    MethodType.FRAMEWORK_LOAD: ResultShape.NONE,
+}
+
+
+# Method types whose execution reads nothing from earlier steps. Framework
+# loads and sources traversals feed or consume shared execution state.
+_INDEPENDENT_METHODS = frozenset({
+    MethodType.REGER_INDEX,
+    MethodType.REGER_CLONE,
+    MethodType.VERIFIER_CHAIN,
+})
+
+
 @dataclass
 class PlanStep:
     """
     A single step in the execution plan.
 
-    Each step maps to exactly one keripy method call.
+    Each step maps to exactly one keripy method call. Its result_shape
+    tells the result builder how to read the output without inspecting
+    it; it defaults from method_type.
     """
     method_type: MethodType
     method_name: str
     args: dict[str, Any] = field(default_factory=dict)
     depends_on: list[int] = field(default_factory=list)  # indices of prior steps
     result_key: str = ""  # key to store result for later steps
+    result_shape: Optional[ResultShape] = None
+
+    def __post_init__(self):
+        if self.result_shape is None:
+            self.result_shape = _RESULT_SHAPES[self.method_type]
 
 
 @dataclass
@@ -67,6 +102,14 @@ class ExecutionPlan:
     order_by: Optional[str] = None
     order_direction: str = "ASC"
     framework_said: Optional[str] = None  # WITHIN FRAMEWORK SAID
+    # True when no step reads another step's result, so steps may run concurrently
+    parallel_safe: bool = False
+    # Whether any step arg references a $variable (computed on first bind)
+    has_variables: Optional[bool] = field(default=None, repr=False, compare=False)
+    # Compiled filter predicates keyed by frozen filter spec (filled by the executor)
+    compiled_filters: dict[tuple, Callable[[Any], bool]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     def add_step(self, step: PlanStep) -> int:
         """Add a step and return its index."""
@@ -74,6 +117,108 @@ class ExecutionPlan:
         self.steps.append(step)
         return step_idx
 
+    def bind(self, variables: dict[str, Any]) -> "ExecutionPlan":
+        """
+        Substitute $variable references in step args with their values.
+
+        Plans are cached per query string, so binding happens once per
+        execution instead of rebuilding args for every step. Nested args
+        (residual filters, access paths) are bound too. Unknown variables
+        are left as their "$name" string.
+
+        Args:
+            variables: Variable name -> value (without the leading $)
+
+        Returns:
+            A copy of the plan with bound args, or this plan itself when no
+            arg references a variable
+        """
+        # Literal-only plans (the common cached case) skip the walk entirely
+        if self.has_variables is None:
+            self.has_variables = any(_references_variable(step.args) for step in self.steps)
+        if not self.has_variables:
+            return self
+
+        steps = [
+            step if args is step.args else replace(step, args=args)
+            for step in self.steps
+            for args in (_bind_value(step.args, variables),)
+        ]
+        if all(bound is step for bound, step in zip(steps, self.steps)):
+            return self
+        # Bound values change the filter specs, so compiled filters start fresh
+        return replace(self, steps=steps, compiled_filters={})
+
+
+def _references_variable(value: Any) -> bool:
+    """True if a plan arg is, or contains, a $variable reference."""
+    cls = type(value)
+    if cls is str:
+        return bool(value) and value[0] == "$"
+    if cls is dict:
+        return any(_references_variable(item) for item in value.values())
+    if cls is list:
+        return any(_references_variable(item) for item in value)
+    return False
+
+
+def _bind_value(value: Any, variables: dict[str, Any]) -> Any:
+    """Bind $variables in a plan arg, returning the same object if nothing changed."""
+    # Exact type() checks and a first-character compare are cheaper than
+    # isinstance/startswith, and scalar dict entries are handled inline
+    # without a recursive call.
+    cls = type(value)
+    if cls is str:
+        return variables.get(value[1:], value) if value and value[0] == "$" else value
+
+    if cls is dict:
+        bound = None
+        for key, item in value.items():
+            item_cls = type(item)
+            if item_cls is str:
+                if not item or item[0] != "$":
+                    continue
+                new = variables.get(item[1:], item)
+            elif item_cls is dict or item_cls is list:
+                new = _bind_value(item, variables)
+            else:
+                continue
+            if new is not item:
+                if bound is None:
+                    bound = dict(value)
+                bound[key] = new
+        return value if bound is None else bound
+
+    if cls is list:
+        bound = [_bind_value(item, variables) for item in value]
+        if all(new is item for new, item in zip(bound, value)):
+            return value
+        return bound
+
+    return value
+
+
+# Default fraction of rows passing each comparator, System R style. Values
+# are unknown at plan time (plans are cached and usually parameterized),
+# so only the comparator informs the estimate.
+_SELECTIVITY = {
+    Comparator.EQ: 0.1,
+    Comparator.IN: 0.2,
+    Comparator.LIKE: 0.25,
+    Comparator.CONTAINS: 0.25,
+    Comparator.LT: 1 / 3,
+    Comparator.GT: 1 / 3,
+    Comparator.LE: 1 / 3,
+    Comparator.GE: 1 / 3,
+    Comparator.NE: 0.9,
+}
+
+
+def _estimated_selectivity(condition: Condition) -> float:
+    """Estimated fraction of credentials satisfying a WHERE condition."""
+    selectivity = _SELECTIVITY.get(condition.comparator, 0.5)
+    return 1.0 - selectivity if condition.negated else selectivity
+
 
 class QueryPlanner:
     """
@@ -163,6 +308,11 @@ class QueryPlanner:
             keystate = query.verify.against_keystate or query.keystate_context
             self._plan_verify(query.verify, keystate, plan)
 
+        plan.parallel_safe = len(plan.steps) > 1 and all(
+            not step.depends_on and step.method_type in _INDEPENDENT_METHODS
+            for step in plan.steps
+        )
+
         return plan
 
     def _plan_match(
@@ -205,8 +355,9 @@ class QueryPlanner:
 
         Returns a PlanStep for the appropriate index lookup.
         """
-        if not where or not where.conditions:
-            # No WHERE clause - need full scan (expensive!)
+        conditions = self._node_conditions(node, where)
+        if not conditions:
+            # No WHERE clause on this node - need full scan (expensive!)
             return PlanStep(
                 method_type=MethodType.REGER_INDEX,
                 method_name="getItemIter",
@@ -214,31 +365,39 @@ class QueryPlanner:
                 result_key="all_creds"
             )
 
-        # Find indexed conditions
-        for condition in where.conditions:
-            field_parts = condition.field.split(".")
-            if len(field_parts) >= 2:
-                field_name = field_parts[-1]
-            else:
-                field_name = condition.field
-
-            # Map field to index
-            node_type = node.node_type if node else "Credential"
-            index_key = (node_type, field_name)
-
-            if index_key in self._index_map:
-                index_info = self._index_map[index_key]
-                if index_info:
-                    index_name, method = index_info
-                    return PlanStep(
-                        method_type=MethodType.REGER_INDEX,
-                        method_name=method,
-                        args={
-                            "index": index_name,
-                            "keys": self._extract_condition_value(condition),
-                        },
-                        result_key=f"{index_name}_results"
-                    )
+        # Push indexable equalities down into an index seek; the remaining
+        # conditions become a residual filter on its results. When several
+        # equalities are indexable, every choice is kept as an access path
+        # and the executor seeks the one with the lowest estimated cardinality.
+        node_type = node.node_type if node and node.node_type else "Credential"
+        paths = []
+        for i, condition in enumerate(conditions):
+            if condition.comparator != Comparator.EQ or condition.negated:
+                continue
+
+            index_info = self._index_map.get((node_type, self._field_name(condition)))
+            if index_info:
+                index_name, method = index_info
+                path = {
+                    "index": index_name,
+                    "keys": self._extract_condition_value(condition),
+                }
+                residual = conditions[:i] + conditions[i + 1:]
+                if residual:
+                    path["filter"] = self._conditions_to_filter(residual)
+                paths.append((method, path))
+
+        if paths:
+            method, args = paths[0]
+            args = dict(args)
+            if len(paths) > 1:
+                args["access_paths"] = [path for _, path in paths]
+            return PlanStep(
+                method_type=MethodType.REGER_INDEX,
+                method_name=method,
+                args=args,
+                result_key=f"{args['index']}_results"
+            )
 
         # No indexed field found - fall back to scan with filter
         return PlanStep(
@@ -246,7 +405,7 @@ class QueryPlanner:
             method_name="getItemIter",
             args={
                 "index": "creds",
-                "filter": self._conditions_to_filter(where.conditions),
+                "filter": self._conditions_to_filter(conditions),
             },
             result_key="filtered_creds"
         )
@@ -327,11 +486,48 @@ class QueryPlanner:
         """Extract the value from a condition for index lookup."""
         return condition.value
 
+    @staticmethod
+    def _node_conditions(node: Any, where: Optional[Any]) -> list[Condition]:
+        """
+        WHERE conditions that constrain this MATCH node.
+
+        A condition qualified with another pattern variable (b.schema while
+        planning a) belongs to that node, so it is neither a seek key nor a
+        residual filter here. Unqualified conditions, and every condition
+        for a node without a variable, apply.
+        """
+        if not where or not where.conditions:
+            return []
+        variable = node.variable if node else None
+        if not variable:
+            return list(where.conditions)
+        return [
+            condition for condition in where.conditions
+            if "." not in condition.field
+            or condition.field.rsplit(".", 1)[0] == variable
+        ]
+
+    @staticmethod
+    def _field_name(condition: Condition) -> str:
+        """Strip the pattern variable from a condition field (c.issuer -> issuer)."""
+        return condition.field.rsplit(".", 1)[-1]
+
     def _conditions_to_filter(self, conditions: list[Condition]) -> dict:
-        """Convert conditions to a filter dict for non-indexed queries."""
+        """
+        Convert conditions to a filter dict for non-indexed queries.
+
+        Entries are inserted most selective first (by estimated fraction of
+        rows passing), so the compiled predicate rejects most non-matching
+        credentials on its first check. The dict holds one entry per field,
+        so when a field repeats the conditions keep their source order and
+        the last one on each field applies, as it did before reordering.
+        """
+        names = [self._field_name(cond) for cond in conditions]
+        if len(set(names)) == len(names):
+            conditions = sorted(conditions, key=_estimated_selectivity)
         filters = {}
         for cond in conditions:
-            filters[cond.field] = {
+            filters[self._field_name(cond)] = {
                 "op": cond.comparator.value,
                 "value": cond.value,
                 "negated": cond.negated,
@@ -12,13 +12,26 @@ verified by the act of resolution. If a SAID resolves, it's authentic.
 
 from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Callable, Optional
 
 from kgql.parser.ast import EdgeOperator
 from kgql.wrappers.edge_resolver import EdgeRef
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _operators_satisfying(required: EdgeOperator) -> frozenset[EdgeOperator]:
+    """
+    All edge operators at least as strong as ``required``.
+
+    Computed once per filter operator, so path searches test each edge
+    with a set membership check instead of an operator_satisfies() call.
+    """
+    from kgql.governance.checker import operator_satisfies
+    return frozenset(op for op in EdgeOperator if operator_satisfies(op, required))
+
+
+@dataclass(slots=True)
 class PathStep:
     """
     A single step in a trust path.
@@ -47,7 +60,7 @@ class PathStep:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class VerifiedPath:
     """
     A verified trust path between two nodes.
@@ -162,6 +175,7 @@ class TrustPathAnalyzer:
         if self._neighbor_fn is None:
             return []
 
+        accepted = _operators_satisfying(operator_filter) if operator_filter else None
         paths: list[VerifiedPath] = []
         # DFS with path tracking
         stack: list[tuple[str, list[PathStep], set[str]]] = [
@@ -188,10 +202,8 @@ class TrustPathAnalyzer:
                     continue
                 if edge_type_filter and etype != edge_type_filter:
                     continue
-                if operator_filter:
-                    from kgql.governance.checker import operator_satisfies
-                    if not operator_satisfies(op, operator_filter):
-                        continue
+                if accepted is not None and op not in accepted:
+                    continue
 
                 step = PathStep(
                     source_said=current,
@@ -238,6 +250,8 @@ class TrustPathAnalyzer:
                 steps=[], root_said=root_said, target_said=target_said,
             )
 
+        accepted = _operators_satisfying(operator_filter) if operator_filter else None
+
         # BFS
         queue: deque[tuple[str, list[PathStep], set[str]]] = deque()
         queue.append((root_said, [], {root_said}))
@@ -254,10 +268,8 @@ class TrustPathAnalyzer:
                     continue
                 if edge_type_filter and etype != edge_type_filter:
                     continue
-                if operator_filter:
-                    from kgql.governance.checker import operator_satisfies
-                    if not operator_satisfies(op, operator_filter):
-                        continue
+                if accepted is not None and op not in accepted:
+                    continue
 
                 step = PathStep(
                     source_said=current,
@@ -9,16 +9,27 @@ All methods delegate directly to existing Reger methods:
     - by_subject() -> reger.subjs.getIter()
     - by_schema() -> reger.schms.getIter()
     - resolve() -> reger.creds.get() + deserialization
+    - iter_creds() -> reger.creds.getItemIter() + deserialization
+    - by_index() -> one of the above, by index name
+    - count() -> len of reger.<index>.getIter()
     - traverse_sources() -> reger.sources()
 """
 
+import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from itertools import islice
 from typing import Any, Iterator, Optional, TYPE_CHECKING
 
+from keri.core.serdering import SerderACDC
+
 if TYPE_CHECKING:
     from keri.vdr.viring import Reger
     from keri.db.basing import Baser
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CredentialResult:
@@ -34,6 +45,12 @@ class CredentialResult:
     schema: Optional[str] = None
     raw: Optional[Any] = None  # The actual Creder or raw credential
 
+    @property
+    def data(self) -> dict:
+        """Credential attributes (the ACDC 'a' section), or {} if unavailable."""
+        attrib = getattr(self.raw, "attrib", None)
+        return attrib if isinstance(attrib, dict) else {}
+
     @classmethod
     def from_creder(cls, creder: Any) -> "CredentialResult":
         """Create from a keripy Creder instance."""
@@ -59,14 +76,20 @@ class RegerWrapper:
         cred = wrapper.resolve("ESAID...")
     """
 
-    def __init__(self, reger: "Reger"):
+    def __init__(self, reger: "Reger", cache_size: int = 4096):
         """
         Initialize with a keripy Reger instance.
 
         Args:
             reger: The keripy Reger instance to wrap
+            cache_size: Maximum number of resolved credentials kept in memory
+                (0 disables the cache). Credentials are content-addressed by
+                SAID, so a cached entry never goes stale; misses are not cached.
         """
         self._reger = reger
+        self._cache: OrderedDict[str, CredentialResult] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()  # KGQL may resolve from worker threads
 
     @property
     def reger(self) -> "Reger":
@@ -118,11 +141,48 @@ class RegerWrapper:
         for saider in self._reger.schms.getIter(keys=schema_said):
             yield saider.qb64 if hasattr(saider, 'qb64') else str(saider)
 
+    def by_index(self, index_name: str, key: str) -> Iterator[str]:
+        """
+        Get credential SAIDs from a secondary index by name.
+
+        Args:
+            index_name: One of "issus", "subjs", "schms"
+            key: The index key (AID or schema SAID)
+
+        Yields:
+            Credential SAIDs stored under the key
+        """
+        for saider in getattr(self._reger, index_name).getIter(keys=key):
+            yield saider.qb64 if hasattr(saider, 'qb64') else str(saider)
+
+    def count(self, index_name: str, key: str, limit: Optional[int] = None) -> int:
+        """
+        Count the entries under a key of a secondary index.
+
+        Only index entries are walked; no credential is loaded.
+
+        Args:
+            index_name: One of "issus", "subjs", "schms"
+            key: The index key (AID or schema SAID)
+            limit: Stop after this many entries (None counts all)
+
+        Returns:
+            Number of credential SAIDs stored under the key, capped at
+            limit (0 for an empty key, which LMDB cannot look up)
+        """
+        if not key:
+            return 0
+        entries = getattr(self._reger, index_name).getIter(keys=key)
+        if limit is not None:
+            entries = islice(entries, limit)
+        return sum(1 for _ in entries)
+
     def resolve(self, said: str) -> Optional[CredentialResult]:
         """
         Resolve a credential by SAID.
 
-        Wraps reger.creds.get() and returns credential data.
+        Wraps reger.creds.get() and returns credential data. Successful
+        lookups are served from an LRU cache on subsequent calls.
 
         Args:
             said: The credential SAID to resolve
@@ -130,6 +190,12 @@ class RegerWrapper:
         Returns:
             CredentialResult or None if not found
         """
+        with self._cache_lock:
+            cached = self._cache.get(said)
+            if cached is not None:
+                self._cache.move_to_end(said)
+                return cached
+
         try:
             # Get credential from Reger
             # Returns SerderACDC directly when stored via creds.put()
@@ -137,29 +203,59 @@ class RegerWrapper:
             if raw is None:
                 return None
 
-            # Handle different return types from creds.get()
-            from keri.core.serdering import SerderACDC
-            if isinstance(raw, SerderACDC):
-                # Already a SerderACDC, use directly
-                creder = raw
-            elif isinstance(raw, bytes):
-                # Raw bytes, deserialize
-                creder = SerderACDC(raw=raw)
-            elif hasattr(raw, 'raw'):
-                # Has raw attribute, deserialize from that
-                creder = SerderACDC(raw=raw.raw)
-            else:
-                # Unknown type, try to use as-is
-                creder = raw
-
-            return CredentialResult.from_creder(creder)
+            result = CredentialResult.from_creder(self._to_creder(raw))
 
         except Exception as e:
             # Log exception for debugging (silent failures are bad)
-            import logging
-            logging.getLogger(__name__).debug(f"Failed to resolve {said[:16]}...: {e}")
+            logger.debug(f"Failed to resolve {said[:16]}...: {e}")
             return None
 
+        if self._cache_size > 0:
+            with self._cache_lock:
+                self._cache[said] = result
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+
+        return result
+
+    def clear_cache(self) -> None:
+        """Drop all cached credential resolutions."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def iter_creds(self) -> Iterator[CredentialResult]:
+        """
+        Iterate over every stored credential.
+
+        Wraps reger.creds.getItemIter(). Each value yielded by the store is
+        deserialized in place, so callers scanning the whole store do not
+        need a second creds.get() per SAID.
+
+        Yields:
+            CredentialResult for each credential that can be deserialized
+        """
+        for keys, raw in self._reger.creds.getItemIter():
+            try:
+                yield CredentialResult.from_creder(self._to_creder(raw))
+            except Exception as e:
+                logger.debug(f"Skipping unreadable credential {keys}: {e}")
+
+    @staticmethod
+    def _to_creder(raw: Any) -> Any:
+        """Normalize a value returned by the creds store into a SerderACDC."""
+        # Handle different return types from creds.get()
+        if isinstance(raw, SerderACDC):
+            # Already a SerderACDC, use directly
+            return raw
+        elif isinstance(raw, bytes):
+            # Raw bytes, deserialize
+            return SerderACDC(raw=raw)
+        elif hasattr(raw, 'raw'):
+            # Has raw attribute, deserialize from that
+            return SerderACDC(raw=raw.raw)
+        # Unknown type, try to use as-is
+        return raw
+
     def traverse_sources(self, db: "Baser", said: str) -> Iterator[tuple[Any, bytes]]:
         """
         Traverse credential chain using sources().
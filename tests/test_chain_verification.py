@@ -451,6 +451,36 @@ class TestTraverseDelegator:
         # Metadata indicates KEL-anchored
         assert result.metadata.get("kel_anchored") is True
 
+    def test_traverse_delegator_looks_up_event_directly(
+        self, kgql_with_delegator, mock_hby_with_master
+    ):
+        """Test the anchoring event is fetched by key, not by scanning the KEL."""
+        kel_event = Mock(said="EKEL_EVENT_SAID")
+        mock_hby_with_master.db.getEvt = Mock(return_value=kel_event)
+
+        result = kgql_with_delegator.traverse_delegator("ESESSION_CRED_KEL")
+
+        mock_hby_with_master.db.getEvt.assert_called_once_with(
+            "EMASTER_AID_PREFIX", "EKEL_EVENT_SAID"
+        )
+        mock_hby_with_master.db.getKelIter.assert_not_called()
+        assert result.first.data["kel_verified"] is True
+
+    def test_verify_chain_resolves_each_credential_once(self, kgql_with_delegator):
+        """Test the end-to-end walk does not re-resolve the session credential."""
+        resolved = []
+        mock_resolve = kgql_with_delegator.resolve
+
+        def counting_resolve(said):
+            resolved.append(said)
+            return mock_resolve(said)
+
+        kgql_with_delegator.resolve = counting_resolve
+
+        kgql_with_delegator.verify_end_to_end_chain("ETURN_SAID")
+
+        assert resolved == ["ETURN_SAID", "ESESSION_CRED_KEL"]
+
     def test_traverse_delegator_seal_only(self, kgql_with_delegator):
         """
         Test traversing delegator edge with seal-only delegation (fallback).
@@ -527,3 +557,18 @@ class TestTraverseDelegator:
         assert result is not None
         assert result.metadata.get("valid") is False
         assert "session" in result.metadata.get("error", "").lower()
+
+
+class TestEdgePathDigging:
+    """Tests for the _dig nested-edge accessor."""
+
+    def test_follows_nested_path(self):
+        from kgql.api.kgql import _dig, _SESSION_EDGE_SAID
+        data = {"e": {"session": {"d": "ESESSION"}}}
+        assert _dig(data, _SESSION_EDGE_SAID) == "ESESSION"
+
+    def test_missing_or_non_dict_hop_is_none(self):
+        from kgql.api.kgql import _dig, _SESSION_EDGE_SAID
+        assert _dig({}, _SESSION_EDGE_SAID) is None
+        assert _dig({"e": "not-a-dict"}, _SESSION_EDGE_SAID) is None
+        assert _dig(b"raw-bytes", _SESSION_EDGE_SAID) is None
@@ -91,6 +91,26 @@ class TestGraphNode:
         with pytest.raises(AttributeError):
             node.said = "CHANGED"
 
+    def test_node_attributes_stored_as_dict(self):
+        """Test that attributes are kept as a dict and left out of the hash."""
+        attrs = {"lei": "549300EXAMPLE"}
+        node = GraphNode(said="ESAID", node_type=NodeType.CREDENTIAL, attributes=attrs)
+        legacy = GraphNode(
+            said="ESAID",
+            node_type=NodeType.CREDENTIAL,
+            attributes=(("lei", "549300EXAMPLE"),),
+        )
+
+        assert node.attributes is attrs
+        assert node.to_dict()["attributes"] is attrs
+        assert legacy == node
+        assert hash(legacy) == hash(node)
+
+    def test_node_has_no_instance_dict(self):
+        """Test that nodes use slots instead of a per-instance __dict__."""
+        node = GraphNode(said="ESAID", node_type=NodeType.CREDENTIAL)
+        assert not hasattr(node, "__dict__")
+
     def test_node_to_dict(self):
         """Test node serialization to dict."""
         node = GraphNode(
@@ -103,6 +123,23 @@ class TestGraphNode:
         assert d["type"] == "credential"
         assert d["issuer"] == "EAID"
 
+    def test_node_to_dict_optional_fields(self):
+        """Test that empty fields are omitted but a zero sequence is kept."""
+        node = GraphNode(
+            said="ESAID",
+            node_type=NodeType.CREDENTIAL,
+            attributes=(("role", "admin"),),
+            key_state_seq=0,
+            registry="EREG",
+        )
+        assert node.to_dict() == {
+            "said": "ESAID",
+            "type": "credential",
+            "registry": "EREG",
+            "key_state_seq": 0,
+            "attributes": {"role": "admin"},
+        }
+
 
 class TestGraphEdge:
     """Tests for GraphEdge dataclass."""
@@ -221,6 +258,46 @@ class TestPropertyGraph:
         assert len(edges) == 1
         assert edges[0].source_said == "ESAID2"
 
+    def test_bulk_add_nodes_and_edges(self):
+        """Test that bulk adds match per-item adds, including edge indexes."""
+        g = PropertyGraph()
+        g.add_nodes(GraphNode(said=s, node_type=NodeType.CREDENTIAL) for s in ("E1", "E2"))
+        g.add_edges(
+            GraphEdge(source_said="E1", target_said=t, edge_type="acdc") for t in ("E2", "E3")
+        )
+
+        assert list(g.nodes) == ["E1", "E2"]
+        assert g.edge_count() == 2
+        assert [e.target_said for e in g.get_edges_from("E1")] == ["E2", "E3"]
+        assert len(g.get_edges_to("E3")) == 1
+
+    def test_node_columns_follow_nodes(self, sample_graph):
+        """Test the column view matches nodes, including direct replacement."""
+        cols = sample_graph.node_columns()
+        assert cols["said"] == list(sample_graph.nodes)
+        assert cols["node_type"] == [n.node_type for n in sample_graph.nodes.values()]
+
+        sample_graph.add_node(GraphNode(said="ENEW", node_type=NodeType.SCHEMA))
+        assert sample_graph.node_columns()["said"][-1] == "ENEW"
+
+        sample_graph.nodes["ENEW"] = GraphNode(
+            said="ENEW", node_type=NodeType.FRAMEWORK, label="Replaced"
+        )
+        cols = sample_graph.node_columns()
+        assert cols["node_type"][-1] == NodeType.FRAMEWORK
+        assert cols["label"][-1] == "Replaced"
+        assert PropertyGraph().node_columns()["said"] == []
+
+    def test_edge_indexes_built_from_constructor(self):
+        """Test that edges passed to the constructor are indexed."""
+        edge = GraphEdge(source_said="ESAID1", target_said="ESAID2", edge_type="acdc")
+        g = PropertyGraph(edges=[edge])
+        g.add_edge(GraphEdge(source_said="ESAID1", target_said="ESAID3", edge_type="acdc"))
+
+        assert [e.target_said for e in g.get_edges_from("ESAID1")] == ["ESAID2", "ESAID3"]
+        assert g.get_edges_to("ESAID2") == [edge]
+        assert g.get_edges_from("EMISSING") == []
+
     def test_to_dict(self, sample_graph):
         """Test full graph serialization."""
         d = sample_graph.to_dict()
@@ -229,6 +306,52 @@ class TestPropertyGraph:
         assert d["stats"]["node_count"] == 3
         assert d["stats"]["edge_count"] == 2
 
+    def test_iter_node_and_edge_dicts(self, sample_graph):
+        """Test that streamed node/edge dicts match to_dict entries."""
+        d = sample_graph.to_dict()
+        nodes = sample_graph.iter_node_dicts()
+        assert next(nodes) == d["nodes"][0]
+        assert list(sample_graph.iter_edge_dicts()) == d["edges"]
+
+    def test_to_json_bytes_round_trips(self, sample_graph, monkeypatch):
+        """Test compact JSON encoding with and without msgspec."""
+        import json
+        import kgql.export.graph as graph_module
+
+        encoded = sample_graph.to_json_bytes()
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == sample_graph.to_dict()
+
+        monkeypatch.setattr(graph_module, "HAS_MSGSPEC", False)
+        assert sample_graph.to_json_bytes() == json.dumps(
+            sample_graph.to_dict(), separators=(",", ":"), ensure_ascii=False
+        ).encode()
+
+    def test_to_json_bytes_falls_back_when_msgspec_refuses(self, sample_graph, monkeypatch):
+        """Test values msgspec cannot encode go through json.dumps."""
+        import json
+        import kgql.export.graph as graph_module
+
+        msgspec = pytest.importorskip("msgspec")
+        sample_graph.metadata["big"] = 2**70
+
+        def refuse(data):
+            raise OverflowError("Integer value out of range")
+
+        monkeypatch.setattr(msgspec.json, "encode", refuse)
+        monkeypatch.setattr(graph_module, "HAS_MSGSPEC", True)
+        encoded = sample_graph.to_json_bytes()
+        assert json.loads(encoded)["metadata"]["big"] == 2**70
+
+    def test_iter_json_matches_to_dict(self, sample_graph):
+        """Test that streamed JSON equals dumping the full dict."""
+        import json
+
+        sample_graph.metadata["query"] = {"count": 3}
+        assert "".join(sample_graph.iter_json()) == json.dumps(sample_graph.to_dict())
+        assert "".join(PropertyGraph().iter_json()) == json.dumps(PropertyGraph().to_dict())
+
+
 
 class TestPropertyGraphFromCredentials:
     """Tests for PropertyGraph.from_credentials() factory method."""
@@ -276,6 +399,98 @@ class TestPropertyGraphFromCredentials:
         assert graph.has_node("ESAID2")
 
 
+    def test_edge_types_are_interned(self):
+        """Test that edges of the same type share one edge_type string."""
+        credentials = [
+            {"d": f"ESAID{i}", "e": {"".join(["ac", "dc"]): {"d": "ETARGET"}}}
+            for i in range(3)
+        ]
+        graph = PropertyGraph.from_credentials(credentials)
+
+        first, *rest = (edge.edge_type for edge in graph.edges)
+        assert first == "acdc"
+        assert all(edge_type is first for edge_type in rest)
+
+
+class TestPropertyGraphFromQueryResult:
+    """Tests for PropertyGraph.from_query_result factory method."""
+
+    def test_implicit_nodes_only_for_unresolved_references(self):
+        """Test that result items win over implicit nodes for referenced SAIDs."""
+        from kgql.api.kgql import QueryResult, QueryResultItem
+
+        result = QueryResult(items=[
+            QueryResultItem(said="ESAID1", data={
+                "i": "EAID1",
+                "s": "ESCHEMA1",
+                "e": {"acdc": {"d": "ESAID2"}, "parent": {"d": "ESAID3"}},
+            }),
+            QueryResultItem(said="ESAID2", data={"i": "EAID1", "a": {"n": 1}}),
+        ])
+
+        graph = PropertyGraph.from_query_result(result)
+
+        assert list(graph.nodes) == ["ESAID1", "ESAID2", "ESAID3", "EAID1", "ESCHEMA1"]
+        assert graph.get_node("ESAID2").attributes == {"n": 1}
+        assert graph.get_node("ESAID3").label == "Referenced by parent"
+        assert graph.get_node("EAID1").node_type == NodeType.IDENTIFIER
+        assert graph.get_node("ESCHEMA1").node_type == NodeType.SCHEMA
+        assert graph.edge_count() == 2
+
+
+    def test_long_form_issuer_and_schema_keys(self):
+        """Test that long-form issuer/schema keys still yield implicit nodes."""
+        from kgql.api.kgql import QueryResult, QueryResultItem
+
+        result = QueryResult(items=[
+            QueryResultItem(said="ESAID1", data={"issuer": "EAID1", "schema": "ESCHEMA1"}),
+            QueryResultItem(said="ESAID2", data={"i": "EAID2", "s": "ESCHEMA2"}),
+        ])
+
+        graph = PropertyGraph.from_query_result(result)
+
+        assert [s for s, n in graph.nodes.items() if n.node_type == NodeType.IDENTIFIER] == [
+            "EAID1", "EAID2",
+        ]
+        assert graph.has_node("ESCHEMA1") and graph.has_node("ESCHEMA2")
+
+    def test_duplicate_saids_processed_once(self):
+        """Test that a credential repeated in the result adds one node and its edges once."""
+        from kgql.api.kgql import QueryResult, QueryResultItem
+
+        data = {"i": "EAID1", "e": {"acdc": {"d": "ESAID2"}}}
+        result = QueryResult(items=[
+            QueryResultItem(said="ESAID1", data=data),
+            QueryResultItem(said="ESAID1", data=data),
+        ])
+
+        graph = PropertyGraph.from_query_result(result)
+
+        assert graph.edge_count() == 1
+        assert list(graph.nodes) == ["ESAID1", "ESAID2", "EAID1"]
+
+class TestPropertyGraphFromVerifiedPath:
+    """Tests for PropertyGraph.from_verified_path() factory method."""
+
+    def test_nodes_and_operator_strings(self):
+        """Test that shared SAIDs become one node and operators serialize to strings."""
+        from types import SimpleNamespace
+        from unittest.mock import Mock
+
+        i2i = Mock(value="I2I")
+        steps = [
+            SimpleNamespace(source_said="EA", target_said="EB", edge_type="acdc", operator=i2i),
+            SimpleNamespace(source_said="EB", target_said="EC", edge_type="acdc", operator=i2i),
+            SimpleNamespace(source_said="EC", target_said="EA", edge_type="parent", operator="NI2I"),
+        ]
+        path = SimpleNamespace(root_said="EA", target_said="EC", depth=3, steps=steps)
+
+        graph = PropertyGraph.from_verified_path(path)
+
+        assert list(graph.nodes) == ["EA", "EB", "EC"]
+        assert [e.operator for e in graph.edges] == ["I2I", "I2I", "NI2I"]
+        assert graph.metadata["path"] == {"root": "EA", "target": "EC", "depth": 3}
+
 class TestNodeType:
     """Tests for NodeType enum."""
 
@@ -132,6 +132,20 @@ class TestExportPropertyGraphJson:
         assert json1 == json2
 
 
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_export_json_matches_stdlib_bytes(self, sample_graph, indent):
+        """Test output is exactly json.dumps of the exported dict."""
+        sample_graph.add_node(GraphNode(
+            said="EUNICODE", node_type=NodeType.CREDENTIAL,
+            label="Zoë", attributes={"big": 2 ** 70, "ratio": 1e16},
+        ))
+
+        expected = json.dumps(
+            export_property_graph(sample_graph), indent=indent, sort_keys=True
+        )
+        assert export_property_graph_json(sample_graph, indent=indent) == expected
+        assert "\\u00eb" in expected
+
 class TestLoadPropertyGraphJson:
     """Tests for load_property_graph_json()."""
 
@@ -179,6 +193,17 @@ class TestLoadPropertyGraphJson:
 
         assert loaded.metadata == sample_graph.metadata
 
+    def test_load_without_properties(self):
+        """Test nodes and edges without a properties object load with defaults."""
+        loaded = load_property_graph_json(json.dumps({
+            "nodes": [{"id": "E1", "type": "credential"}, {"id": "E2", "type": "credential"}],
+            "edges": [{"source": "E1", "target": "E2", "type": "acdc"}],
+        }))
+
+        a, b = loaded.nodes["E1"], loaded.nodes["E2"]
+        assert a.attributes == {} and a.attributes is not b.attributes
+        assert loaded.get_edges_from("E1")[0].operator == "ANY"
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -6,6 +6,8 @@ Tests export_rdf() and export_rdf_ntriples() for generating
 valid RDF triples.
 """
 
+import io
+
 import pytest
 
 from kgql.export.graph import (
@@ -17,6 +19,8 @@ from kgql.export.graph import (
 from kgql.export.rdf import (
     export_rdf,
     export_rdf_ntriples,
+    export_rdf_to,
+    export_rdf_ntriples_to,
     KERI_NS,
     SAID_URN,
     AID_URN,
@@ -150,6 +154,29 @@ class TestExportRdfNtriples:
         assert "rdf-syntax-ns#type>" in ntriples
 
 
+class TestExportRdfTo:
+    """Tests for the streaming RDF writers."""
+
+    def test_turtle_stream_matches_string(self, sample_graph):
+        """Test export_rdf_to writes exactly what export_rdf returns."""
+        buf = io.StringIO()
+        export_rdf_to(sample_graph, buf)
+        assert buf.getvalue() == export_rdf(sample_graph)
+
+    def test_ntriples_stream_matches_string(self, sample_graph):
+        """Test export_rdf_ntriples_to writes exactly what export_rdf_ntriples returns."""
+        buf = io.StringIO()
+        export_rdf_ntriples_to(sample_graph, buf)
+        assert buf.getvalue() == export_rdf_ntriples(sample_graph)
+
+    def test_unsupported_format(self, sample_graph):
+        """Test the format check happens before anything is written."""
+        buf = io.StringIO()
+        with pytest.raises(ValueError, match="Unsupported RDF format"):
+            export_rdf_to(sample_graph, buf, format="n3")
+        assert buf.getvalue() == ""
+
+
 class TestRdfValidity:
     """Tests for RDF syntax validity."""
 
@@ -230,3 +257,32 @@ class TestEdgeCases:
         turtle = export_rdf(g)
         # Should be sanitized
         assert "keri:my_edge_type" in turtle
+
+    def test_literal_escaping(self):
+        """Test backslash, quote and newline escaping in literals."""
+        from kgql.export.rdf import _turtle_literal, _ntriples_literal
+
+        assert _turtle_literal("plain") == '"plain"'
+        assert _turtle_literal('a\\b"c') == '"a\\\\b\\"c"'
+        assert _ntriples_literal('x"\ny') == '"x\\"\\ny"'
+
+    def test_sanitize_predicate_rules(self):
+        """Test predicate local-name rules directly."""
+        from kgql.export.rdf import _sanitize_predicate
+
+        assert _sanitize_predicate("a-b:c d!") == "a_b_cd"
+        assert _sanitize_predicate("9lives") == "_9lives"
+        assert _sanitize_predicate("größe") == "größe"
+        assert _sanitize_predicate("?!") == "unknown"
+
+    def test_uri_helpers_cached(self, sample_graph):
+        """Test repeated SAIDs and AIDs hit the URI caches."""
+        from kgql.export.rdf import _said_to_uri, _aid_to_uri
+
+        _said_to_uri.cache_clear()
+        _aid_to_uri.cache_clear()
+        export_rdf(sample_graph)
+        export_rdf_ntriples(sample_graph)
+
+        assert _said_to_uri.cache_info().hits > 0
+        assert _aid_to_uri("EAID") == f"<{AID_URN}EAID>"
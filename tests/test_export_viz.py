@@ -6,6 +6,8 @@ Tests export_mermaid(), export_mermaid_subgraph(), and related
 functions for generating valid Mermaid diagrams.
 """
 
+import io
+
 import pytest
 
 from kgql.export.graph import (
@@ -16,6 +18,7 @@ from kgql.export.graph import (
 )
 from kgql.export.visualization import (
     export_mermaid,
+    export_mermaid_to,
     export_mermaid_subgraph,
     _said_short,
     _mermaid_escape_label,
@@ -122,6 +125,17 @@ class TestExportMermaid:
         assert '{{"' in diagram  # Schema
 
 
+class TestExportMermaidTo:
+    """Tests for the streaming Mermaid writer."""
+
+    @pytest.mark.parametrize("colorize", [True, False])
+    def test_stream_matches_string(self, sample_graph, colorize):
+        """Test export_mermaid_to writes exactly what export_mermaid returns."""
+        buf = io.StringIO()
+        export_mermaid_to(sample_graph, buf, direction="TD", colorize=colorize)
+        assert buf.getvalue() == export_mermaid(sample_graph, direction="TD", colorize=colorize)
+
+
 class TestExportMermaidSubgraph:
     """Tests for export_mermaid_subgraph()."""
 
@@ -189,6 +203,11 @@ class TestMermaidEscapeLabel:
         # No &lt; or &gt; within the br tag
         assert "&lt;br/" not in result
 
+    def test_nul_characters_pass_through(self):
+        """Test that NUL characters in input do not collide with escaping."""
+        result = _mermaid_escape_label('a\x00BR\x00<b>"c"')
+        assert result == "a\x00BR\x00&lt;b&gt;&quot;c&quot;"
+
 
 class TestMermaidValidity:
     """Tests for Mermaid syntax validity."""
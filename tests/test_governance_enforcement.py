@@ -39,6 +39,14 @@ class TestGovernanceViolationDetail:
         assert detail.operator_found == "NI2I"
         assert detail.operator_required == "DI2I"
 
+    def test_slots_no_instance_dict(self):
+        """Test that details use slots and still pickle."""
+        import pickle
+
+        detail = GovernanceViolationDetail(rule_name="r1", message="m")
+        assert not hasattr(detail, "__dict__")
+        assert pickle.loads(pickle.dumps(detail)) == detail
+
     def test_to_dict(self):
         """Test serialization to dict."""
         detail = GovernanceViolationDetail(
@@ -48,6 +56,10 @@ class TestGovernanceViolationDetail:
         d = detail.to_dict()
         assert d["rule_name"] == "rule1"
         assert d["message"] == "Violation occurred"
+        assert list(d) == [
+            "rule_name", "message", "edge_type", "operator_found",
+            "operator_required", "source_said", "target_said", "framework_said",
+        ]
 
 
 class TestGovernanceViolation:
@@ -106,6 +118,17 @@ class TestGovernanceViolation:
         assert exc.violations[0].rule_name == "operator_floor"
         assert exc.query_context == "TRAVERSE iss"
 
+    def test_from_check_result_missing_operators(self):
+        """Test that absent operators serialize as empty strings."""
+        mock_violation = Mock(actual_operator=None, required_operator=None)
+        mock_result = Mock(framework_said="EFW", violations=[mock_violation])
+
+        exc = GovernanceViolation.from_check_result(mock_result)
+
+        assert exc.violations[0].operator_found == ""
+        assert exc.violations[0].operator_required == ""
+        assert exc.violations[0].framework_said == "EFW"
+
     def test_to_dict(self):
         """Test serialization to dict."""
         exc = GovernanceViolation(
@@ -120,6 +143,19 @@ class TestGovernanceViolation:
         assert d["framework_said"] == "EFW123"
         assert len(d["violations"]) == 1
 
+    def test_to_dict_reflects_added_violations(self):
+        """Test that violations appended after to_dict() are serialized."""
+        first = Mock()
+        first.to_dict.return_value = {"rule_name": "r1"}
+        exc = GovernanceViolation(message="Violation", violations=[first])
+        assert exc.to_dict()["violations"] == [{"rule_name": "r1"}]
+
+        second = Mock()
+        second.to_dict.return_value = {"rule_name": "r2"}
+        exc.violations.append(second)
+
+        assert exc.to_dict()["violations"] == [{"rule_name": "r1"}, {"rule_name": "r2"}]
+
 
 class TestLoAInsufficientError:
     """Tests for LoAInsufficientError exception."""
@@ -465,3 +465,29 @@ class TestConstraintChecker:
         assert d["allowed"] is False
         assert len(d["violations"]) > 0
         assert d["framework_said"] == vlei_framework.said
+
+
+class TestGovernancePackageExports:
+    """Test the lazy re-export surface of kgql.governance."""
+
+    def test_names_resolve_on_access(self):
+        """Test package-level names resolve to the keri-governance objects."""
+        import kgql.governance as gov
+
+        assert gov.ConstraintChecker is ConstraintChecker
+        assert gov.FrameworkResolver is FrameworkResolver
+        assert "ConstraintChecker" in vars(gov)  # cached after first access
+
+    def test_all_names_resolvable(self):
+        """Test every name in __all__ can be imported."""
+        import kgql.governance as gov
+
+        for name in gov.__all__:
+            assert getattr(gov, name) is not None
+
+    def test_unknown_name_raises(self):
+        """Test unknown attributes raise AttributeError."""
+        import kgql.governance as gov
+
+        with pytest.raises(AttributeError):
+            gov.NoSuchThing
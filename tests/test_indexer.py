@@ -360,6 +360,28 @@ class TestParseQueryValue:
         assert isinstance(op, Contains)
         assert op.substring == "Smith"
 
+    def test_parse_multiple_operators_uses_precedence(self):
+        """Test that a dict naming several operators picks by table order."""
+        op = parse_query_value({"$gte": 1, "$begins": "US"})
+        assert isinstance(op, Begins)
+
+    def test_parse_unknown_operator_is_equality(self):
+        """Test that unknown dict shapes compare the dict itself."""
+        assert parse_query_value({"$regex": "x"}).value == {"$regex": "x"}
+        assert parse_query_value({}).value == {}
+
+    def test_parse_shares_operator_instances(self):
+        """Test repeated hashable values reuse one immutable operator."""
+        assert parse_query_value("Alice") is parse_query_value({"$eq": "Alice"})
+        assert parse_query_value({"$gte": 30}) is parse_query_value({"$gte": 30})
+
+        # Equal values of different types stay distinct
+        assert type(parse_query_value(True).value) is bool
+        assert type(parse_query_value(1).value) is int
+
+        # Unhashable values still parse
+        assert parse_query_value({"$eq": ["a"]}).value == ["a"]
+
 
 # =============================================================================
 # Query Tests
@@ -392,6 +414,38 @@ class TestQuery:
         assert query.issuer == "EISSUER_AID"
         assert isinstance(query.field_conditions["LEI"], Begins)
 
+    def test_from_dict_leaves_input_unchanged(self):
+        """Test parsing does not consume the meta fields."""
+        query_dict = {"-s": "ESCHEMA_SAID", "-i": "EISSUER_AID", "LEI": "US"}
+        query = Query.from_dict(query_dict)
+
+        assert query_dict == {"-s": "ESCHEMA_SAID", "-i": "EISSUER_AID", "LEI": "US"}
+        assert list(query.field_conditions) == ["LEI"]
+
+    def test_query_is_frozen_and_slotted(self):
+        """Test Query is immutable and has no per-instance dict."""
+        import dataclasses
+
+        query = Query.from_dict({"LEI": "US"})
+
+        assert not hasattr(query, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            query.schema = "ESCHEMA_SAID"
+        assert query.compile() is query.compile()
+
+    def test_compile_cached(self, sample_credentials):
+        """Test compiled predicate is built once and matches credentials."""
+        query = Query.from_dict({
+            "-i": "EISSUER_ACME_AID",
+            "address.country": "USA",
+        })
+
+        matches = query.compile()
+        assert query.compile() is matches
+        assert [c["d"] for c in sample_credentials if matches(c)] == [
+            "ECRED_ALICE_SAID",
+        ]
+
 
 # =============================================================================
 # QueryEngine Tests
@@ -539,6 +593,109 @@ class TestQueryEngine:
         # Check index usage for registered schema
         assert len(plan["index_usage"]) >= 1
 
+    def test_query_indexed_credentials(self, person_schema, sample_credentials):
+        """Test $eq conditions use posting lists after index_credentials."""
+        engine = create_query_engine({"EPerson_Schema_SAID": person_schema})
+        engine.index_credentials(sample_credentials)
+
+        query_dict = {
+            "engagementContextRole": "Engineer",
+            "address.country": "USA",
+            "age": {"$gte": 30},
+        }
+        query = Query.from_dict(query_dict)
+        assert engine._candidates(sample_credentials, query) == [0, 2]
+        assert engine._candidates(list(sample_credentials), query) == [0, 2]
+        assert engine._candidates(sample_credentials[::-1], query) is None
+
+        results = list(engine.query(sample_credentials, query_dict))
+        assert [r.said for r in results] == ["ECRED_ALICE_SAID"]
+
+        plan = engine.explain(query_dict)
+        sizes = {c["field"]: c.get("posting_size") for c in plan["field_conditions"]}
+        assert sizes == {"engagementContextRole": 2, "address.country": 2, "age": None}
+
+    def test_indexed_list_changed_falls_back_to_scan(self, person_schema, sample_credentials):
+        """Test appending to or popping from an indexed list disables the index."""
+        engine = create_query_engine({"EPerson_Schema_SAID": person_schema})
+        credentials = sample_credentials[:2]
+        engine.index_credentials(credentials)
+
+        credentials.append(sample_credentials[2])
+        results = list(engine.query(credentials, {"engagementContextRole": "Engineer"}))
+        assert [r.said for r in results] == ["ECRED_ALICE_SAID", "ECRED_CHARLIE_SAID"]
+
+        credentials.pop()
+        credentials.pop()
+        results = list(engine.query(credentials, {"engagementContextRole": "Engineer"}))
+        assert [r.said for r in results] == ["ECRED_ALICE_SAID"]
+
+    def test_indexed_credential_replaced_falls_back_to_scan(
+        self, person_schema, sample_credentials
+    ):
+        """Test replacing a credential at the same length disables the index."""
+        engine = create_query_engine({"EPerson_Schema_SAID": person_schema})
+        credentials = list(sample_credentials)
+        engine.index_credentials(credentials)
+
+        credentials[1] = sample_credentials[0]
+        results = list(engine.query(credentials, {"engagementContextRole": "Engineer"}))
+        assert [r.said for r in results] == [
+            "ECRED_ALICE_SAID", "ECRED_ALICE_SAID", "ECRED_CHARLIE_SAID",
+        ]
+
+        credentials.pop()
+        credentials.append(sample_credentials[1])
+        results = list(engine.query(credentials, {"engagementContextRole": "Engineer"}))
+        assert [r.said for r in results] == ["ECRED_ALICE_SAID", "ECRED_ALICE_SAID"]
+
+    def test_query_result_slug_is_lazy(self, person_schema, monkeypatch):
+        """Test slugs are generated on first access, not per match."""
+        import kgql.indexer.query_engine as query_engine
+
+        calls = []
+
+        def fake_slug(text, max_words=3):
+            calls.append(text)
+            return "audit-report"
+
+        monkeypatch.setattr(query_engine, "generate_semantic_slug", fake_slug)
+        engine = create_query_engine({"EPerson_Schema_SAID": person_schema})
+        cred = {"d": "ECRED_REPORT_SAID", "a": {"title": "Audit Report", "age": 1}}
+
+        results = list(engine.query([cred], {"age": 1}))
+        assert calls == []
+        assert results[0].slug is None
+
+        assert results[0].display_slug() == "audit-report"
+        assert results[0].display_id() == "ECRED_REPORT... (audit-report)"
+        assert results[0].slug == "audit-report"
+        assert len(calls) == 1
+
+    def test_query_result_explicit_slug(self):
+        """Test a slug passed to QueryResult is a plain, uncompared field."""
+        from dataclasses import asdict, fields
+        from kgql.indexer import QueryResult
+
+        cred = {"d": "ECRED_SAID", "a": {"title": "Audit Report"}}
+        result = QueryResult(cred, "ESCHEMA", "EISSUER", "ECRED_SAID", slug="given")
+        assert result.display_slug() == "given"
+        assert result == QueryResult(cred, "ESCHEMA", "EISSUER", "ECRED_SAID")
+        assert "slug='given'" in repr(result)
+        assert "slug" in [f.name for f in fields(result)]
+        assert asdict(result)["slug"] == "given"
+
+        unnamed = QueryResult(cred, "ESCHEMA", "EISSUER", "ECRED_SAID")
+        assert unnamed.slug == ""
+        assert unnamed.display_id() == "ECRED_SAID..."
+
+    def test_slug_source_skips_missing_fields(self):
+        """Test slug source text joins only present attribute fields."""
+        from kgql.indexer.query_engine import _slug_source
+
+        assert _slug_source({"age": 30}) == ""
+        assert _slug_source({"type": 7, "title": "Audit", "name": ""}) == "Audit 7"
+
 
 class TestQueryEngineEdgeCases:
     """Edge case tests for QueryEngine."""
@@ -574,3 +731,16 @@ class TestQueryEngineEdgeCases:
         # Should match Alice Smith
         assert len(results) == 1
         assert results[0].said == "ECRED_ALICE_SAID"
+
+    def test_nested_path_through_scalar(self, person_schema, sample_credentials):
+        """Test a dotted path that crosses a non-object value matches nothing."""
+        engine = create_query_engine({"EPerson_Schema_SAID": person_schema})
+
+        results = list(engine.query(
+            sample_credentials,
+            {"personLegalName.first": "Alice"},
+        ))
+
+        assert len(results) == 0
+        assert engine._get_field_value({"a": {"b": 1}}, "a.b") == 1
+        assert engine._get_field_value({"a": "x"}, "a.b") is None
@@ -101,6 +101,160 @@ class TestKGQLIntegration:
 
         assert len(result) <= 2
 
+    def test_scan_stops_after_limit(self, kgql, mock_rgy):
+        """Test that a full scan stops pulling credentials once LIMIT is exceeded."""
+        pulled = []
+
+        def cred_iter():
+            for i in range(100):
+                creder = Mock(spec=["said", "issuer", "attrib", "schema"])
+                creder.said = f"ESAID_{i}"
+                creder.issuer = "EAID"
+                creder.attrib = {"topic": "governance"}
+                creder.schema = "ESchema"
+                pulled.append(creder.said)
+                yield ((creder.said,), creder)
+
+        mock_rgy.reger.creds.getItemIter.return_value = cred_iter()
+
+        result = kgql.query("MATCH (c:Credential) LIMIT 2")
+
+        assert result.collect_saids() == ["ESAID_0", "ESAID_1"]
+        assert result.has_more is True
+        assert len(pulled) == 3
+
+    def test_index_seek_pulls_only_past_limit(self, kgql, mock_rgy):
+        """Test that index results are consumed lazily up to LIMIT + 1."""
+        pulled = []
+
+        def saider_iter(keys):
+            for i in range(100):
+                pulled.append(i)
+                yield Mock(qb64=f"ESAID_{i}")
+
+        mock_rgy.reger.issus.getIter = saider_iter
+
+        result = kgql.query("MATCH (c:Credential) WHERE c.issuer = 'EAID' LIMIT 3")
+
+        assert result.collect_saids() == ["ESAID_0", "ESAID_1", "ESAID_2"]
+        assert result.has_more is True
+        assert len(pulled) == 4
+
+    def test_filter_predicate_cached_on_plan(self, kgql):
+        """Test that a filter is compiled once per plan and reused."""
+        plan = kgql.plan(kgql.parse("MATCH (c:Credential) WHERE c.topic = 'governance'"))
+        filter_dict = plan.steps[0].args["filter"]
+
+        first = kgql._filter_predicate(filter_dict, plan)
+        second = kgql._filter_predicate(filter_dict, plan)
+
+        assert first is second
+        assert len(plan.compiled_filters) == 1
+
+    def test_filter_predicate_shared_across_threads(self, kgql):
+        """Test concurrent steps on one plan all get the same compiled filter."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        plan = kgql.plan(kgql.parse("MATCH (c:Credential) WHERE c.topic = 'governance'"))
+        filter_dict = plan.steps[0].args["filter"]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            predicates = list(pool.map(
+                lambda _: kgql._filter_predicate(filter_dict, plan), range(64)
+            ))
+
+        assert all(predicate is predicates[0] for predicate in predicates)
+        assert len(plan.compiled_filters) == 1
+
+    def test_compiled_filter_reads_attributes_and_data(self):
+        """Test compiled accessors use attributes first and attribute data otherwise."""
+        from kgql.wrappers.reger_wrapper import CredentialResult
+        from kgql.api.kgql import _compile_filter
+
+        matches = _compile_filter({
+            "issuer": {"op": "=", "value": "EAID"},
+            "topic": {"op": "=", "value": "governance"},
+        })
+        creds = [
+            CredentialResult(said="E1", issuer="EAID", raw=Mock(attrib={"topic": "governance"})),
+            CredentialResult(said="E2", issuer="EAID", raw=Mock(attrib={"topic": "other"})),
+            CredentialResult(said="E3", issuer="EOTHER", raw=Mock(attrib={"topic": "governance"})),
+        ]
+
+        assert [c.said for c in creds if matches(c)] == ["E1"]
+
+    def test_index_seek_applies_residual_filter(self, kgql, mock_rgy):
+        """Test residual conditions filter the credentials found by an index seek."""
+        creds = {}
+        for said, topic in [("ESAID_A", "governance"), ("ESAID_B", "other")]:
+            creder = Mock(spec=["said", "issuer", "attrib", "schema"])
+            creder.said = said
+            creder.issuer = "EAID"
+            creder.attrib = {"topic": topic}
+            creder.schema = "ESchema"
+            creds[said] = creder
+        mock_rgy.reger.issus.getIter.return_value = [Mock(qb64=s) for s in creds]
+        mock_rgy.reger.creds.get.side_effect = lambda keys: creds.get(keys)
+
+        result = kgql.query(
+            "MATCH (c:Credential) WHERE c.issuer = 'EAID' AND c.topic = 'governance'"
+        )
+
+        mock_rgy.reger.issus.getIter.assert_called_once_with(keys="EAID")
+        mock_rgy.reger.creds.getItemIter.assert_not_called()
+        assert result.collect_saids() == ["ESAID_A"]
+
+    def test_seek_uses_most_selective_index(self, kgql, mock_rgy):
+        """Test that the access path with the fewest index entries is sought."""
+        mock_rgy.reger.issus.getIter.return_value = [Mock(qb64=f"E{i}") for i in range(50)]
+        mock_rgy.reger.schms.getIter.return_value = [Mock(qb64="E7")]
+        kgql._apply_index_filters = Mock(wraps=kgql._apply_index_filters)
+
+        result = kgql.query(
+            "MATCH (c:Credential) WHERE c.issuer = $aid AND c.schema = $schema",
+            variables={"aid": "EAID", "schema": "ESchema"},
+        )
+
+        # The schema seek ran; the issuer condition was left as the residual
+        _, residual = kgql._apply_index_filters.call_args.args
+        assert list(residual) == ["issuer"]
+        assert result.collect_saids() == ["E7"]
+
+    def test_indexed_residual_filtered_by_set_membership(self, kgql, mock_rgy):
+        """Test an indexed residual condition narrows a seek without loading credentials."""
+        mock_rgy.reger.issus.getIter.return_value = [Mock(qb64=f"E{i}") for i in range(5)]
+        mock_rgy.reger.schms.getIter.return_value = [Mock(qb64="E3"), Mock(qb64="EOTHER")]
+        kgql._catalog.pick_best = lambda paths: paths[0]  # force the issuer seek
+
+        result = kgql.query(
+            "MATCH (c:Credential) WHERE c.issuer = 'EAID' AND c.schema = 'ESchema'"
+        )
+
+        assert result.collect_saids() == ["E3"]
+        mock_rgy.reger.creds.get.assert_not_called()
+
+    def test_compiled_filter_operators(self):
+        """Test compiled filter predicates honour operators and negation."""
+        from kgql.api.kgql import _compile_filter
+
+        cred = Mock(spec=["issuer", "data"])
+        cred.issuer = "EAID"
+        cred.data = {"topic": "governance", "level": 3}
+
+        assert _compile_filter({
+            "issuer": {"op": "=", "value": "EAID"},
+            "topic": {"op": "LIKE", "value": "govern"},
+            "level": {"op": ">=", "value": 2},
+        })(cred)
+        assert not _compile_filter({
+            "level": {"op": "IN", "value": [3, 4], "negated": True},
+        })(cred)
+        assert _compile_filter({
+            "level": {"op": "IN", "value": [5], "negated": True},
+        })(cred)
+        assert _compile_filter({"topic": {"op": "CONTAINS", "value": "gov"}})(cred) is True
+        assert _compile_filter({"issuer": {"op": "BOGUS", "value": "EAID"}})(cred) is False
+
     # --- Convenience method tests ---
 
     def test_by_issuer_method(self, kgql, mock_rgy):
@@ -117,6 +271,30 @@ class TestKGQLIntegration:
         assert isinstance(result, QueryResult)
         mock_rgy.reger.subjs.getIter.assert_called()
 
+    def test_by_schema_method(self, kgql, mock_rgy):
+        """Test the by_schema convenience method."""
+        result = kgql.by_schema("ESchemaSAID")
+
+        assert result.collect_saids() == ["ESAID_CRED_1"]
+        mock_rgy.reger.schms.getIter.assert_called_once_with(keys="ESchemaSAID")
+
+    def test_convenience_methods_skip_query_pipeline(self, kgql, mock_rgy):
+        """Test index lookups and resolve call the wrapper without parsing."""
+        kgql._parser.parse = Mock()
+        creder = Mock(spec=["said", "issuer", "attrib", "schema"])
+        creder.said = "ESAID_CRED_1"
+        creder.issuer = "EAID"
+        creder.attrib = {}
+        creder.schema = "ESchema"
+        mock_rgy.reger.creds.get.return_value = creder
+
+        assert kgql.by_issuer("EAID").count == 1
+        item = kgql.resolve("ESAID_CRED_1")
+
+        assert item.said == "ESAID_CRED_1"
+        assert item.data == {"raw": creder}
+        kgql._parser.parse.assert_not_called()
+
     def test_resolve_method(self, kgql):
         """Test the resolve convenience method."""
         result = kgql.resolve("ESAID_TEST")
@@ -140,6 +318,242 @@ class TestKGQLIntegration:
 
         assert len(plan.steps) >= 1
 
+    # --- Plan cache tests ---
+
+    def test_repeated_query_reuses_plan(self, kgql, mock_rgy):
+        """Test that the same query string is parsed and planned only once."""
+        kgql._parser.parse = Mock(wraps=kgql._parser.parse)
+
+        query = "MATCH (c:Credential) WHERE c.issuer = $aid"
+        kgql.query(query, variables={"aid": "EAID_ONE"})
+        kgql.query(query, variables={"aid": "EAID_TWO"})
+
+        assert kgql._parser.parse.call_count == 1
+        mock_rgy.reger.issus.getIter.assert_called_with(keys="EAID_TWO")
+
+    def test_plan_cache_evicts_oldest(self, mock_hby, mock_rgy):
+        """Test that the plan cache is bounded."""
+        kgql = KGQL(hby=mock_hby, rgy=mock_rgy, plan_cache_size=1)
+
+        kgql.query("MATCH (c:Credential) WHERE c.issuer = 'EAID'")
+        kgql.query("MATCH (c:Credential) WHERE c.subject = 'EAID'")
+
+        assert list(kgql._plan_cache) == ["MATCH (c:Credential) WHERE c.subject = 'EAID'"]
+
+    def test_repeated_resolve_hits_store_once(self, kgql, mock_rgy):
+        """Test that resolving the same SAID twice reads the store once."""
+        creder = Mock(spec=["said", "issuer", "attrib", "schema"])
+        creder.said = "ESAID_CACHED"
+        creder.issuer = "EAID"
+        creder.attrib = {}
+        creder.schema = "ESchema"
+        mock_rgy.reger.creds.get.return_value = creder
+
+        kgql.resolve("ESAID_CACHED")
+        kgql.resolve("ESAID_CACHED")
+
+        mock_rgy.reger.creds.get.assert_called_once_with(keys="ESAID_CACHED")
+
+    def test_parallel_plan_matches_serial(self, mock_hby, mock_rgy):
+        """Test that independent steps give the same rows with and without the pool."""
+        query = "MATCH (a:Credential), (b:Credential) WHERE a.issuer = 'EAID'"
+        mock_rgy.reger.issus.getIter.return_value = [Mock(qb64="ESAID_A")]
+
+        parallel = KGQL(hby=mock_hby, rgy=mock_rgy, max_workers=2).query(query)
+        serial = KGQL(hby=mock_hby, rgy=mock_rgy, max_workers=0).query(query)
+
+        assert parallel.collect_saids() == serial.collect_saids() == ["ESAID_A"]
+
+    def test_step_pool_started_lazily_and_closed(self, mock_hby, mock_rgy):
+        """Test the thread pool exists only after a parallel plan, until close()."""
+        query = "MATCH (a:Credential), (b:Credential) WHERE a.issuer = 'EAID'"
+
+        with KGQL(hby=mock_hby, rgy=mock_rgy, max_workers=2) as kgql:
+            kgql.query("MATCH (c:Credential) WHERE c.issuer = 'EAID'")
+            assert kgql._pool is None
+
+            kgql.query(query)
+            pool = kgql._pool
+            assert pool is not None
+
+        assert kgql._pool is None
+        assert pool._shutdown
+
+    def test_step_dispatch_table(self, kgql):
+        """Test that steps are dispatched through the method-type table."""
+        from kgql.translator import MethodType
+
+        cred = Mock(spec=["said"])
+        cred.said = "ESAID_FROM_HANDLER"
+        handler = Mock(return_value=cred)
+        kgql._dispatch[MethodType.REGER_CLONE] = handler
+
+        result = kgql.query("RESOLVE 'ESAID_X'")
+
+        step, args, ctx = handler.call_args.args
+        assert args["said"] == "ESAID_X"
+        assert ctx.plan.steps == [step]
+        assert result.collect_saids() == ["ESAID_FROM_HANDLER"]
+
+    def test_sources_carry_proofs_only_when_requested(self, kgql):
+        """Test that traversal emits bare creders unless WITH PROOF is set."""
+        from kgql.api.kgql import _ExecutionContext, _result_rows
+        from kgql.translator import ExecutionPlan, MethodType
+        from kgql.translator.planner import PlanStep
+
+        creder = Mock(said="ESAID_SOURCE")
+        kgql._reger_wrapper.traverse_sources = Mock(return_value=[(creder, "PROOF")])
+        step = PlanStep(
+            method_type=MethodType.REGER_SOURCES, method_name="sources", result_key="sources"
+        )
+
+        for include_proof, expected in ((False, creder), (True, (creder, "PROOF"))):
+            plan = ExecutionPlan(steps=[step], include_proof=include_proof)
+            ctx = _ExecutionContext(plan=plan, step_results={"start_cred": Mock(said="ESTART")})
+
+            rows = kgql._execute_sources(step, {}, ctx)
+            assert rows == [expected]
+
+            said, data, proof = next(_result_rows({"sources": rows}, plan))
+            assert (said, data["creder"]) == ("ESAID_SOURCE", creder)
+            assert proof == ("PROOF" if include_proof else None)
+
+    def test_sources_check_each_operator_once(self, kgql):
+        """Test that governance is checked once per distinct edge operator."""
+        from keri_governance.primitives import EdgeOperator
+        from kgql.api.kgql import _ExecutionContext
+        from kgql.translator import ExecutionPlan, MethodType
+        from kgql.translator.planner import PlanStep
+
+        def cred(said, op):
+            return Mock(said=said, raw={"e": {"acdc": {"o": op}}})
+
+        creders = [cred("E1", "I2I"), cred("E2", "I2I"), cred("E3", "DI2I"), cred("E4", "I2I")]
+        kgql._reger_wrapper.traverse_sources = Mock(return_value=[(c, None) for c in creders])
+        checker = Mock()
+        checker.check_edge.return_value = Mock(allowed=True)
+        step = PlanStep(
+            method_type=MethodType.REGER_SOURCES, method_name="sources", result_key="sources"
+        )
+        ctx = _ExecutionContext(
+            plan=ExecutionPlan(steps=[step]),
+            step_results={"start_cred": Mock(said="ESTART")},
+            checker=checker,
+        )
+
+        rows = kgql._execute_sources(step, {"edge_type": "acdc"}, ctx)
+
+        assert rows == creders
+        assert [c.args for c in checker.check_edge.call_args_list] == [
+            ("acdc", EdgeOperator.I2I),
+            ("acdc", EdgeOperator.DI2I),
+        ]
+
+    def test_sources_skip_checks_for_ungoverned_edges(self, kgql):
+        """Test that edges without framework rules are not checked per credential."""
+        from kgql.api.kgql import _ExecutionContext
+        from kgql.translator import ExecutionPlan, MethodType
+        from kgql.translator.planner import PlanStep
+
+        creders = [Mock(said="E1"), Mock(said="E2")]
+        kgql._reger_wrapper.traverse_sources = Mock(return_value=[(c, None) for c in creders])
+        checker = Mock()
+        checker.framework.get_rules_for.return_value = []
+        step = PlanStep(
+            method_type=MethodType.REGER_SOURCES, method_name="sources", result_key="sources"
+        )
+        ctx = _ExecutionContext(
+            plan=ExecutionPlan(steps=[step]),
+            enforce_governance=True,
+            step_results={"start_cred": Mock(said="ESTART")},
+            checker=checker,
+        )
+
+        assert kgql._execute_sources(step, {"edge_type": "iss"}, ctx) == creders
+        checker.framework.get_rules_for.assert_called_once_with("iss")
+        checker.check_edge.assert_not_called()
+
+    def test_extract_edge_operator_credential_shapes(self, kgql):
+        """Test operator extraction from creders, old serders, dicts and others."""
+        from types import SimpleNamespace
+        from keri_governance.primitives import EdgeOperator
+        from kgql.api.kgql import _credential_data_reader
+
+        data = {"e": {"acdc": {"o": "DI2I"}}}
+        for cred in (SimpleNamespace(raw=data), SimpleNamespace(crd=data), data):
+            assert kgql._extract_edge_operator(cred, "acdc") == EdgeOperator.DI2I
+            read = _credential_data_reader(cred)
+            assert kgql._extract_edge_operator(cred, "acdc", read) == EdgeOperator.DI2I
+
+        assert kgql._extract_edge_operator(object(), "acdc") == EdgeOperator.ANY
+        assert kgql._extract_edge_operator({"e": {"acdc": {"o": "BOGUS"}}}, "acdc") == EdgeOperator.ANY
+
+    def test_framework_checker_reused_across_queries(self, kgql, monkeypatch):
+        """Test that a framework's ConstraintChecker is built once and reused."""
+        import kgql.api.kgql as kgql_module
+        from kgql.api.kgql import _ExecutionContext
+        from kgql.translator import ExecutionPlan, MethodType
+        from kgql.translator.planner import PlanStep
+
+        framework = Mock(said="EFRAMEWORK")
+        kgql._framework_resolver = Mock(resolve=Mock(return_value=framework))
+        make_checker = Mock(side_effect=lambda fw: Mock(framework=fw))
+        monkeypatch.setattr(kgql_module, "ConstraintChecker", make_checker)
+        step = PlanStep(
+            method_type=MethodType.FRAMEWORK_LOAD, method_name="load", result_key="checker"
+        )
+
+        checkers = []
+        for _ in range(3):
+            ctx = _ExecutionContext(plan=ExecutionPlan(steps=[step]))
+            checkers.append(kgql._execute_framework_load(step, {"framework_said": "EFRAMEWORK"}, ctx))
+            assert ctx.checker is checkers[-1]
+
+        assert checkers[0] is checkers[1] is checkers[2]
+        make_checker.assert_called_once_with(framework)
+
+        # A different framework object for the SAID gets a fresh checker
+        kgql._framework_resolver.resolve.return_value = Mock(said="EFRAMEWORK")
+        ctx = _ExecutionContext(plan=ExecutionPlan(steps=[step]))
+        assert kgql._execute_framework_load(step, {"framework_said": "EFRAMEWORK"}, ctx) is not checkers[0]
+
+    # --- Hot query specialization tests ---
+
+    def test_hot_query_is_specialized(self, mock_hby, mock_rgy):
+        """Test that a frequently run index query switches to a direct fast path."""
+        kgql = KGQL(hby=mock_hby, rgy=mock_rgy, specialize_after=2)
+        query = "MATCH (c:Credential) WHERE c.issuer = $aid"
+
+        kgql.query(query, variables={"aid": "EAID_ONE"})
+        kgql.query(query, variables={"aid": "EAID_TWO"})
+        kgql._execute = Mock(side_effect=AssertionError("generic path used"))
+
+        result = kgql.query(query, variables={"aid": "EAID_THREE"})
+
+        assert result.collect_saids() == ["ESAID_CRED_1"]
+        mock_rgy.reger.issus.getIter.assert_called_with(keys="EAID_THREE")
+
+    def test_filtered_query_not_specialized(self, mock_hby, mock_rgy):
+        """Test that queries with residual filters keep the generic executor."""
+        kgql = KGQL(hby=mock_hby, rgy=mock_rgy, specialize_after=1)
+
+        kgql.query("MATCH (c:Credential) WHERE c.issuer = 'EAID' AND c.topic = 'x'")
+
+        assert kgql._specialized == {}
+
+    def test_get_hot_queries(self, kgql):
+        """Test that execution counts are reported most-executed first."""
+        kgql.query("RESOLVE 'ESAID_A'")
+        kgql.query("VERIFY 'ESAID_A'")
+        kgql.query("VERIFY 'ESAID_A'")
+
+        hot = kgql.get_hot_queries()
+
+        assert [(q, n) for q, n, _ in hot] == [
+            ("VERIFY 'ESAID_A'", 2),
+            ("RESOLVE 'ESAID_A'", 1),
+        ]
+
     # --- Deck integration tests ---
 
     def test_deck_available(self, kgql):
@@ -205,6 +619,41 @@ class TestQueryResult:
         saids = result.collect_saids()
         assert saids == ["ESAID_1", "ESAID_2"]
 
+    def test_from_columns_materializes_lazily(self):
+        """Test column-wise results only build items when asked for them."""
+        result = QueryResult.from_columns(
+            ["ESAID_1", "ESAID_2"], data=[None, {"issuer": "EAID"}]
+        )
+
+        assert result.collect_saids() == ["ESAID_1", "ESAID_2"]
+        assert len(result) == 2 and result.count == 2
+        assert result._items is None
+        assert [item.data for item in result] == [{}, {"issuer": "EAID"}]
+
+        result.items.append(QueryResultItem(said="ESAID_3"))
+        assert result.collect_saids() == ["ESAID_1", "ESAID_2", "ESAID_3"]
+
+    def test_equality_and_repr_over_items(self):
+        """Test results compare and print by items, however they are stored."""
+        columns = QueryResult.from_columns(["ESAID_1"], data=[{"issuer": "EAID"}])
+        items = QueryResult(
+            items=[QueryResultItem(said="ESAID_1", data={"issuer": "EAID"})], count=1
+        )
+
+        assert columns == items
+        assert columns._items is None
+        assert columns != QueryResult.from_columns(["ESAID_2"])
+        assert repr(columns) == repr(items)
+        assert repr(items).startswith("QueryResult(items=[QueryResultItem(said='ESAID_1'")
+
+    def test_slots_no_instance_dict(self):
+        """Test result objects use __slots__ instead of a per-instance dict."""
+        item = QueryResultItem(said="ESAID_1")
+        result = QueryResult(items=[item])
+
+        assert not hasattr(item, "__dict__")
+        assert not hasattr(result, "__dict__")
+
 
 class TestEndToEnd:
     """End-to-end tests simulating real usage patterns."""
@@ -266,3 +715,47 @@ class TestEndToEnd:
 
         # Should find the session and turn credentials
         assert len(result) >= 1
+
+
+class TestRegerIndexes:
+    """Index queries against a real (temporary) keripy Reger."""
+
+    ISSUER = "EAID_ISSUER_REAL"
+    SCHEMA = "ESCHEMA_REAL"
+
+    @pytest.fixture
+    def reger(self):
+        """Create a temporary Reger with one credential indexed."""
+        from keri.core import coring
+        from keri.vdr.viring import Reger
+
+        reger = Reger(name="kgql-test", temp=True)
+        saider = coring.Saider(raw=b"\x01" * 32, code=coring.MtrDex.Blake3_256)
+        reger.issus.add(keys=self.ISSUER, val=saider)
+        reger.schms.add(keys=self.SCHEMA, val=saider)
+        yield reger
+        reger.close(clear=True)
+
+    @pytest.fixture
+    def kgql(self, reger):
+        """Create a KGQL instance over the real Reger."""
+        return KGQL(hby=Mock(), rgy=Mock(reger=reger))
+
+    def test_empty_or_unbound_key_paths_not_seeked(self, kgql):
+        """Test empty and unbound access path keys never reach LMDB."""
+        query = "MATCH (c:Credential) WHERE c.issuer = $aid AND c.schema = $s"
+
+        assert len(kgql.query(query, variables={"aid": self.ISSUER, "s": ""})) == 0
+        assert len(kgql.query(query, variables={"aid": self.ISSUER})) == 0
+        assert kgql._reger_wrapper.count("schms", "") == 0
+
+    def test_convenience_methods_empty_key(self, kgql):
+        """Test by_issuer/by_subject/by_schema return nothing for empty keys."""
+        assert kgql.by_issuer(self.ISSUER).collect_saids() == [
+            "EAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEB"
+        ]
+        for method in (kgql.by_issuer, kgql.by_subject, kgql.by_schema):
+            for key in ("", None):
+                result = method(key)
+                assert len(result) == 0
+                assert result.count == 0
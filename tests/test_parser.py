@@ -80,6 +80,13 @@ class TestKGQLParser:
         assert edge.edge_type == "has_turn"
         assert edge.operator == EdgeOperator.I2I
 
+    def test_edge_type_interned(self, parser):
+        """Test that parsed edge types are interned strings."""
+        first = parser.parse("MATCH (s:Session)-[:" + "has" + "_turn]->(t:Turn)")
+        second = parser.parse("MATCH (s:Session)-[:has_turn]->(t:Turn)")
+
+        assert first.match.patterns[0][1].edge_type is second.match.patterns[0][1].edge_type
+
     def test_parse_match_with_edge_operators(self, parser):
         """Test parsing different edge operators."""
         test_cases = [
@@ -5,6 +5,7 @@ Tests the translation of KGQL AST to keripy method calls.
 """
 
 import pytest
+from unittest.mock import Mock
 
 from kgql.parser import parse
 from kgql.translator import QueryPlanner, ExecutionPlan, MethodType
@@ -52,6 +53,76 @@ class TestQueryPlanner:
         assert step.method_type == MethodType.REGER_INDEX
         assert step.args.get("index") == "schms"
 
+    def test_plan_pushes_down_equality_with_residual_filter(self, planner):
+        """Test indexed equality becomes a seek and other conditions a filter."""
+        query = parse(
+            "MATCH (c:Credential) WHERE c.topic = 'governance' AND c.issuer = 'EAID123'"
+        )
+        plan = planner.plan(query)
+
+        step = plan.steps[0]
+        assert step.args.get("index") == "issus"
+        assert step.args.get("keys") == "EAID123"
+        assert step.args.get("filter") == {
+            "topic": {"op": "=", "value": "governance", "negated": False},
+        }
+
+    def test_plan_offers_access_path_per_indexed_equality(self, planner):
+        """Test that each indexable equality is kept as a candidate access path."""
+        query = parse(
+            "MATCH (c:Credential) WHERE c.issuer = 'EAID123' AND c.schema = 'ESchema'"
+        )
+        plan = planner.plan(query)
+
+        paths = plan.steps[0].args.get("access_paths")
+        assert [p["index"] for p in paths] == ["issus", "schms"]
+        assert paths[0]["filter"] == {
+            "schema": {"op": "=", "value": "ESchema", "negated": False},
+        }
+        assert paths[1]["keys"] == "ESchema"
+
+    def test_conditions_stay_on_their_pattern_variable(self, planner):
+        """Test a condition on one node never seeks or filters another node."""
+        query = parse(
+            "MATCH (a:Credential)-[:acdc]->(b:Credential) "
+            "WHERE a.issuer = 'EISS' AND b.schema = 'ESCH'"
+        )
+        plan = planner.plan(query)
+
+        seeks = [step.args for step in plan.steps if step.args.get("index")]
+        assert seeks[0] == {"index": "issus", "keys": "EISS"}
+        assert all(args.get("index") != "schms" for args in seeks)
+
+    def test_filter_orders_most_selective_first(self, planner):
+        """Test residual filter conditions are ordered by estimated selectivity."""
+        query = parse(
+            "MATCH (c:Credential) WHERE c.status != 'revoked' AND c.level > 2 "
+            "AND c.topic = 'governance'"
+        )
+        plan = planner.plan(query)
+
+        assert list(plan.steps[0].args["filter"]) == ["topic", "level", "status"]
+
+    def test_filter_repeated_field_keeps_source_order(self, planner):
+        """Test reordering does not change which condition on a field applies."""
+        query = parse(
+            "MATCH (c:Credential) WHERE c.status != 'x' AND c.status = 'y'"
+        )
+        plan = planner.plan(query)
+
+        assert plan.steps[0].args["filter"] == {
+            "status": {"op": "=", "value": "y", "negated": False},
+        }
+
+    def test_plan_does_not_push_down_inequality(self, planner):
+        """Test that a non-equality on an indexed field falls back to a scan."""
+        query = parse("MATCH (c:Credential) WHERE c.issuer != 'EAID123'")
+        plan = planner.plan(query)
+
+        step = plan.steps[0]
+        assert step.args.get("index") == "creds"
+        assert "issuer" in step.args.get("filter")
+
     def test_plan_match_with_edge_adds_verification(self, planner):
         """Test that edge operator adds verification step."""
         query = parse("MATCH (s:Session)-[:has_turn @I2I]->(t:Turn)")
@@ -155,6 +226,28 @@ class TestQueryPlanner:
         assert plan.order_by == "c.created"
         assert plan.order_direction == "DESC"
 
+    def test_plan_steps_declare_result_shape(self, planner):
+        """Test that each step declares the shape of its output."""
+        from kgql.translator import ResultShape
+
+        index_plan = planner.plan(parse("MATCH (c:Credential) WHERE c.issuer = 'EAID'"))
+        traverse_plan = planner.plan(parse("TRAVERSE FROM 'ESAID123' FOLLOW edge"))
+
+        assert index_plan.steps[0].result_shape == ResultShape.SAIDS
+        assert [s.result_shape for s in traverse_plan.steps] == [
+            ResultShape.CRED, ResultShape.PAIRS,
+        ]
+
+    def test_plan_parallel_safe(self, planner):
+        """Test that only plans of independent steps are marked parallel-safe."""
+        multi = planner.plan(parse(
+            "MATCH (a:Credential), (b:Credential) WHERE a.issuer = 'EAID'"
+        ))
+        traverse = planner.plan(parse("TRAVERSE FROM 'ESAID123' FOLLOW edge"))
+
+        assert multi.parallel_safe is True
+        assert traverse.parallel_safe is False
+
     def test_plan_with_proof(self, planner):
         """Test that WITH PROOF is captured in plan."""
         query = parse("MATCH (c:Credential) WITH PROOF")
@@ -210,3 +303,126 @@ class TestExecutionPlan:
         plan.add_step(step2)
 
         assert plan.steps[1].depends_on == [0]
+
+
+class TestPlanBinding:
+    """Tests for ExecutionPlan.bind."""
+
+    @pytest.fixture
+    def planner(self):
+        """Create a planner instance."""
+        return QueryPlanner()
+
+    def test_bind_substitutes_variables(self, planner):
+        """Test that $variables are replaced, including inside filters."""
+        plan = planner.plan(parse(
+            "MATCH (c:Credential) WHERE c.issuer = $aid AND c.topic = $topic"
+        ))
+
+        bound = plan.bind({"aid": "EAID123", "topic": "governance"})
+
+        assert bound.steps[0].args["keys"] == "EAID123"
+        assert bound.steps[0].args["filter"]["topic"]["value"] == "governance"
+        # The cached plan is left untouched
+        assert plan.steps[0].args["keys"] == "$aid"
+
+    def test_bind_without_variables_returns_same_plan(self, planner):
+        """Test that a literal-only plan is reused as-is."""
+        plan = planner.plan(parse("MATCH (c:Credential) WHERE c.issuer = 'EAID123'"))
+
+        assert plan.bind({"aid": "EAID999"}) is plan
+        assert plan.has_variables is False
+
+
+class TestCatalog:
+    """Tests for the index cardinality Catalog."""
+
+    def test_estimate_cached_within_ttl(self):
+        """Test that counts are sampled once per TTL window."""
+        from kgql.translator import Catalog
+
+        now = [0.0]
+        counter = Mock(return_value=7)
+        catalog = Catalog(counter, ttl=10.0, clock=lambda: now[0])
+
+        assert catalog.estimate("issus", "EAID") == 7
+        assert catalog.estimate("issus", "EAID") == 7
+        assert counter.call_count == 1
+
+        now[0] = 11.0
+        catalog.estimate("issus", "EAID")
+        assert counter.call_count == 2
+
+    def test_pick_best_prefers_smallest(self):
+        """Test that the path with the lowest estimate is chosen."""
+        from kgql.translator import Catalog
+
+        sizes = {"issus": 100, "schms": 3}
+        catalog = Catalog(lambda index, key, limit: sizes[index])
+
+        best = catalog.pick_best([
+            {"index": "issus", "keys": "EAID"},
+            {"index": "schms", "keys": "ESchema"},
+        ])
+
+        assert best["index"] == "schms"
+
+    def test_pick_best_counts_no_further_than_best(self):
+        """Test later candidates are counted only up to the best so far."""
+        from kgql.translator import Catalog
+
+        sizes = {"schms": 3, "issus": 1_000_000}
+        limits = []
+
+        def counter(index, key, limit):
+            limits.append(limit)
+            return sizes[index] if limit is None else min(sizes[index], limit)
+
+        catalog = Catalog(counter)
+        best = catalog.pick_best([
+            {"index": "schms", "keys": "ESchema"},
+            {"index": "issus", "keys": "EAID"},
+        ])
+
+        assert best["index"] == "schms"
+        assert limits == [None, 3]
+
+        # A capped count is a lower bound: an exact count is taken when needed
+        assert catalog.estimate("issus", "EAID", 2) == 3
+        assert catalog.estimate("issus", "EAID") == 1_000_000
+        assert limits == [None, 3, None]
+
+    def test_estimate_cache_bounded(self):
+        """Test that sampled counts are evicted least recently used first."""
+        from kgql.translator import Catalog
+
+        counter = Mock(return_value=1)
+        catalog = Catalog(counter, max_entries=2)
+
+        catalog.estimate("issus", "A")
+        catalog.estimate("issus", "B")
+        catalog.estimate("issus", "A")
+        catalog.estimate("issus", "C")  # Evicts B
+
+        assert len(catalog._counts) == 2
+        catalog.estimate("issus", "A")
+        assert counter.call_count == 3
+        catalog.estimate("issus", "B")
+        assert counter.call_count == 4
+
+    def test_estimate_thread_safe(self):
+        """Test concurrent estimates with constant eviction never fail."""
+        from concurrent.futures import ThreadPoolExecutor
+        from kgql.translator import Catalog
+
+        catalog = Catalog(lambda index, key, limit: len(key), max_entries=4)
+
+        def hammer(worker):
+            return [catalog.estimate("issus", "K" * ((worker + i) % 8)) for i in range(2000)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(hammer, range(8)))
+
+        assert all(rows == [len("K" * ((w + i) % 8)) for i in range(2000)]
+                   for w, rows in enumerate(results))
+        assert len(catalog._counts) <= 4
@@ -79,6 +79,11 @@ class TestPathStep:
         step = PathStep("ROOT", "A", "iss", EdgeOperator.I2I, edge_ref=eref)
         assert step.edge_ref is eref
 
+    def test_slotted(self):
+        step = PathStep("ROOT", "A", "iss")
+        assert not hasattr(step, "__dict__")
+        assert not hasattr(VerifiedPath(steps=[step]), "__dict__")
+
 
 # ── VerifiedPath Tests ───────────────────────────────────────────────
 
@@ -285,6 +290,21 @@ class TestTrustPathAnalyzerFilters:
         assert path.depth == 2
         assert all(s.edge_type == "delegation" for s in path.steps)
 
+    def test_shortest_path_with_operator_filter(self):
+        """DI2I filter on BFS → ROOT->C->TARGET."""
+        analyzer = TrustPathAnalyzer(neighbor_fn=_neighbor_fn)
+        path = analyzer.shortest_path(
+            "ROOT", "TARGET", operator_filter=EdgeOperator.DI2I
+        )
+        assert path is not None
+        assert [s.target_said for s in path.steps] == ["C", "TARGET"]
+
+    def test_operator_filter_accepts_stronger_operators(self):
+        from kgql.trust_path.analyzer import _operators_satisfying
+
+        assert _operators_satisfying(EdgeOperator.DI2I) == {EdgeOperator.DI2I, EdgeOperator.I2I}
+        assert _operators_satisfying(EdgeOperator.ANY) == set(EdgeOperator)
+
 
 # ── Cycle Protection Tests ───────────────────────────────────────────
 
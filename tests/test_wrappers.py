@@ -71,6 +71,58 @@ class TestRegerWrapper:
 
         assert result is None
 
+    def test_resolve_is_cached(self, mock_reger):
+        """Test repeated resolve() of a SAID hits the store only once."""
+        creder = Mock(spec=["said", "issuer", "attrib", "schema"])
+        creder.said = "ESAID123"
+        creder.issuer = "EAID_ISSUER"
+        creder.attrib = {}
+        creder.schema = "ESchemaSAID"
+        mock_reger.creds.get.return_value = creder
+        wrapper = RegerWrapper(mock_reger)
+
+        first = wrapper.resolve("ESAID123")
+        second = wrapper.resolve("ESAID123")
+
+        assert first is second
+        mock_reger.creds.get.assert_called_once_with(keys="ESAID123")
+
+        wrapper.clear_cache()
+        wrapper.resolve("ESAID123")
+        assert mock_reger.creds.get.call_count == 2
+
+    def test_resolve_misses_not_cached(self, mock_reger):
+        """Test that a missing credential is looked up again next time."""
+        wrapper = RegerWrapper(mock_reger)
+
+        wrapper.resolve("ESAID_LATER")
+        wrapper.resolve("ESAID_LATER")
+
+        assert mock_reger.creds.get.call_count == 2
+
+    def test_iter_creds_uses_iterated_values(self, mock_reger):
+        """Test iter_creds builds results without a second creds.get()."""
+        creder = Mock(spec=["said", "issuer", "attrib", "schema"])
+        creder.said = "ESAID123"
+        creder.issuer = "EAID_ISSUER"
+        creder.attrib = {"i": "EAID_SUBJECT", "role": "admin"}
+        creder.schema = "ESchemaSAID"
+        mock_reger.creds.getItemIter.return_value = [(("ESAID123",), creder)]
+        wrapper = RegerWrapper(mock_reger)
+
+        results = list(wrapper.iter_creds())
+
+        assert [r.said for r in results] == ["ESAID123"]
+        assert results[0].data["role"] == "admin"
+        mock_reger.creds.get.assert_not_called()
+
+    def test_iter_creds_skips_unreadable(self, mock_reger):
+        """Test iter_creds skips values that cannot be deserialized."""
+        mock_reger.creds.getItemIter.return_value = [(("EBAD",), object())]
+        wrapper = RegerWrapper(mock_reger)
+
+        assert list(wrapper.iter_creds()) == []
+
     def test_count_by_issuer(self, mock_reger):
         """Test count_by_issuer counts results."""
         wrapper = RegerWrapper(mock_reger)
@@ -79,6 +131,22 @@ class TestRegerWrapper:
 
         assert count == 1
 
+    def test_count_stops_at_limit(self, mock_reger):
+        """Test count walks no more index entries than the limit."""
+        walked = []
+
+        def entries(keys):
+            for i in range(100):
+                walked.append(i)
+                yield Mock(qb64=f"ESAID_{i}")
+
+        mock_reger.issus.getIter = entries
+        wrapper = RegerWrapper(mock_reger)
+
+        assert wrapper.count("issus", "EAID123", limit=5) == 5
+        assert len(walked) == 5
+        assert wrapper.count("issus", "") == 0
+
     def test_direct_reger_access(self, mock_reger):
         """Test that underlying reger is accessible."""
         wrapper = RegerWrapper(mock_reger)